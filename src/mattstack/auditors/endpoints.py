@@ -102,18 +102,13 @@ class EndpointAuditor(BaseAuditor):
 
     def _check_duplicates(self, routes: list[Route]) -> None:
         """Find duplicate method+path combinations."""
-        counter: Counter[tuple[str, str]] = Counter()
         route_map: dict[tuple[str, str], list[Route]] = {}
-
         for r in routes:
-            key = (r.method, r.path)
-            counter[key] += 1
-            route_map.setdefault(key, []).append(r)
+            route_map.setdefault((r.method, r.path), []).append(r)
 
-        for key, count in counter.items():
+        for (method, path), dupes in route_map.items():
+            count = len(dupes)
             if count > 1:
-                method, path = key
-                dupes = route_map[key]
                 files = ", ".join(f"{self._rel(r.file)}:{r.line}" for r in dupes)
                 self.add_finding(
                     Severity.ERROR,
@@ -3,11 +3,12 @@
 from __future__ import annotations
 
 import contextlib
+import os
 import re
 from pathlib import Path
 
 from mattstack.auditors.base import AuditConfig, AuditFinding, AuditType, BaseAuditor, Severity
-from mattstack.parsers.utils import SKIP_DIRS
+from mattstack.parsers.utils import walk_project
 
 # Patterns to scan for, grouped by severity
 TODO_RE = re.compile(r"#\s*(TODO|FIXME|HACK|XXX)\b", re.IGNORECASE)
@@ -49,11 +50,11 @@ class CodeQualityAuditor(BaseAuditor):
 
     def _collect_files(self) -> list[Path]:
         """Collect all source files to scan."""
-        files: list[Path] = []
-        for ext in ALL_EXTS:
-            for f in self.config.project_path.rglob(f"*{ext}"):
-                if not any(p in f.parts for p in SKIP_DIRS):
-                    files.append(f)
+        files = [
+            Path(path)
+            for rel, path in walk_project(self.config.project_path)
+            if os.path.splitext(rel)[1] in ALL_EXTS
+        ]
         return sorted(files)
 
     def _scan_file(self, path: Path) -> None:
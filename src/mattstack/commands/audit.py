@@ -15,6 +15,7 @@ from mattstack.auditors.report import print_json, print_report, write_todo
 from mattstack.auditors.tests import CoverageAuditor
 from mattstack.auditors.types import TypeSafetyAuditor
 from mattstack.auditors.vulnerabilities import VulnerabilityAuditor
+from mattstack.parsers.utils import file_discovery_cache
 from mattstack.utils.console import console, print_error, print_info, print_success, print_warning
 
 SEVERITY_ORDER: dict[Severity, int] = {
@@ -99,34 +100,35 @@ def run_audit(
     report = AuditReport()
     auditor_instances: list[BaseAuditor] = []
 
-    # Run each applicable auditor
-    for audit_type, auditor_cls in AUDITOR_CLASSES.items():
-        if not config.should_run(audit_type):
-            continue
-
-        if not json_output:
-            print_info(f"Running {audit_type.value} audit...")
-
-        auditor = auditor_cls(config)
-        findings = auditor.run()
-        report.findings.extend(findings)
-        report.auditors_run.append(audit_type.value)
-        auditor_instances.append(auditor)
-
-        if not json_output and findings:
-            console.print(f"  Found {len(findings)} issues")
-
-    # Run plugins
-    from mattstack.auditors.plugins import discover_plugins
-
-    plugin_classes = discover_plugins(project_path)
-    for plugin_cls in plugin_classes:
-        if not json_output:
-            print_info(f"Running plugin: {plugin_cls.__name__}...")
-        auditor = plugin_cls(config)
-        findings = auditor.run()
-        report.findings.extend(findings)
-        report.auditors_run.append(f"plugin:{plugin_cls.__name__}")
+    # Run each applicable auditor; they share one file-discovery walk per pattern set
+    with file_discovery_cache():
+        for audit_type, auditor_cls in AUDITOR_CLASSES.items():
+            if not config.should_run(audit_type):
+                continue
+
+            if not json_output:
+                print_info(f"Running {audit_type.value} audit...")
+
+            auditor = auditor_cls(config)
+            findings = auditor.run()
+            report.findings.extend(findings)
+            report.auditors_run.append(audit_type.value)
+            auditor_instances.append(auditor)
+
+            if not json_output and findings:
+                console.print(f"  Found {len(findings)} issues")
+
+        # Run plugins
+        from mattstack.auditors.plugins import discover_plugins
+
+        plugin_classes = discover_plugins(project_path)
+        for plugin_cls in plugin_classes:
+            if not json_output:
+                print_info(f"Running plugin: {plugin_cls.__name__}...")
+            auditor = plugin_cls(config)
+            findings = auditor.run()
+            report.findings.extend(findings)
+            report.auditors_run.append(f"plugin:{plugin_cls.__name__}")
 
     # Filter findings by minimum severity
     if config.min_severity is not None:
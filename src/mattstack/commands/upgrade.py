@@ -33,7 +33,7 @@ NEXTJS_MARKERS = {"next.config.ts", "next.config.js", "next.config.mjs"}
 SKIP_FILES: set[str] = {"README.md", ".env", ".env.local", "CLAUDE.md"}
 
 # Directories to ignore when comparing file trees
-IGNORE_DIRS: set[str] = {".git", "__pycache__", "node_modules", ".venv", ".ruff_cache"}
+IGNORE_DIRS = frozenset({".git", "__pycache__", "node_modules", ".venv", ".ruff_cache"})
 
 
 @dataclass
@@ -220,7 +220,7 @@ def _compare_directories(source: Path, target: Path) -> tuple[list[str], list[st
         rel = src_file.relative_to(source)
 
         # Skip ignored directories
-        if any(part in IGNORE_DIRS for part in rel.parts):
+        if not IGNORE_DIRS.isdisjoint(rel.parts):
             continue
         # Skip user-customized files
         if rel.name in SKIP_FILES:
@@ -239,7 +239,7 @@ def _compare_directories(source: Path, target: Path) -> tuple[list[str], list[st
             continue
         rel = tgt_file.relative_to(target)
 
-        if any(part in IGNORE_DIRS for part in rel.parts):
+        if not IGNORE_DIRS.isdisjoint(rel.parts):
             continue
         if rel.name in SKIP_FILES:
             continue
@@ -5,6 +5,7 @@ from __future__ import annotations
 import re
 from dataclasses import dataclass
 from enum import Enum
+from functools import lru_cache
 from pathlib import Path
 
 
@@ -66,8 +67,12 @@ def normalize_name(name: str) -> str:
     return name.strip("-")
 
 
+@lru_cache(maxsize=64)
 def to_python_package(name: str) -> str:
-    """Convert project name to valid Python package name."""
+    """Convert project name to valid Python package name.
+
+    Cached because ``ProjectConfig.python_package_name`` calls it on every access.
+    """
     return normalize_name(name).replace("-", "_")
 
 
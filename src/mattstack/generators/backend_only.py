@@ -9,6 +9,7 @@ from mattstack.generators.base import BaseGenerator
 from mattstack.post_processors.b2b import print_b2b_instructions
 from mattstack.post_processors.customizer import customize_backend
 from mattstack.templates.cursorrules import generate_cursorrules
+from mattstack.templates.deploy import generate_deploy_files
 from mattstack.templates.docker_compose import generate_docker_compose
 from mattstack.templates.docker_compose_override import generate_docker_compose_override
 from mattstack.templates.docker_compose_prod import generate_docker_compose_prod
@@ -20,6 +21,19 @@ from mattstack.templates.root_makefile import generate_makefile
 from mattstack.templates.root_readme import generate_readme
 from mattstack.utils.console import print_error
 
+# Deploy targets that have a backend-only config
+BACKEND_DEPLOY_TARGETS = frozenset(
+    {
+        DeploymentTarget.RAILWAY,
+        DeploymentTarget.RENDER,
+        DeploymentTarget.FLY_IO,
+        DeploymentTarget.AWS,
+        DeploymentTarget.GCP,
+        DeploymentTarget.HETZNER,
+        DeploymentTarget.SELF_HOSTED,
+    }
+)
+
 
 class BackendOnlyGenerator(BaseGenerator):
     """Generate a backend-only project (Django API)."""
@@ -60,71 +74,8 @@ class BackendOnlyGenerator(BaseGenerator):
             self.write_file("tasks/todo.md", f"# {self.config.display_name} TODO\n")
 
             # Deployment configs
-            if self.config.deployment == DeploymentTarget.RAILWAY:
-                from mattstack.templates.deploy_railway import (
-                    generate_railway_json,
-                    generate_railway_toml,
-                )
-
-                self.write_file("railway.json", generate_railway_json(self.config))
-                self.write_file("railway.toml", generate_railway_toml(self.config))
-            elif self.config.deployment == DeploymentTarget.RENDER:
-                from mattstack.templates.deploy_render import generate_render_yaml
-
-                self.write_file("render.yaml", generate_render_yaml(self.config))
-            elif self.config.deployment == DeploymentTarget.FLY_IO:
-                from mattstack.templates.deploy_fly import generate_fly_toml
-
-                self.write_file("fly.toml", generate_fly_toml(self.config))
-            elif self.config.deployment == DeploymentTarget.AWS:
-                from mattstack.templates.deploy_aws import (
-                    generate_copilot_manifest,
-                    generate_ecs_task_definition,
-                )
-
-                self.write_file(
-                    "ecs-task-definition.json",
-                    generate_ecs_task_definition(self.config),
-                )
-                self.write_file(
-                    "copilot/api/manifest.yml",
-                    generate_copilot_manifest(self.config),
-                )
-            elif self.config.deployment == DeploymentTarget.GCP:
-                from mattstack.templates.deploy_gcp import (
-                    generate_app_engine_yaml,
-                    generate_cloud_run_yaml,
-                )
-
-                self.write_file("service.yaml", generate_cloud_run_yaml(self.config))
-                self.write_file("app.yaml", generate_app_engine_yaml(self.config))
-            elif self.config.deployment == DeploymentTarget.HETZNER:
-                from mattstack.templates.deploy_hetzner import (
-                    generate_caddyfile,
-                    generate_hetzner_compose,
-                )
-
-                self.write_file(
-                    "docker-compose.prod.yml",
-                    generate_hetzner_compose(self.config),
-                )
-                self.write_file("Caddyfile", generate_caddyfile(self.config))
-            elif self.config.deployment == DeploymentTarget.SELF_HOSTED:
-                from mattstack.templates.deploy_self_hosted import (
-                    generate_nginx_conf,
-                    generate_self_hosted_compose,
-                    generate_systemd_service,
-                )
-
-                self.write_file(
-                    "docker-compose.prod.yml",
-                    generate_self_hosted_compose(self.config),
-                )
-                self.write_file("nginx.conf", generate_nginx_conf(self.config))
-                self.write_file(
-                    f"{self.config.name}.service",
-                    generate_systemd_service(self.config),
-                )
+            for rel_path, content in generate_deploy_files(self.config, BACKEND_DEPLOY_TARGETS):
+                self.write_file(rel_path, content)
 
             return True
         except OSError as e:
@@ -31,6 +31,8 @@ class BaseGenerator(ABC):
     def __init__(self, config: ProjectConfig) -> None:
         self.config = config
         self.created_files: list[Path] = []
+        # Parent dirs already ensured by write_file, to skip repeat mkdir calls
+        self._ensured_dirs: set[Path] = set()
 
     def create_root_directory(self) -> bool:
         """Create the project root directory."""
@@ -85,7 +87,10 @@ class BaseGenerator(ABC):
             print_info(f"[dry-run] Would create {relative_path}")
             return
         file_path = self.config.path / relative_path
-        file_path.parent.mkdir(parents=True, exist_ok=True)
+        parent = file_path.parent
+        if parent not in self._ensured_dirs:
+            parent.mkdir(parents=True, exist_ok=True)
+            self._ensured_dirs.add(parent)
         file_path.write_text(content)
         self.created_files.append(file_path)
 
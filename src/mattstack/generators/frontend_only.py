@@ -8,12 +8,16 @@ from mattstack.config import DeploymentTarget
 from mattstack.generators.base import BaseGenerator
 from mattstack.post_processors.customizer import customize_frontend
 from mattstack.templates.cursorrules import generate_cursorrules
+from mattstack.templates.deploy import generate_deploy_files
 from mattstack.templates.pre_commit_config import generate_pre_commit_config
 from mattstack.templates.root_gitignore import generate_gitignore
 from mattstack.templates.root_makefile import generate_makefile
 from mattstack.templates.root_readme import generate_readme
 from mattstack.utils.console import print_error
 
+# Deploy targets with frontend-only configs
+FRONTEND_DEPLOY_TARGETS = frozenset({DeploymentTarget.FLY_IO, DeploymentTarget.CLOUDFLARE})
+
 
 class FrontendOnlyGenerator(BaseGenerator):
     """Generate a frontend-only project."""
@@ -42,14 +46,8 @@ class FrontendOnlyGenerator(BaseGenerator):
             self.write_file(".cursorrules", generate_cursorrules(self.config))
             self.write_file(".gitignore", generate_gitignore(self.config))
 
-            if self.config.deployment == DeploymentTarget.FLY_IO:
-                from mattstack.templates.deploy_fly import generate_fly_toml
-
-                self.write_file("fly.toml", generate_fly_toml(self.config))
-            elif self.config.deployment == DeploymentTarget.CLOUDFLARE:
-                from mattstack.templates.deploy_cloudflare import generate_wrangler_toml
-
-                self.write_file("wrangler.toml", generate_wrangler_toml(self.config))
+            for rel_path, content in generate_deploy_files(self.config, FRONTEND_DEPLOY_TARGETS):
+                self.write_file(rel_path, content)
 
             return True
         except OSError as e:
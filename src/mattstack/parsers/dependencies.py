@@ -7,10 +7,10 @@ import re
 from dataclasses import dataclass, field
 from pathlib import Path
 
-from mattstack.parsers.utils import SKIP_DIRS
+from mattstack.parsers.utils import cached_parse, find_files
 
 
-@dataclass
+@dataclass(slots=True)
 class Dependency:
     name: str
     version_constraint: str
@@ -19,7 +19,7 @@ class Dependency:
     dev: bool = False
 
 
-@dataclass
+@dataclass(slots=True)
 class DependencyManifest:
     file: Path
     dependencies: list[Dependency] = field(default_factory=list)
@@ -42,15 +42,22 @@ def _extract_list_block(text: str, start: int) -> tuple[str, int]:
     bracket_pos = text.find("[", start)
     if bracket_pos == -1:
         return "", start
-    depth = 0
-    for i in range(bracket_pos, len(text)):
-        if text[i] == "[":
+    depth = 1
+    i = bracket_pos
+    while True:
+        # Jump between bracket characters instead of stepping char by char
+        close_pos = text.find("]", i + 1)
+        if close_pos == -1:
+            return text[bracket_pos + 1 :], bracket_pos
+        open_next = text.find("[", i + 1, close_pos)
+        if open_next != -1:
             depth += 1
-        elif text[i] == "]":
-            depth -= 1
-            if depth == 0:
-                return text[bracket_pos + 1 : i], bracket_pos
-    return text[bracket_pos + 1 :], bracket_pos
+            i = open_next
+            continue
+        depth -= 1
+        if depth == 0:
+            return text[bracket_pos + 1 : close_pos], bracket_pos
+        i = close_pos
 
 
 def _get_section_text(text: str, section_match: re.Match) -> str:  # type: ignore[type-arg]
@@ -131,6 +138,7 @@ def _parse_deps_from_section(
     return deps
 
 
+@cached_parse
 def parse_pyproject_toml(path: Path) -> DependencyManifest:
     """Parse pyproject.toml for dependencies (regex-based, no toml lib)."""
     text = path.read_text(encoding="utf-8", errors="replace")
@@ -182,6 +190,7 @@ def parse_pyproject_toml(path: Path) -> DependencyManifest:
     return manifest
 
 
+@cached_parse
 def parse_package_json(path: Path) -> DependencyManifest:
     """Parse package.json for dependencies."""
     text = path.read_text(encoding="utf-8", errors="replace")
@@ -235,29 +244,12 @@ def parse_package_json(path: Path) -> DependencyManifest:
 
 def find_dependency_files(project_path: Path) -> list[Path]:
     """Find pyproject.toml and package.json files up to 2 levels deep."""
-    results: list[Path] = []
-    seen: set[Path] = set()
-
-    # Check root
-    for name in ("pyproject.toml", "package.json"):
-        candidate = project_path / name
-        if candidate.is_file() and candidate not in seen:
-            seen.add(candidate)
-            results.append(candidate)
-
-    # Check 1 and 2 levels deep
-    for pattern in (
+    patterns = [
+        "pyproject.toml",
+        "package.json",
         "*/pyproject.toml",
         "*/package.json",
         "*/*/pyproject.toml",
         "*/*/package.json",
-    ):
-        for f in project_path.glob(pattern):
-            if f in seen:
-                continue
-            if any(p in f.parts for p in SKIP_DIRS):
-                continue
-            seen.add(f)
-            results.append(f)
-
-    return sorted(results)
+    ]
+    return find_files(project_path, patterns)
@@ -3,11 +3,14 @@
 from __future__ import annotations
 
 import re
+from bisect import bisect_left
 from dataclasses import dataclass
 from pathlib import Path
 
+from mattstack.parsers.utils import cached_parse, line_number, line_offsets, read_source
 
-@dataclass
+
+@dataclass(slots=True)
 class Route:
     method: str  # GET, POST, PUT, DELETE, PATCH
     path: str
@@ -20,19 +23,19 @@ class Route:
 
 # Patterns for django-ninja decorators:
 # @router.get("/path"), @api.post("/path"), @http_get("/path")
+# Method names are lowercase in django-ninja, so no case folding is needed.
+# The auth lookup stays inside the decorator's arguments ([^)] also spans newlines).
 ROUTE_RE = re.compile(
     r"@(?:\w+)\.(get|post|put|delete|patch)\s*\(\s*['\"]([^'\"]+)['\"]"
-    r"(?:.*?auth\s*=\s*(\w+))?"
+    r"(?:[^)]*?auth\s*=\s*(\w+))?"
     r"[^)]*\)",
-    re.IGNORECASE | re.DOTALL,
 )
 
 # Alternative: @http_get, @http_post etc.
 HTTP_DECORATOR_RE = re.compile(
     r"@http_(get|post|put|delete|patch)\s*\(\s*['\"]([^'\"]+)['\"]"
-    r"(?:.*?auth\s*=\s*(\w+))?"
+    r"(?:[^)]*?auth\s*=\s*(\w+))?"
     r"[^)]*\)",
-    re.IGNORECASE | re.DOTALL,
 )
 
 # Function def following a route decorator
@@ -50,18 +53,26 @@ STUB_RE = re.compile(
 )
 
 
+@cached_parse
 def parse_routes_file(path: Path) -> list[Route]:
     """Parse all route decorators from a Python file."""
-    text = path.read_text(encoding="utf-8", errors="replace")
+    text = read_source(path, b"@")
+    if text is None:
+        return []
     lines = text.split("\n")
+    offsets = line_offsets(text)
     routes: list[Route] = []
 
+    # Index every top-level def once; each decorator bisects to the next one
+    def_matches = list(FUNC_DEF_RE.finditer(text))
+    def_starts = [m.start() for m in def_matches]
+
     # Find all route decorators
     for pattern in (ROUTE_RE, HTTP_DECORATOR_RE):
         for match in pattern.finditer(text):
             method = match.group(1).upper()
             route_path = match.group(2)
-            line_num = text[: match.start()].count("\n") + 1
+            line_num = line_number(offsets, match.start())
 
             # Check for auth parameter
             has_auth = False
@@ -72,17 +83,16 @@ def parse_routes_file(path: Path) -> list[Route]:
 
             # Find the function name (next def after this decorator)
             func_name = "unknown"
-            remaining = text[match.end() :]
-            func_match = FUNC_DEF_RE.search(remaining)
+            idx = bisect_left(def_starts, match.end())
+            func_match = def_matches[idx] if idx < len(def_matches) else None
             if func_match:
                 func_name = func_match.group(1)
 
             # Check if function body is a stub
             is_stub = False
             if func_match:
-                func_start = match.end() + func_match.end()
                 # Look at next few lines for stub patterns
-                func_line = text[:func_start].count("\n")
+                func_line = line_number(offsets, func_match.end()) - 1
                 body_lines = lines[func_line : func_line + 5]
                 body_text = "\n".join(body_lines)
                 is_stub = bool(STUB_RE.search(body_text))
@@ -2,12 +2,13 @@
 
 from __future__ import annotations
 
+import os
 import re
 from dataclasses import dataclass
 from pathlib import Path
 
 
-@dataclass
+@dataclass(slots=True)
 class NextjsRoute:
     route_type: str  # "page" or "api"
     path: str  # e.g. "/dashboard", "/api/users"
@@ -50,6 +51,10 @@ STUB_RE = re.compile(
 )
 
 
+# Extensions recognised for App Router special files (page, route, ...)
+ROUTE_FILE_SUFFIXES = frozenset({".tsx", ".ts", ".jsx", ".js"})
+
+
 def _dir_to_route_path(app_dir: Path, file_path: Path) -> str:
     """Convert a file path relative to app/ into a URL route path.
 
@@ -71,6 +76,25 @@ def _dir_to_route_path(app_dir: Path, file_path: Path) -> str:
     return route
 
 
+def _walk_app_dir(app_dir: Path) -> tuple[list[tuple[Path, set[str]]], list[Path]]:
+    """Collect page files (with their sibling names) and route files in one pass."""
+    pages: list[tuple[Path, set[str]]] = []
+    route_files: list[Path] = []
+    for root, dirs, files in os.walk(app_dir):
+        dirs[:] = sorted(d for d in dirs if d != "node_modules")
+        names = set(files)
+        root_path = Path(root)
+        for name in sorted(files):
+            if os.path.splitext(name)[1] not in ROUTE_FILE_SUFFIXES:
+                continue
+            stem = name.partition(".")[0]
+            if stem == "page":
+                pages.append((root_path / name, names))
+            elif stem == "route":
+                route_files.append(root_path / name)
+    return pages, route_files
+
+
 def parse_nextjs_routes(app_dir: Path) -> list[NextjsRoute]:
     """Parse all routes from a Next.js App Router directory."""
     routes: list[NextjsRoute] = []
@@ -78,15 +102,11 @@ def parse_nextjs_routes(app_dir: Path) -> list[NextjsRoute]:
     if not app_dir.exists():
         return routes
 
-    # Find page files (page.tsx, page.ts, page.jsx, page.js)
-    for page_file in app_dir.rglob("page.*"):
-        if page_file.suffix not in (".tsx", ".ts", ".jsx", ".js"):
-            continue
-        if "node_modules" in page_file.parts:
-            continue
+    page_files, route_files = _walk_app_dir(app_dir)
 
+    # Page files (page.tsx, page.ts, page.jsx, page.js)
+    for page_file, siblings in page_files:
         route_path = _dir_to_route_path(app_dir, page_file)
-        page_dir = page_file.parent
 
         routes.append(
             NextjsRoute(
@@ -94,29 +114,24 @@ def parse_nextjs_routes(app_dir: Path) -> list[NextjsRoute]:
                 path=route_path,
                 file=page_file,
                 methods=["GET"],
-                has_loading=(page_dir / "loading.tsx").exists()
-                or (page_dir / "loading.ts").exists(),
-                has_error=(page_dir / "error.tsx").exists() or (page_dir / "error.ts").exists(),
-                has_layout=(page_dir / "layout.tsx").exists() or (page_dir / "layout.ts").exists(),
+                has_loading="loading.tsx" in siblings or "loading.ts" in siblings,
+                has_error="error.tsx" in siblings or "error.ts" in siblings,
+                has_layout="layout.tsx" in siblings or "layout.ts" in siblings,
             )
         )
 
-    # Find API route files (route.ts, route.tsx, route.js)
-    for route_file in app_dir.rglob("route.*"):
-        if route_file.suffix not in (".ts", ".tsx", ".js", ".jsx"):
-            continue
-        if "node_modules" in route_file.parts:
-            continue
-
+    # API route files (route.ts, route.tsx, route.js)
+    for route_file in route_files:
         route_path = _dir_to_route_path(app_dir, route_file)
         text = route_file.read_text(encoding="utf-8", errors="replace")
 
         methods: list[str] = []
-        for pattern in (METHOD_EXPORT_RE, METHOD_ARROW_RE):
-            for match in pattern.finditer(text):
-                method = match.group(1).upper()
-                if method not in methods:
-                    methods.append(method)
+        if "export" in text:  # Both method patterns need a literal "export"
+            for pattern in (METHOD_EXPORT_RE, METHOD_ARROW_RE):
+                for match in pattern.finditer(text):
+                    method = match.group(1).upper()
+                    if method not in methods:
+                        methods.append(method)
 
         if not methods:
             methods = ["GET"]
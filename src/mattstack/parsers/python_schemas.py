@@ -6,8 +6,10 @@ import re
 from dataclasses import dataclass, field
 from pathlib import Path
 
+from mattstack.parsers.utils import cached_parse, read_source
 
-@dataclass
+
+@dataclass(slots=True)
 class PydanticField:
     name: str
     type_str: str
@@ -35,7 +37,7 @@ class PydanticField:
         return self.validation_alias or self.alias or self.name
 
 
-@dataclass
+@dataclass(slots=True)
 class PydanticSchema:
     name: str
     file: Path
@@ -50,8 +52,8 @@ CLASS_RE = re.compile(
     r"^class\s+(\w+)\s*\(\s*(Schema|BaseModel|ModelSchema)\s*\)\s*:", re.MULTILINE
 )
 
-# Pattern: field_name: type = default or Field(...)
-FIELD_RE = re.compile(r"^\s{2,8}(\w+)\s*:\s*(.+?)(?:\s*=\s*(.+))?\s*$", re.MULTILINE)
+# Pattern (one body line): field_name: type = default or Field(...)
+FIELD_RE = re.compile(r"\s{2,8}(\w+)\s*:\s*(.+?)(?:\s*=\s*(.+))?\s*$")
 
 # Pattern: Field(min_length=X, max_length=Y, ...) constraints
 CONSTRAINT_RE = re.compile(r"(\w+)\s*=\s*([^,\)]+)")
@@ -71,9 +73,12 @@ MODEL_CONFIG_RE = re.compile(r"^\s+model_config\s*=\s*ConfigDict\((.+?)\)", re.M
 OPTIONAL_RE = re.compile(r"Optional\[(.+)\]|(\w+)\s*\|\s*None|None\s*\|\s*(\w+)")
 
 
+@cached_parse
 def parse_pydantic_file(path: Path) -> list[PydanticSchema]:
     """Parse all Pydantic schema classes from a Python file."""
-    text = path.read_text(encoding="utf-8", errors="replace")
+    text = read_source(path, b"Schema", b"BaseModel")
+    if text is None:
+        return []
     lines = text.split("\n")
     schemas: list[PydanticSchema] = []
 
@@ -112,7 +117,12 @@ def _parse_fields(body: str) -> list[PydanticField]:
     """Extract fields from a class body."""
     fields: list[PydanticField] = []
 
-    for match in FIELD_RE.finditer(body):
+    for line in body.split("\n"):
+        if ":" not in line:
+            continue
+        match = FIELD_RE.match(line)
+        if not match:
+            continue
         name = match.group(1)
         type_str = match.group(2).strip()
         default_val = match.group(3)
@@ -164,6 +174,8 @@ def _parse_fields(body: str) -> list[PydanticField]:
 
 def _detect_alias_generator(body: str) -> str | None:
     """Detect alias_generator in model_config = ConfigDict(...)."""
+    if "alias_generator" not in body:
+        return None
     m = MODEL_CONFIG_RE.search(body)
     if m:
         config_body = m.group(1)
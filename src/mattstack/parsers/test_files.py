@@ -3,11 +3,20 @@
 from __future__ import annotations
 
 import re
+from bisect import bisect_right
 from dataclasses import dataclass, field
 from pathlib import Path
 
+from mattstack.parsers.utils import (
+    block_span,
+    cached_parse,
+    line_number,
+    line_offsets,
+    read_source,
+)
 
-@dataclass
+
+@dataclass(slots=True)
 class TestCase:
     name: str
     file: Path
@@ -16,7 +25,7 @@ class TestCase:
     keywords: list[str] = field(default_factory=list)
 
 
-@dataclass
+@dataclass(slots=True)
 class TestSuite:
     file: Path
     framework: str  # "pytest" or "vitest"
@@ -35,6 +44,11 @@ PYTEST_METHOD_RE = re.compile(r"^\s{4}(?:async\s+)?def\s+(test_\w+)\s*\(", re.MU
 # vitest/jest: describe("xxx", () => {
 VITEST_DESCRIBE_RE = re.compile(r"describe\s*\(\s*['\"]([^'\"]+)['\"]", re.MULTILINE)
 
+# vitest/jest: the callback opening a describe body: , () => { or , function () {
+VITEST_CALLBACK_RE = re.compile(
+    r"\s*,\s*(?:async\s+)?(?:\([^)]*\)\s*=>|function\s*\w*\s*\([^)]*\))\s*\{"
+)
+
 # vitest/jest: it("xxx", or test("xxx",
 VITEST_TEST_RE = re.compile(r"(?:it|test)\s*\(\s*['\"]([^'\"]+)['\"]", re.MULTILINE)
 
@@ -66,16 +80,23 @@ FEATURE_KEYWORDS = [
     "crud",
 ]
 
+# Word separators in test names, mapped to spaces in a single translate() pass
+_SEPARATORS = str.maketrans("_-", "  ")
+
 
+@cached_parse
 def parse_pytest_file(path: Path) -> TestSuite:
     """Parse test cases from a pytest file."""
-    text = path.read_text(encoding="utf-8", errors="replace")
+    text = read_source(path, b"test_")
+    if text is None:
+        return TestSuite(file=path, framework="pytest")
+    offsets = line_offsets(text)
     cases: list[TestCase] = []
 
     # Find standalone test functions
     for match in PYTEST_FUNC_RE.finditer(text):
         name = match.group(1)
-        line = text[: match.start()].count("\n") + 1
+        line = line_number(offsets, match.start())
         # Check it's not inside a class (not indented)
         line_start = text.rfind("\n", 0, match.start()) + 1
         if match.start() - line_start < 2:  # top-level
@@ -94,11 +115,10 @@ def parse_pytest_file(path: Path) -> TestSuite:
         class_end = text.find("\nclass ", class_match.end())
         if class_end == -1:
             class_end = len(text)
-        class_body = text[class_match.end() : class_end]
 
-        for method_match in PYTEST_METHOD_RE.finditer(class_body):
+        for method_match in PYTEST_METHOD_RE.finditer(text, class_match.end(), class_end):
             method_name = method_match.group(1)
-            line = text[: class_match.end() + method_match.start()].count("\n") + 1
+            line = line_number(offsets, method_match.start())
             cases.append(
                 TestCase(
                     name=method_name,
@@ -112,28 +132,39 @@ def parse_pytest_file(path: Path) -> TestSuite:
     return TestSuite(file=path, framework="pytest", test_cases=cases)
 
 
+@cached_parse
 def parse_vitest_file(path: Path) -> TestSuite:
     """Parse test cases from a vitest/jest file."""
     text = path.read_text(encoding="utf-8", errors="replace")
+    offsets = line_offsets(text)
     cases: list[TestCase] = []
 
-    # Find describe blocks as context
-    describes: list[tuple[str, int, int]] = []
+    # Find describe blocks as context: (name, start, end, enclosing describe index)
+    describes: list[tuple[str, int, int, int]] = []
+    open_stack: list[int] = []
     for match in VITEST_DESCRIBE_RE.finditer(text):
-        name = match.group(1)
         start = match.start()
-        describes.append((name, start, 0))  # end computed lazily
+        end = len(text)
+        callback = VITEST_CALLBACK_RE.match(text, match.end())
+        if callback:
+            end = block_span(text, callback.end() - 1)[1]
+        while open_stack and describes[open_stack[-1]][2] <= start:
+            open_stack.pop()
+        describes.append((match.group(1), start, end, open_stack[-1] if open_stack else -1))
+        open_stack.append(len(describes) - 1)
+    desc_starts = [d[1] for d in describes]
 
     # Find individual test cases
     for match in VITEST_TEST_RE.finditer(text):
         name = match.group(1)
-        line = text[: match.start()].count("\n") + 1
+        pos = match.start()
+        line = line_number(offsets, pos)
 
-        # Find parent describe
-        parent = None
-        for desc_name, desc_start, _ in describes:
-            if desc_start < match.start():
-                parent = desc_name
+        # Innermost describe that is still open at this test
+        i = bisect_right(desc_starts, pos) - 1
+        while i >= 0 and describes[i][2] <= pos:
+            i = describes[i][3]
+        parent = describes[i][0] if i >= 0 else None
 
         cases.append(
             TestCase(
@@ -150,7 +181,7 @@ def parse_vitest_file(path: Path) -> TestSuite:
 
 def _extract_keywords(name: str) -> list[str]:
     """Extract feature keywords from a test name."""
-    name_lower = name.lower().replace("_", " ").replace("-", " ")
+    name_lower = name.lower().translate(_SEPARATORS)
     return [kw for kw in FEATURE_KEYWORDS if kw in name_lower]
 
 
@@ -6,17 +6,24 @@ import re
 from dataclasses import dataclass, field
 from pathlib import Path
 
-from mattstack.parsers.utils import extract_block as _extract_block
+from mattstack.parsers.utils import (
+    block_span,
+    cached_parse,
+    find_files,
+    line_number,
+    line_offsets,
+    read_source,
+)
 
 
-@dataclass
+@dataclass(slots=True)
 class TSField:
     name: str
     type_str: str
     optional: bool = False
 
 
-@dataclass
+@dataclass(slots=True)
 class TSInterface:
     name: str
     file: Path
@@ -31,28 +38,37 @@ INTERFACE_RE = re.compile(
     re.MULTILINE,
 )
 
-# Pattern:   fieldName: type; or fieldName?: type;
+# Pattern (one body line):   fieldName: type; or fieldName?: type;
+# Group 4 captures a trailing "| null" / "| undefined" so optionality needs no second search.
+# Swept over a whole body with finditer: whitespace never crosses a newline, so each
+# match stays on the line it starts on. Indentation is optional, so unindented fields
+# (including those after a blank line) are matched too.
 TS_FIELD_RE = re.compile(
-    r"^\s+(\w+)(\?)?:\s*(.+?)\s*;?\s*$",
+    r"^[^\S\n]*(\w+)(\?)?:[^\S\n]*"
+    r"(.+?([^\S\n]*\|[^\S\n]*(?:null|undefined))?)[^\S\n]*;?[^\S\n]*$",
     re.MULTILINE,
 )
 
 
+@cached_parse
 def parse_typescript_file(path: Path) -> list[TSInterface]:
     """Parse all interface declarations from a TypeScript file."""
-    text = path.read_text(encoding="utf-8", errors="replace")
+    text = read_source(path, b"interface")
+    if text is None:
+        return []
     interfaces: list[TSInterface] = []
+    offsets = line_offsets(text)
 
     for match in INTERFACE_RE.finditer(text):
         name = match.group(1)
         extends = match.group(2)
-        line_num = text[: match.start()].count("\n") + 1
+        line_num = line_number(offsets, match.start())
 
-        # Find matching closing brace
-        brace_start = text.index("{", match.start())
-        body = _extract_block(text, brace_start)
+        # INTERFACE_RE ends on the opening brace; find its matching close. The body is
+        # sliced so ^ also matches the partial first line after the brace.
+        body_start, body_end = block_span(text, match.end() - 1)
 
-        fields = _parse_ts_fields(body)
+        fields = _parse_ts_fields(text[body_start:body_end])
         interfaces.append(
             TSInterface(
                 name=name,
@@ -67,25 +83,22 @@ def parse_typescript_file(path: Path) -> list[TSInterface]:
 
 
 def _parse_ts_fields(body: str) -> list[TSField]:
-    """Extract fields from an interface body."""
-    fields: list[TSField] = []
-    for match in TS_FIELD_RE.finditer(body):
-        name = match.group(1)
-        optional = match.group(2) == "?"
-        type_str = match.group(3).strip().rstrip(";")
+    """Extract fields from an interface body (the text between its braces)."""
+    return [_ts_field(m) for m in TS_FIELD_RE.finditer(body)]
 
-        # Also optional if type ends with | null or | undefined
-        if re.search(r"\|\s*(null|undefined)\s*$", type_str):
-            optional = True
 
-        fields.append(TSField(name=name, type_str=type_str, optional=optional))
-    return fields
+def _ts_field(match: re.Match[str]) -> TSField:
+    """Build a TSField from a TS_FIELD_RE match."""
+    type_str = match.group(3)
+    if type_str.endswith(";"):  # Only left behind by a repeated ";;" terminator
+        type_str = type_str.rstrip(";")
+    # Optional via `?:` or a trailing | null / | undefined
+    optional = match.group(2) == "?" or match.group(4) is not None
+    return TSField(name=match.group(1), type_str=type_str, optional=optional)
 
 
 def find_typescript_type_files(project_path: Path) -> list[Path]:
     """Find TypeScript files likely containing type definitions."""
-    from mattstack.parsers.utils import find_files
-
     patterns = [
         "**/types.ts",
         "**/types/*.ts",
@@ -2,7 +2,15 @@
 
 from __future__ import annotations
 
+import mmap
+import os
+import re
+from bisect import bisect_right
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from functools import lru_cache, wraps
 from pathlib import Path
+from typing import Any, cast
 
 SKIP_DIRS = frozenset(
     {
@@ -17,45 +25,214 @@ SKIP_DIRS = frozenset(
     }
 )
 
+# Parsed results keyed by (parser, path) -> (st_mtime_ns, st_size, result)
+_PARSE_CACHE: dict[tuple[str, Path], tuple[int, int, object]] = {}
 
-def find_files(project_path: Path, patterns: list[str]) -> list[Path]:
-    """Find files matching patterns, deduplicating and skipping ignored dirs."""
-    files: list[Path] = []
-    for pattern in patterns:
-        files.extend(project_path.glob(pattern))
-    seen: set[Path] = set()
-    result: list[Path] = []
-    for f in files:
-        if f in seen:
+# find_files results keyed by (project_path, patterns); None outside file_discovery_cache()
+_FIND_CACHE: dict[tuple[Path, tuple[str, ...]], tuple[Path, ...]] | None = None
+
+# Files at least this large are probed through mmap instead of being read whole
+_MMAP_PROBE_BYTES = 1 << 20
+
+# Braces and whole string literals inside a block; a lone quote is an unclosed string
+_BLOCK_TOKEN_RE = re.compile(
+    r"[{}]|'(?:[^'\\]|\\.)*'|\"(?:[^\"\\]|\\.)*\"|`(?:[^`\\]|\\.)*`|['\"`]",
+    re.DOTALL,
+)
+
+
+def cached_parse[F: Callable[[Path], Any]](func: F) -> F:
+    """Memoize a single-file parser on the file's (mtime, size).
+
+    Several auditors parse the same files during one audit run; unchanged
+    files return the previous result instead of re-running the regexes.
+    Callers must treat cached results as read-only.
+    """
+    name = f"{func.__module__}.{func.__qualname__}"
+
+    @wraps(func)
+    def wrapper(path: Path) -> Any:
+        try:
+            st = path.stat()
+        except OSError:
+            return func(path)
+        key = (name, path)
+        hit = _PARSE_CACHE.get(key)
+        if hit is not None and hit[0] == st.st_mtime_ns and hit[1] == st.st_size:
+            return hit[2]
+        result = func(path)
+        _PARSE_CACHE[key] = (st.st_mtime_ns, st.st_size, result)
+        return result
+
+    return cast(F, wrapper)
+
+
+def read_source(path: Path, *needles: bytes) -> str | None:
+    """Read a source file, or return None if it contains none of ``needles``.
+
+    The probe runs on raw bytes so files that cannot match skip decoding and
+    regex scanning; large files are probed through ``mmap`` so a rejected
+    file is never copied into memory. Decoding mirrors
+    ``read_text(errors="replace")``, including universal newline translation.
+    """
+    with path.open("rb") as f:
+        size = os.fstat(f.fileno()).st_size
+        if needles and size >= _MMAP_PROBE_BYTES:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                if all(mm.find(needle) == -1 for needle in needles):
+                    return None
+                data = mm[:]
+        else:
+            data = f.read()
+            if needles and not any(needle in data for needle in needles):
+                return None
+    text = data.decode("utf-8", errors="replace")
+    if "\r" in text:
+        text = text.replace("\r\n", "\n").replace("\r", "\n")
+    return text
+
+
+def clear_parse_cache() -> None:
+    """Drop all memoized parser results."""
+    _PARSE_CACHE.clear()
+
+
+def walk_project(project_path: Path, max_depth: int | None = None) -> Iterator[tuple[str, str]]:
+    """Yield ``(relative_posix_path, path)`` for each file, pruning SKIP_DIRS.
+
+    ``max_depth`` limits how many directory levels below ``project_path`` are
+    entered (0 = only files directly in ``project_path``). Symlinked
+    directories are not followed, matching ``os.walk``.
+    """
+    stack: list[tuple[str, str, int]] = [(os.fspath(project_path), "", 0)]
+    while stack:
+        dir_path, rel_dir, depth = stack.pop()
+        descend = max_depth is None or depth < max_depth
+        try:
+            entries = os.scandir(dir_path)
+        except OSError:
             continue
-        if any(p in f.parts for p in SKIP_DIRS):
+        with entries:
+            for entry in entries:
+                try:
+                    is_dir = entry.is_dir()
+                except OSError:
+                    is_dir = False
+                if not is_dir:
+                    yield rel_dir + entry.name, entry.path
+                elif descend and entry.name not in SKIP_DIRS and not entry.is_symlink():
+                    stack.append((entry.path, f"{rel_dir}{entry.name}/", depth + 1))
+
+
+def _glob_to_regex(pattern: str) -> str:
+    """Translate a pathlib-style glob (``*``, ``?``, ``**``) to a regex on POSIX paths."""
+    out: list[str] = []
+    parts = pattern.split("/")
+    for idx, part in enumerate(parts):
+        if part == "**":
+            out.append("(?:[^/]+/)*")
             continue
-        seen.add(f)
-        result.append(f)
-    return sorted(result)
+        for ch in part:
+            if ch == "*":
+                out.append("[^/]*")
+            elif ch == "?":
+                out.append("[^/]")
+            else:
+                out.append(re.escape(ch))
+        if idx < len(parts) - 1:
+            out.append("/")
+    return "".join(out)
+
+
+@lru_cache(maxsize=64)
+def _compile_patterns(patterns: tuple[str, ...]) -> tuple[re.Pattern[str], int | None]:
+    """Compile glob patterns into one regex plus the walk depth they need."""
+    regex = re.compile("|".join(f"(?:{_glob_to_regex(p)})" for p in patterns) or "(?!)")
+    if any("**" in p for p in patterns):
+        return regex, None
+    return regex, max((p.count("/") for p in patterns), default=0)
+
+
+def iter_files(project_path: Path, patterns: list[str]) -> Iterator[Path]:
+    """Yield files matching patterns in walk order, skipping ignored dirs.
+
+    All patterns are matched during a single walk of ``project_path``, and
+    each file is yielded at most once.
+    """
+    regex, max_depth = _compile_patterns(tuple(patterns))
+    for rel, path in walk_project(project_path, max_depth):
+        if regex.fullmatch(rel):
+            yield Path(path)
+
+
+def find_files(project_path: Path, patterns: list[str]) -> list[Path]:
+    """Find files matching patterns, deduplicating and skipping ignored dirs.
+
+    Inside ``file_discovery_cache()`` repeated lookups reuse the first walk.
+    """
+    if _FIND_CACHE is None:
+        return sorted(iter_files(project_path, patterns))
+    key = (project_path, tuple(patterns))
+    hit = _FIND_CACHE.get(key)
+    if hit is None:
+        hit = _FIND_CACHE[key] = tuple(sorted(iter_files(project_path, patterns)))
+    return list(hit)
+
+
+@contextmanager
+def file_discovery_cache() -> Iterator[None]:
+    """Memoize ``find_files`` for the duration of the block.
+
+    Meant to wrap one audit run, during which several auditors look up the
+    same files; the cache is dropped on exit so later runs see new files.
+    """
+    global _FIND_CACHE
+    outer = _FIND_CACHE
+    if outer is None:
+        _FIND_CACHE = {}
+    try:
+        yield
+    finally:
+        _FIND_CACHE = outer
+
+
+def line_offsets(text: str) -> list[int]:
+    """Return the character offset at which each line of ``text`` starts."""
+    offsets = [0]
+    pos = text.find("\n")
+    while pos != -1:
+        offsets.append(pos + 1)
+        pos = text.find("\n", pos + 1)
+    return offsets
+
+
+def line_number(offsets: list[int], offset: int) -> int:
+    """Return the 1-based line number of ``offset`` using ``line_offsets`` output."""
+    return bisect_right(offsets, offset)
+
+
+def block_span(text: str, open_pos: int) -> tuple[int, int]:
+    """Return ``(start, end)`` of the content between matching braces.
+
+    Braces inside string literals are ignored. An unclosed block runs to the
+    end of ``text``.
+    """
+    depth = 0
+    # String literals are consumed whole by the regex, so the loop only sees braces
+    for token in _BLOCK_TOKEN_RE.finditer(text, open_pos):
+        ch = token.group()
+        if ch == "{":
+            depth += 1
+        elif ch == "}":
+            depth -= 1
+            if depth == 0:
+                return open_pos + 1, token.start()
+        elif len(ch) == 1:
+            break  # unclosed string runs to the end
+    return open_pos + 1, len(text)
 
 
 def extract_block(text: str, open_pos: int) -> str:
     """Extract content between matching braces, ignoring braces in strings."""
-    depth = 0
-    in_string: str | None = None  # None, "'", '"', or "`"
-    i = open_pos
-    while i < len(text):
-        ch = text[i]
-        if in_string:
-            if ch == "\\" and i + 1 < len(text):
-                i += 2  # skip escaped character
-                continue
-            if ch == in_string:
-                in_string = None
-        else:
-            if ch in ("'", '"', "`"):
-                in_string = ch
-            elif ch == "{":
-                depth += 1
-            elif ch == "}":
-                depth -= 1
-                if depth == 0:
-                    return text[open_pos + 1 : i]
-        i += 1
-    return text[open_pos + 1 :]
+    start, end = block_span(text, open_pos)
+    return text[start:end]
@@ -6,10 +6,17 @@ import re
 from dataclasses import dataclass, field
 from pathlib import Path
 
-from mattstack.parsers.utils import extract_block as _extract_block
+from mattstack.parsers.utils import (
+    cached_parse,
+    extract_block,
+    find_files,
+    line_number,
+    line_offsets,
+    read_source,
+)
 
 
-@dataclass
+@dataclass(slots=True)
 class ZodField:
     name: str
     type_str: str
@@ -17,7 +24,7 @@ class ZodField:
     constraints: dict[str, str] = field(default_factory=dict)
 
 
-@dataclass
+@dataclass(slots=True)
 class ZodSchema:
     name: str
     file: Path
@@ -28,7 +35,6 @@ class ZodSchema:
 # Pattern: const/export const Name = z.object({
 ZOD_SCHEMA_RE = re.compile(
     r"(?:export\s+)?(?:const|let)\s+(\w+)\s*=\s*z\.object\(\s*\{",
-    re.MULTILINE,
 )
 
 # Pattern:   fieldName: z.string().min(3), or z.number().optional(),
@@ -40,22 +46,29 @@ ZOD_FIELD_RE = re.compile(
 # Zod type extractors
 ZOD_TYPE_RE = re.compile(r"z\.(\w+)\(\)")
 
-# Constraint patterns: .min(N), .max(N), .email(), .url(), .length(N)
-ZOD_CONSTRAINT_RE = re.compile(r"\.(\w+)\(([^)]*)\)")
+# Chained calls: .min(N), .max(N), .email(), .url(), .length(N)
+# Group 1 is set on z.<type>(...) calls so one sweep also finds the base type
+ZOD_CALL_RE = re.compile(r"(z)?\.(\w+)\(([^)]*)\)")
 
+# Constraints recorded even when the method name equals the base type
+ZOD_KNOWN_CONSTRAINTS = frozenset({"min", "max", "length", "email", "url", "regex", "uuid"})
 
+
+@cached_parse
 def parse_zod_file(path: Path) -> list[ZodSchema]:
     """Parse all z.object() schemas from a TypeScript file."""
-    text = path.read_text(encoding="utf-8", errors="replace")
+    text = read_source(path, b"z.object(")
+    if text is None:
+        return []
     schemas: list[ZodSchema] = []
+    offsets = line_offsets(text)
 
     for match in ZOD_SCHEMA_RE.finditer(text):
         name = match.group(1)
-        line_num = text[: match.start()].count("\n") + 1
+        line_num = line_number(offsets, match.start())
 
-        # Find the opening brace of z.object({
-        brace_pos = text.index("{", match.start() + len(match.group(0)) - 1)
-        body = _extract_block(text, brace_pos)
+        # ZOD_SCHEMA_RE ends on the opening brace of z.object({
+        body = extract_block(text, match.end() - 1)
 
         fields = _parse_zod_fields(body)
         schemas.append(
@@ -88,25 +101,32 @@ def _parse_zod_fields(body: str) -> list[ZodField]:
         name = match.group(1)
         chain = match.group(2).strip().rstrip(",")
 
-        # Extract base type
-        type_match = ZOD_TYPE_RE.search(chain)
-        type_str = type_match.group(1) if type_match else "unknown"
+        # Extract base type and constraints in one sweep over the chain
+        type_str: str | None = None
+        type_pos = 0
+        constraints: dict[str, str] = {}
+        for cm in ZOD_CALL_RE.finditer(chain):
+            method = cm.group(2)
+            if type_str is None and cm.group(1) and not cm.group(3):
+                type_str, type_pos = method, cm.start()
+            if method in ("optional", "nullable"):
+                continue  # Handled below
+            arg = cm.group(3).strip().strip("'\"")
+            constraints[method] = arg if arg else "true"
+
+        # The sweep can swallow a z.<type>() nested in an earlier call's arguments,
+        # so fall back to a plain search of the text before the candidate.
+        if type_str is None or type_pos > 0:
+            earlier = ZOD_TYPE_RE.search(chain, 0, type_pos if type_str else len(chain))
+            if earlier:
+                type_str = earlier.group(1)
+        type_str = type_str or "unknown"
+        if type_str not in ZOD_KNOWN_CONSTRAINTS:
+            constraints.pop(type_str, None)  # Skip the base type call
 
         # Check optional
         optional = ".optional()" in chain or ".nullable()" in chain
 
-        # Extract constraints
-        constraints: dict[str, str] = {}
-        for cm in ZOD_CONSTRAINT_RE.finditer(chain):
-            method = cm.group(1)
-            arg = cm.group(2).strip().strip("'\"")
-            if method in ("min", "max", "length", "email", "url", "regex", "uuid"):
-                constraints[method] = arg if arg else "true"
-            elif method in ("optional", "nullable"):
-                pass  # Already handled
-            elif method not in (type_str,):  # Skip the base type call
-                constraints[method] = arg if arg else "true"
-
         fields.append(
             ZodField(
                 name=name,
@@ -120,8 +140,6 @@ def _parse_zod_fields(body: str) -> list[ZodField]:
 
 def find_zod_files(project_path: Path) -> list[Path]:
     """Find TypeScript files likely containing Zod schemas."""
-    from mattstack.parsers.utils import find_files
-
     patterns = [
         "**/schemas.ts",
         "**/schemas/*.ts",
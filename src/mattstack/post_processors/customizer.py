@@ -13,17 +13,17 @@ def customize_backend(config: ProjectConfig) -> None:
     pyproject = config.backend_dir / "pyproject.toml"
     if pyproject.exists():
         content = pyproject.read_text()
-        # Update project name
-        content = content.replace(
-            'name = "django-ninja-boilerplate"',
-            f'name = "{config.name}-backend"',
-        )
-        content = content.replace(
-            'name = "django_ninja_boilerplate"',
-            f'name = "{config.python_package_name}_backend"',
-        )
-        pyproject.write_text(content)
-        print_info(f"Renamed backend to {config.name}-backend")
+        renames = [
+            ('name = "django-ninja-boilerplate"', f'name = "{config.name}-backend"'),
+            ('name = "django_ninja_boilerplate"', f'name = "{config.python_package_name}_backend"'),
+        ]
+        # Already renamed (or not the boilerplate): leave the file untouched
+        if any(old in content for old, _ in renames):
+            # Update project name
+            for old, new in renames:
+                content = content.replace(old, new)
+            pyproject.write_text(content)
+            print_info(f"Renamed backend to {config.name}-backend")
 
     # Remove boilerplate cli/ dir if somehow still present
     cli_dir = config.backend_dir / "cli"
@@ -37,7 +37,11 @@ def customize_frontend(config: ProjectConfig) -> None:
     """Rename the frontend project to match the project name."""
     package_json = config.frontend_dir / "package.json"
     if package_json.exists():
-        data = json.loads(package_json.read_text())
-        data["name"] = f"{config.name}-frontend"
-        package_json.write_text(json.dumps(data, indent=2) + "\n")
-        print_info(f"Renamed frontend to {config.name}-frontend")
+        # json.loads detects UTF-8/16/32 from the raw bytes itself
+        data = json.loads(package_json.read_bytes())
+        name = f"{config.name}-frontend"
+        if data.get("name") == name:
+            return
+        data["name"] = name
+        package_json.write_bytes((json.dumps(data, indent=2) + "\n").encode("utf-8"))
+        print_info(f"Renamed frontend to {name}")
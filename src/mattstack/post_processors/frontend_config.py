@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+import shutil
+
 from mattstack.config import ProjectConfig
 from mattstack.utils.console import print_info
 
@@ -31,10 +33,10 @@ VITE_DJANGO_STATIC_URL=/static/
 VITE_DJANGO_MEDIA_URL=/media/
 VITE_DJANGO_API_PREFIX=/api/v1
 """
-    env_file.write_text(env_content)
+    env_file.write_bytes(env_content.encode("utf-8"))
 
-    env_mono = config.frontend_dir / ".env.monorepo"
-    env_mono.write_text(env_content)
+    # Same content; copy the file rather than encoding and writing it again
+    shutil.copyfile(env_file, config.frontend_dir / ".env.monorepo")
 
     print_info("Configured frontend for monorepo mode")
 
@@ -0,0 +1,38 @@
+"""Template generators for scaffolded project files."""
+
+from __future__ import annotations
+
+from collections.abc import Callable
+from dataclasses import fields
+from functools import wraps
+from typing import cast
+
+from mattstack.config import ProjectConfig
+
+# Rendered output keyed by (generator, config field values)
+_RENDER_CACHE: dict[tuple[object, ...], str] = {}
+
+# Upper bound on cached renders before the cache is reset
+_RENDER_CACHE_MAX = 128
+
+
+def cached_render[F: Callable[[ProjectConfig], str]](func: F) -> F:
+    """Memoize a template generator on the values of every ``ProjectConfig`` field.
+
+    Generators are pure functions of the config, so an identical config (for
+    example across several deployment targets or tests) reuses the rendered
+    string. The key is recomputed per call, so mutating a config is safe.
+    """
+    name = f"{func.__module__}.{func.__qualname__}"
+
+    @wraps(func)
+    def wrapper(config: ProjectConfig) -> str:
+        key = (name, *(getattr(config, f.name) for f in fields(config)))
+        hit = _RENDER_CACHE.get(key)
+        if hit is None:
+            if len(_RENDER_CACHE) >= _RENDER_CACHE_MAX:
+                _RENDER_CACHE.clear()
+            hit = _RENDER_CACHE[key] = func(config)
+        return hit
+
+    return cast(F, wrapper)
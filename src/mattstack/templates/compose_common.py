@@ -0,0 +1,7 @@
+"""Compose fragments shared by the dev and prod docker-compose templates."""
+
+from __future__ import annotations
+
+# depends_on entries for services that need the database (and Redis) to be healthy
+DEPENDS_DB = "      db:\n        condition: service_healthy"
+DEPENDS_DB_REDIS = DEPENDS_DB + "\n      redis:\n        condition: service_healthy"
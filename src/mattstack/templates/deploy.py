@@ -0,0 +1,81 @@
+"""Deployment config files for each deployment target."""
+
+from __future__ import annotations
+
+import importlib
+from collections.abc import Collection
+
+from mattstack.config import DeploymentTarget, ProjectConfig
+
+# target -> (template module, ((output path, generator name), ...)); paths may
+# use {name}. Modules are imported on demand so a run only loads its own target.
+DEPLOY_FILES: dict[DeploymentTarget, tuple[str, tuple[tuple[str, str], ...]]] = {
+    DeploymentTarget.RAILWAY: (
+        "deploy_railway",
+        (
+            ("railway.json", "generate_railway_json"),
+            ("railway.toml", "generate_railway_toml"),
+        ),
+    ),
+    DeploymentTarget.RENDER: ("deploy_render", (("render.yaml", "generate_render_yaml"),)),
+    DeploymentTarget.FLY_IO: ("deploy_fly", (("fly.toml", "generate_fly_toml"),)),
+    DeploymentTarget.AWS: (
+        "deploy_aws",
+        (
+            ("ecs-task-definition.json", "generate_ecs_task_definition"),
+            ("copilot/api/manifest.yml", "generate_copilot_manifest"),
+        ),
+    ),
+    DeploymentTarget.GCP: (
+        "deploy_gcp",
+        (
+            ("service.yaml", "generate_cloud_run_yaml"),
+            ("app.yaml", "generate_app_engine_yaml"),
+        ),
+    ),
+    DeploymentTarget.HETZNER: (
+        "deploy_hetzner",
+        (
+            ("docker-compose.prod.yml", "generate_hetzner_compose"),
+            ("Caddyfile", "generate_caddyfile"),
+        ),
+    ),
+    DeploymentTarget.SELF_HOSTED: (
+        "deploy_self_hosted",
+        (
+            ("docker-compose.prod.yml", "generate_self_hosted_compose"),
+            ("nginx.conf", "generate_nginx_conf"),
+            ("{name}.service", "generate_systemd_service"),
+        ),
+    ),
+    DeploymentTarget.CLOUDFLARE: (
+        "deploy_cloudflare",
+        (("wrangler.toml", "generate_wrangler_toml"),),
+    ),
+    DeploymentTarget.DIGITAL_OCEAN: (
+        "deploy_digitalocean",
+        ((".do/app.yaml", "generate_do_app_spec"),),
+    ),
+}
+
+
+def generate_deploy_files(
+    config: ProjectConfig,
+    targets: Collection[DeploymentTarget] | None = None,
+) -> list[tuple[str, str]]:
+    """Render ``(relative_path, content)`` for the config's deployment target.
+
+    ``targets`` limits which targets a generator supports; any other target
+    (including plain Docker) yields no files.
+    """
+    target = config.deployment
+    if targets is not None and target not in targets:
+        return []
+    if target not in DEPLOY_FILES:
+        return []
+    module_name, files = DEPLOY_FILES[target]
+    module = importlib.import_module(f"mattstack.templates.{module_name}")
+    return [
+        (path.format(name=config.name), getattr(module, generate)(config))
+        for path, generate in files
+    ]
@@ -5,8 +5,10 @@ from __future__ import annotations
 import json
 
 from mattstack.config import ProjectConfig
+from mattstack.templates import cached_render
 
 
+@cached_render
 def generate_ecs_task_definition(config: ProjectConfig) -> str:
     """Generate ECS task definition JSON."""
     pkg = config.python_package_name
@@ -67,6 +69,7 @@ def generate_ecs_task_definition(config: ProjectConfig) -> str:
     return json.dumps(task_def, indent=2) + "\n"
 
 
+@cached_render
 def generate_copilot_manifest(config: ProjectConfig) -> str:
     """Generate AWS Copilot service manifest YAML."""
     pkg = config.python_package_name
@@ -3,8 +3,11 @@
 from __future__ import annotations
 
 from mattstack.config import ProjectConfig
+from mattstack.templates import cached_render
+from mattstack.templates.frontend_flavor import frontend_flavor
 
 
+@cached_render
 def generate_wrangler_toml(config: ProjectConfig) -> str:
     """Generate wrangler.toml for Cloudflare Pages deployment."""
     lines: list[str] = [
@@ -14,17 +17,14 @@ def generate_wrangler_toml(config: ProjectConfig) -> str:
     if config.has_frontend and not config.has_backend:
         lines.extend(
             [
-                'pages_build_output_dir = "frontend/dist"',
+                f'pages_build_output_dir = "{frontend_flavor(config).pages_output}"',
                 "",
                 "[build]",
                 'command = "cd frontend && bun install && bun run build"',
             ]
         )
-        if config.is_nextjs:
-            lines[-2] = "[build]"
-            lines[-1] = 'command = "cd frontend && bun install && bun run build"'
-            lines[1] = 'pages_build_output_dir = "frontend/.next/static"'
     elif config.has_backend and config.has_frontend:
+        flavor = frontend_flavor(config)
         lines.extend(
             [
                 "",
@@ -33,18 +33,12 @@ def generate_wrangler_toml(config: ProjectConfig) -> str:
                 "# Backend should be deployed separately (Docker, VPS, etc).",
                 "",
                 "# To deploy frontend to Cloudflare Pages:",
-                f"#   cd frontend && npx wrangler pages deploy "
-                f"{'out' if config.is_nextjs else 'dist'}",
+                f"#   cd frontend && npx wrangler pages deploy {flavor.pages_deploy_dir}",
                 "",
                 "[vars]",
+                f'{flavor.api_env_key} = "https://{config.name}-api.example.com/api/v1"',
             ]
         )
-        if config.is_nextjs:
-            lines.append(
-                f'NEXT_PUBLIC_API_BASE_URL = "https://{config.name}-api.example.com/api/v1"'
-            )
-        else:
-            lines.append(f'VITE_API_BASE_URL = "https://{config.name}-api.example.com/api/v1"')
     elif config.has_backend:
         lines.extend(
             [
@@ -2,131 +2,105 @@
 
 from __future__ import annotations
 
+import io
+
 from mattstack.config import ProjectConfig
+from mattstack.templates import cached_render
+from mattstack.templates.frontend_flavor import frontend_flavor
 
 
+@cached_render
 def generate_do_app_spec(config: ProjectConfig) -> str:
     """Generate .do/app.yaml App Platform spec."""
+    name = config.name
     pkg = config.python_package_name
-    lines: list[str] = [
-        f"name: {config.name}",
-        "region: nyc",
-        "",
-    ]
-
-    services: list[str] = []
-    databases: list[str] = []
+    # Service entries go to their own buffer so the header is written once, if needed
+    services = io.StringIO()
+    s = services.write
 
     if config.has_backend:
-        backend = [
-            "services:",
-            f"  - name: {config.name}-api",
-            "    github:",
-            "      repo: OWNER/REPO",
-            "      branch: main",
-            "      deploy_on_push: true",
-            "    source_dir: backend",
-            "    dockerfile_path: backend/Dockerfile",
-            "    http_port: 8000",
-            "    instance_count: 1",
-            "    instance_size_slug: basic-xxs",
-            "    routes:",
-            "      - path: /api",
-            "    health_check:",
-            "      http_path: /api/health/",
-            "      initial_delay_seconds: 15",
-            "      period_seconds: 30",
-            "    envs:",
-            "      - key: DJANGO_SECRET_KEY",
-            "        type: SECRET",
-            "        value: ${DJANGO_SECRET_KEY}",
-            "      - key: DJANGO_SETTINGS_MODULE",
-            f"        value: {pkg}.settings",
-            "      - key: DATABASE_URL",
-            f"        value: ${{db-{config.name}.DATABASE_URL}}",
-            "      - key: ALLOWED_HOSTS",
-            "        value: ${APP_DOMAIN}",
-        ]
+        s(
+            f"  - name: {name}-api\n"
+            "    github:\n"
+            "      repo: OWNER/REPO\n"
+            "      branch: main\n"
+            "      deploy_on_push: true\n"
+            "    source_dir: backend\n"
+            "    dockerfile_path: backend/Dockerfile\n"
+            "    http_port: 8000\n"
+            "    instance_count: 1\n"
+            "    instance_size_slug: basic-xxs\n"
+            "    routes:\n"
+            "      - path: /api\n"
+            "    health_check:\n"
+            "      http_path: /api/health/\n"
+            "      initial_delay_seconds: 15\n"
+            "      period_seconds: 30\n"
+            "    envs:\n"
+            "      - key: DJANGO_SECRET_KEY\n"
+            "        type: SECRET\n"
+            "        value: ${DJANGO_SECRET_KEY}\n"
+            "      - key: DJANGO_SETTINGS_MODULE\n"
+            f"        value: {pkg}.settings\n"
+            "      - key: DATABASE_URL\n"
+            f"        value: ${{db-{name}.DATABASE_URL}}\n"
+            "      - key: ALLOWED_HOSTS\n"
+            "        value: ${APP_DOMAIN}\n"
+        )
 
         if config.use_redis:
-            backend.extend(
-                [
-                    "      - key: REDIS_URL",
-                    "        value: ${REDIS_URL}",
-                ]
-            )
-
-        services.extend(backend)
-
-        databases.extend(
-            [
-                "",
-                "databases:",
-                f"  - name: db-{config.name}",
-                "    engine: PG",
-                "    version: '16'",
-                "    size: db-s-dev-database",
-                "    num_nodes: 1",
-            ]
-        )
+            s("      - key: REDIS_URL\n        value: ${REDIS_URL}\n")
 
     if config.has_frontend:
-        if services and not config.has_backend:
-            services.append("services:")
-
+        flavor = frontend_flavor(config)
         fe_build = "bun install && bun run build"
-        fe_output = "dist"
-        if config.is_nextjs:
-            fe_output = ".next"
 
-        fe_lines = [
-            "" if services else "services:",
-            f"  - name: {config.name}-frontend",
-            "    github:",
-            "      repo: OWNER/REPO",
-            "      branch: main",
-            "      deploy_on_push: true",
-            "    source_dir: frontend",
-        ]
+        if services.tell():
+            s("\n")
+        s(
+            f"  - name: {name}-frontend\n"
+            "    github:\n"
+            "      repo: OWNER/REPO\n"
+            "      branch: main\n"
+            "      deploy_on_push: true\n"
+            "    source_dir: frontend\n"
+        )
 
         if config.is_nextjs:
-            fe_lines.extend(
-                [
-                    "    dockerfile_path: frontend/Dockerfile",
-                    "    http_port: 3000",
-                    "    instance_count: 1",
-                    "    instance_size_slug: basic-xxs",
-                ]
+            s(
+                "    dockerfile_path: frontend/Dockerfile\n"
+                "    http_port: 3000\n"
+                "    instance_count: 1\n"
+                "    instance_size_slug: basic-xxs\n"
             )
         else:
-            fe_lines.extend(
-                [
-                    f"    build_command: {fe_build}",
-                    f"    output_dir: {fe_output}",
-                    "    environment_slug: node-js",
-                ]
+            s(
+                f"    build_command: {fe_build}\n"
+                f"    output_dir: {flavor.build_output}\n"
+                "    environment_slug: node-js\n"
             )
 
-        fe_lines.append("    routes:")
-        fe_lines.append("      - path: /")
+        s("    routes:\n      - path: /\n")
 
         if config.has_backend:
-            env_key = "NEXT_PUBLIC_API_BASE_URL" if config.is_nextjs else "VITE_API_BASE_URL"
-            fe_lines.extend(
-                [
-                    "    envs:",
-                    f"      - key: {env_key}",
-                    "        value: ${APP_URL}/api/v1",
-                ]
-            )
+            s(f"    envs:\n      - key: {flavor.api_env_key}\n        value: ${{APP_URL}}/api/v1\n")
 
-        if not services:
-            services.append(fe_lines[0])
-            services.extend(fe_lines[1:])
-        else:
-            services.extend(fe_lines)
+    buf = io.StringIO()
+    w = buf.write
+    w(f"name: {name}\nregion: nyc\n\n")
+    if services.tell():
+        w("services:\n")
+        w(services.getvalue())
 
-    lines.extend(services)
-    lines.extend(databases)
+    if config.has_backend:
+        w(
+            "\n"
+            "databases:\n"
+            f"  - name: db-{name}\n"
+            "    engine: PG\n"
+            "    version: '16'\n"
+            "    size: db-s-dev-database\n"
+            "    num_nodes: 1\n"
+        )
 
-    return "\n".join(lines) + "\n"
+    return buf.getvalue()
@@ -3,60 +3,71 @@
 from __future__ import annotations
 
 from mattstack.config import ProjectConfig
+from mattstack.templates import cached_render
 
+# Filled with .format(name=..., pkg=...)
+_FLY_BACKEND = """\
+app = "{name}"
+primary_region = "iad"
 
-def generate_fly_toml(config: ProjectConfig) -> str:
-    """Generate fly.toml for Fly.io deployment."""
-    app_name = config.name
-    pkg = config.python_package_name
+[build]
+  dockerfile = "backend/Dockerfile"
+
+[env]
+  DJANGO_SETTINGS_MODULE = "{pkg}.settings"
+  PYTHONUNBUFFERED = "1"
+
+[http_service]
+  internal_port = 8000
+  force_https = true
+  auto_stop_machines = true
+  auto_start_machines = true
+  min_machines_running = 0
+
+[[http_service.checks]]
+  grace_period = "10s"
+  interval = "30s"
+  method = "GET"
+  path = "/api/health/"
+  timeout = "5s"
+
+[[vm]]
+  size = "shared-cpu-1x"
+  memory = "512mb"
+"""
+
+_FLY_FRONTEND = """\
+app = "{name}"
+primary_region = "iad"
 
-    sections: list[str] = [f'app = "{app_name}"', 'primary_region = "iad"', ""]
+[build]
+  dockerfile = "frontend/Dockerfile"
 
+[http_service]
+  internal_port = 3000
+  force_https = true
+  auto_stop_machines = true
+  auto_start_machines = true
+
+[[vm]]
+  size = "shared-cpu-1x"
+  memory = "256mb"
+"""
+
+_FLY_EMPTY = """\
+app = "{name}"
+primary_region = "iad"
+
+"""
+
+
+@cached_render
+def generate_fly_toml(config: ProjectConfig) -> str:
+    """Generate fly.toml for Fly.io deployment."""
     if config.has_backend:
-        sections.extend(
-            [
-                "[build]",
-                '  dockerfile = "backend/Dockerfile"',
-                "",
-                "[env]",
-                f'  DJANGO_SETTINGS_MODULE = "{pkg}.settings"',
-                '  PYTHONUNBUFFERED = "1"',
-                "",
-                "[http_service]",
-                "  internal_port = 8000",
-                "  force_https = true",
-                "  auto_stop_machines = true",
-                "  auto_start_machines = true",
-                "  min_machines_running = 0",
-                "",
-                "[[http_service.checks]]",
-                '  grace_period = "10s"',
-                '  interval = "30s"',
-                '  method = "GET"',
-                '  path = "/api/health/"',
-                '  timeout = "5s"',
-                "",
-                "[[vm]]",
-                '  size = "shared-cpu-1x"',
-                '  memory = "512mb"',
-            ]
-        )
+        template = _FLY_BACKEND
     elif config.has_frontend:
-        sections.extend(
-            [
-                "[build]",
-                '  dockerfile = "frontend/Dockerfile"',
-                "",
-                "[http_service]",
-                "  internal_port = 3000",
-                "  force_https = true",
-                "  auto_stop_machines = true",
-                "  auto_start_machines = true",
-                "",
-                "[[vm]]",
-                '  size = "shared-cpu-1x"',
-                '  memory = "256mb"',
-            ]
-        )
-
-    return "\n".join(sections) + "\n"
+        template = _FLY_FRONTEND
+    else:
+        template = _FLY_EMPTY
+    return template.format(name=config.name, pkg=config.python_package_name)
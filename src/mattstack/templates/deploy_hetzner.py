@@ -2,134 +2,67 @@
 
 from __future__ import annotations
 
-from mattstack.config import ProjectConfig
-
+import io
 
-def generate_hetzner_compose(config: ProjectConfig) -> str:
-    """Generate docker-compose.prod.yml for Hetzner with Caddy."""
-    pkg = config.python_package_name
-    lines: list[str] = [
-        "version: '3.8'",
-        "",
-        "services:",
-        "  caddy:",
-        "    image: caddy:2-alpine",
-        "    restart: unless-stopped",
-        "    ports:",
-        '      - "80:80"',
-        '      - "443:443"',
-        "    volumes:",
-        "      - ./Caddyfile:/etc/caddy/Caddyfile",
-        "      - caddy_data:/data",
-        "      - caddy_config:/config",
-        "    depends_on:",
-    ]
-
-    if config.has_backend:
-        lines.append("      - api")
-    if config.has_frontend:
-        lines.append("      - frontend")
-
-    if config.has_backend:
-        lines.extend(
-            [
-                "",
-                "  api:",
-                "    build: ./backend",
-                f"    command: gunicorn {pkg}.wsgi:application --bind 0.0.0.0:8000",
-                "    restart: unless-stopped",
-                "    env_file: .env",
-                "    expose:",
-                '      - "8000"',
-                "    depends_on:",
-                "      - db",
-            ]
-        )
-        if config.use_redis:
-            lines.append("      - redis")
+from mattstack.config import ProjectConfig
+from mattstack.templates import cached_render
+from mattstack.templates.vps_compose import build_compose
 
-    lines.extend(
-        [
-            "",
-            "  db:",
-            "    image: postgres:16-alpine",
-            "    restart: unless-stopped",
-            "    volumes:",
-            "      - postgres_data:/var/lib/postgresql/data",
-            "    environment:",
-            "      POSTGRES_DB: ${POSTGRES_DB:-app}",
-            "      POSTGRES_USER: ${POSTGRES_USER:-postgres}",
-            "      POSTGRES_PASSWORD: ${POSTGRES_PASSWORD:-postgres}",
-        ]
-    )
+# Static compose blocks specific to this target; shared services live in vps_compose
+_CADDY_SERVICE = """\
+version: '3.8'
 
-    if config.use_redis:
-        lines.extend(
-            [
-                "",
-                "  redis:",
-                "    image: redis:7-alpine",
-                "    restart: unless-stopped",
-            ]
-        )
+services:
+  caddy:
+    image: caddy:2-alpine
+    restart: unless-stopped
+    ports:
+      - "80:80"
+      - "443:443"
+    volumes:
+      - ./Caddyfile:/etc/caddy/Caddyfile
+      - caddy_data:/data
+      - caddy_config:/config
+    depends_on:
+"""
 
-    if config.has_frontend:
-        lines.extend(
-            [
-                "",
-                "  frontend:",
-                "    build: ./frontend",
-                "    restart: unless-stopped",
-                "    expose:",
-                '      - "3000"',
-            ]
-        )
+_VOLUMES = """
+volumes:
+  postgres_data:
+  caddy_data:
+  caddy_config:
+"""
 
-    lines.extend(
-        [
-            "",
-            "volumes:",
-            "  postgres_data:",
-            "  caddy_data:",
-            "  caddy_config:",
-        ]
-    )
 
-    return "\n".join(lines) + "\n"
+@cached_render
+def generate_hetzner_compose(config: ProjectConfig) -> str:
+    """Generate docker-compose.prod.yml for Hetzner with Caddy."""
+    return build_compose(config, _CADDY_SERVICE, _VOLUMES)
 
 
+@cached_render
 def generate_caddyfile(config: ProjectConfig) -> str:
     """Generate Caddyfile for reverse proxy with auto-HTTPS."""
-    lines: list[str] = [
-        f"{config.name}.example.com {{",
-    ]
+    buf = io.StringIO()
+    w = buf.write
+    w(f"{config.name}.example.com {{\n")
 
     if config.has_backend and config.has_frontend:
-        lines.extend(
-            [
-                "    handle /api/* {",
-                "        reverse_proxy api:8000",
-                "    }",
-                "    handle /admin/* {",
-                "        reverse_proxy api:8000",
-                "    }",
-                "    handle {",
-                "        reverse_proxy frontend:3000",
-                "    }",
-            ]
+        w(
+            "    handle /api/* {\n"
+            "        reverse_proxy api:8000\n"
+            "    }\n"
+            "    handle /admin/* {\n"
+            "        reverse_proxy api:8000\n"
+            "    }\n"
+            "    handle {\n"
+            "        reverse_proxy frontend:3000\n"
+            "    }\n"
         )
     elif config.has_backend:
-        lines.extend(
-            [
-                "    reverse_proxy api:8000",
-            ]
-        )
+        w("    reverse_proxy api:8000\n")
     elif config.has_frontend:
-        lines.extend(
-            [
-                "    reverse_proxy frontend:3000",
-            ]
-        )
+        w("    reverse_proxy frontend:3000\n")
 
-    lines.append("}")
-    return "\n".join(lines) + "\n"
+    w("}\n")
+    return buf.getvalue()
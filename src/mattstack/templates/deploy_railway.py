@@ -5,8 +5,10 @@ from __future__ import annotations
 import json
 
 from mattstack.config import ProjectConfig
+from mattstack.templates import cached_render
 
 
+@cached_render
 def generate_railway_json(config: ProjectConfig) -> str:
     """Generate railway.json with build and deploy config."""
     deploy: dict = {
@@ -34,6 +36,7 @@ def generate_railway_json(config: ProjectConfig) -> str:
     return json.dumps(deploy, indent=2) + "\n"
 
 
+@cached_render
 def generate_railway_toml(config: ProjectConfig) -> str:
     """Generate railway.toml with service definitions."""
     sections: list[str] = []
@@ -2,113 +2,99 @@
 
 from __future__ import annotations
 
-from mattstack.config import ProjectConfig
-
+import io
 
-def generate_render_yaml(config: ProjectConfig) -> str:
-    """Generate render.yaml Render Blueprint."""
-    services: list[str] = []
-    databases: list[str] = []
-    env_groups: list[str] = []
+from mattstack.config import ProjectConfig
+from mattstack.templates import cached_render
 
-    if config.has_backend:
-        backend_service = f"""\
+# Blueprint blocks, filled with .format_map({"name": ..., "pkg": ...});
+# literal braces are doubled
+_BACKEND_BASE = """\
   - type: web
-    name: {config.name}-api
+    name: {name}-api
     runtime: python
     region: oregon
     plan: starter
     buildCommand: pip install uv && uv sync
-    startCommand: uv run gunicorn {config.python_package_name}.wsgi:application --bind 0.0.0.0:$PORT
+    startCommand: uv run gunicorn {pkg}.wsgi:application --bind 0.0.0.0:$PORT
     healthCheckPath: /api/health/
     envVars:
       - key: DATABASE_URL
         fromDatabase:
-          name: {config.name}-db
+          name: {name}-db
           property: connectionString
       - key: DJANGO_SECRET_KEY
         generateValue: true
       - key: DJANGO_SETTINGS_MODULE
-        value: {config.python_package_name}.settings
+        value: {pkg}.settings
       - key: ALLOWED_HOSTS
         value: .onrender.com"""
 
-        if config.use_redis:
-            backend_service += f"""
+_BACKEND_REDIS_ENV = """
       - key: REDIS_URL
         fromService:
-          name: {config.name}-redis
+          name: {name}-redis
           type: redis
           property: connectionString"""
 
-        if config.has_frontend:
-            backend_service += """
+_BACKEND_CORS_ENV = """
       - key: CORS_ALLOWED_ORIGINS
-        value: https://${RENDER_EXTERNAL_HOSTNAME}"""
+        value: https://${{RENDER_EXTERNAL_HOSTNAME}}"""
 
-        backend_service += """
+_BACKEND_FOOTER = """
       - fromGroup: shared-env"""
 
-        services.append(backend_service)
-
-        db_block = f"""\
-  - name: {config.name}-db
+_DATABASE = """\
+  - name: {name}-db
     plan: starter
     ipAllowList: []"""
-        databases.append(db_block)
 
-    if config.use_redis:
-        redis_service = f"""\
+_REDIS_SERVICE = """\
   - type: redis
-    name: {config.name}-redis
+    name: {name}-redis
     plan: starter
     ipAllowList: []
     maxmemoryPolicy: allkeys-lru"""
-        services.append(redis_service)
 
-    if config.use_celery:
-        celery_worker = f"""\
+_CELERY_WORKER = """\
   - type: worker
-    name: {config.name}-celery-worker
+    name: {name}-celery-worker
     runtime: python
     buildCommand: pip install uv && uv sync
-    startCommand: uv run celery -A {config.python_package_name} worker -l info
+    startCommand: uv run celery -A {pkg} worker -l info
     envVars:
       - key: DATABASE_URL
         fromDatabase:
-          name: {config.name}-db
+          name: {name}-db
           property: connectionString
       - key: REDIS_URL
         fromService:
-          name: {config.name}-redis
+          name: {name}-redis
           type: redis
           property: connectionString
       - fromGroup: shared-env"""
-        services.append(celery_worker)
 
-        celery_beat = f"""\
+_CELERY_BEAT = """\
   - type: worker
-    name: {config.name}-celery-beat
+    name: {name}-celery-beat
     runtime: python
     buildCommand: pip install uv && uv sync
-    startCommand: uv run celery -A {config.python_package_name} beat -l info
+    startCommand: uv run celery -A {pkg} beat -l info
     envVars:
       - key: DATABASE_URL
         fromDatabase:
-          name: {config.name}-db
+          name: {name}-db
           property: connectionString
       - key: REDIS_URL
         fromService:
-          name: {config.name}-redis
+          name: {name}-redis
           type: redis
           property: connectionString
       - fromGroup: shared-env"""
-        services.append(celery_beat)
 
-    if config.has_frontend:
-        frontend_service = f"""\
+_FRONTEND_SERVICE = """\
   - type: web
-    name: {config.name}-frontend
+    name: {name}-frontend
     runtime: static
     buildCommand: cd frontend && bun install && bun run build
     staticPublishPath: frontend/dist
@@ -120,29 +106,55 @@ def generate_render_yaml(config: ProjectConfig) -> str:
       - type: rewrite
         source: /*
         destination: /index.html"""
-        services.append(frontend_service)
 
-    env_groups.append("""\
+_ENV_GROUPS = """\
+envGroups:
   - name: shared-env
     envVars:
       - key: PYTHON_VERSION
         value: "3.12"
       - key: NODE_VERSION
-        value: "20" """)
+        value: "20\""""
 
-    # Assemble the full render.yaml
-    parts: list[str] = []
 
-    if services:
-        services_block = "\n\n".join(services)
-        parts.append(f"services:\n{services_block}")
+@cached_render
+def generate_render_yaml(config: ProjectConfig) -> str:
+    """Generate render.yaml Render Blueprint."""
+    values = {"name": config.name, "pkg": config.python_package_name}
+    services: list[str] = []
+    databases: list[str] = []
 
-    if databases:
-        databases_block = "\n\n".join(databases)
-        parts.append(f"databases:\n{databases_block}")
+    if config.has_backend:
+        backend_parts = [_BACKEND_BASE]
+        if config.use_redis:
+            backend_parts.append(_BACKEND_REDIS_ENV)
+        if config.has_frontend:
+            backend_parts.append(_BACKEND_CORS_ENV)
+        backend_parts.append(_BACKEND_FOOTER)
+        services.append("".join(backend_parts).format_map(values))
+        databases.append(_DATABASE.format_map(values))
 
-    if env_groups:
-        env_groups_block = "\n\n".join(g.rstrip() for g in env_groups)
-        parts.append(f"envGroups:\n{env_groups_block}")
+    if config.use_redis:
+        services.append(_REDIS_SERVICE.format_map(values))
+
+    if config.use_celery:
+        services.append(_CELERY_WORKER.format_map(values))
+        services.append(_CELERY_BEAT.format_map(values))
 
-    return "\n\n".join(parts) + "\n"
+    if config.has_frontend:
+        services.append(_FRONTEND_SERVICE.format_map(values))
+
+    # Assemble the full render.yaml in one buffer; sections are separated by a blank line
+    buf = io.StringIO()
+    w = buf.write
+    if services:
+        w("services:\n")
+        w("\n\n".join(services))
+        w("\n\n")
+    if databases:
+        w("databases:\n")
+        w("\n\n".join(databases))
+        w("\n\n")
+    w(_ENV_GROUPS)
+    w("\n")
+    return buf.getvalue()
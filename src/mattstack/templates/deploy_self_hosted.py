@@ -2,190 +2,127 @@
 
 from __future__ import annotations
 
-from mattstack.config import ProjectConfig
-
+import io
 
-def generate_self_hosted_compose(config: ProjectConfig) -> str:
-    """Generate docker-compose.prod.yml for self-hosted with nginx."""
-    pkg = config.python_package_name
-    lines: list[str] = [
-        "version: '3.8'",
-        "",
-        "services:",
-        "  nginx:",
-        "    image: nginx:alpine",
-        "    restart: unless-stopped",
-        "    ports:",
-        '      - "80:80"',
-        '      - "443:443"',
-        "    volumes:",
-        "      - ./nginx.conf:/etc/nginx/conf.d/default.conf",
-        "      - ./certbot/conf:/etc/letsencrypt",
-        "      - ./certbot/www:/var/www/certbot",
-        "    depends_on:",
-    ]
-
-    if config.has_backend:
-        lines.append("      - api")
-    if config.has_frontend:
-        lines.append("      - frontend")
-
-    lines.extend(
-        [
-            "",
-            "  certbot:",
-            "    image: certbot/certbot",
-            "    entrypoint: \"/bin/sh -c 'trap exit TERM; while :; "
-            "do certbot renew; sleep 12h & wait $${!}; done;'\"",
-            "    volumes:",
-            "      - ./certbot/conf:/etc/letsencrypt",
-            "      - ./certbot/www:/var/www/certbot",
-        ]
-    )
-
-    if config.has_backend:
-        lines.extend(
-            [
-                "",
-                "  api:",
-                "    build: ./backend",
-                f"    command: gunicorn {pkg}.wsgi:application --bind 0.0.0.0:8000",
-                "    restart: unless-stopped",
-                "    env_file: .env",
-                "    expose:",
-                '      - "8000"',
-                "    depends_on:",
-                "      - db",
-            ]
-        )
-        if config.use_redis:
-            lines.append("      - redis")
-
-    lines.extend(
-        [
-            "",
-            "  db:",
-            "    image: postgres:16-alpine",
-            "    restart: unless-stopped",
-            "    volumes:",
-            "      - postgres_data:/var/lib/postgresql/data",
-            "    environment:",
-            "      POSTGRES_DB: ${POSTGRES_DB:-app}",
-            "      POSTGRES_USER: ${POSTGRES_USER:-postgres}",
-            "      POSTGRES_PASSWORD: ${POSTGRES_PASSWORD:-postgres}",
-        ]
-    )
+from mattstack.config import ProjectConfig
+from mattstack.templates import cached_render
+from mattstack.templates.vps_compose import build_compose
+
+# Static compose blocks specific to this target; shared services live in vps_compose
+_NGINX_SERVICE = """\
+version: '3.8'
+
+services:
+  nginx:
+    image: nginx:alpine
+    restart: unless-stopped
+    ports:
+      - "80:80"
+      - "443:443"
+    volumes:
+      - ./nginx.conf:/etc/nginx/conf.d/default.conf
+      - ./certbot/conf:/etc/letsencrypt
+      - ./certbot/www:/var/www/certbot
+    depends_on:
+"""
 
-    if config.use_redis:
-        lines.extend(
-            [
-                "",
-                "  redis:",
-                "    image: redis:7-alpine",
-                "    restart: unless-stopped",
-            ]
-        )
+_CERTBOT_SERVICE = """
+  certbot:
+    image: certbot/certbot
+    entrypoint: "/bin/sh -c 'trap exit TERM; while :; \
+do certbot renew; sleep 12h & wait $${!}; done;'"
+    volumes:
+      - ./certbot/conf:/etc/letsencrypt
+      - ./certbot/www:/var/www/certbot
+"""
 
-    if config.has_frontend:
-        lines.extend(
-            [
-                "",
-                "  frontend:",
-                "    build: ./frontend",
-                "    restart: unless-stopped",
-                "    expose:",
-                '      - "3000"',
-            ]
-        )
+_VOLUMES = """
+volumes:
+  postgres_data:
+"""
 
-    lines.extend(
-        [
-            "",
-            "volumes:",
-            "  postgres_data:",
-        ]
-    )
 
-    return "\n".join(lines) + "\n"
+@cached_render
+def generate_self_hosted_compose(config: ProjectConfig) -> str:
+    """Generate docker-compose.prod.yml for self-hosted with nginx."""
+    return build_compose(config, _NGINX_SERVICE, _VOLUMES, _CERTBOT_SERVICE)
 
 
+@cached_render
 def generate_nginx_conf(config: ProjectConfig) -> str:
     """Generate nginx reverse proxy config."""
-    lines: list[str] = [
-        "server {",
-        "    listen 80;",
-        f"    server_name {config.name}.example.com;",
-        "",
-        "    # Certbot challenge",
-        "    location /.well-known/acme-challenge/ {",
-        "        root /var/www/certbot;",
-        "    }",
-        "",
-        "    location / {",
-        "        return 301 https://$host$request_uri;",
-        "    }",
-        "}",
-        "",
-        "server {",
-        "    listen 443 ssl;",
-        f"    server_name {config.name}.example.com;",
-        "",
-        f"    ssl_certificate /etc/letsencrypt/live/{config.name}.example.com/fullchain.pem;",
-        f"    ssl_certificate_key /etc/letsencrypt/live/{config.name}.example.com/privkey.pem;",
-        "",
-    ]
+    buf = io.StringIO()
+    w = buf.write
+    w(
+        "server {\n"
+        "    listen 80;\n"
+        f"    server_name {config.name}.example.com;\n"
+        "\n"
+        "    # Certbot challenge\n"
+        "    location /.well-known/acme-challenge/ {\n"
+        "        root /var/www/certbot;\n"
+        "    }\n"
+        "\n"
+        "    location / {\n"
+        "        return 301 https://$host$request_uri;\n"
+        "    }\n"
+        "}\n"
+        "\n"
+        "server {\n"
+        "    listen 443 ssl;\n"
+        f"    server_name {config.name}.example.com;\n"
+        "\n"
+        f"    ssl_certificate /etc/letsencrypt/live/{config.name}.example.com/fullchain.pem;\n"
+        f"    ssl_certificate_key /etc/letsencrypt/live/{config.name}.example.com/privkey.pem;\n"
+        "\n"
+    )
 
     if config.has_backend and config.has_frontend:
-        lines.extend(
-            [
-                "    location /api/ {",
-                "        proxy_pass http://api:8000;",
-                "        proxy_set_header Host $host;",
-                "        proxy_set_header X-Real-IP $remote_addr;",
-                "        proxy_set_header X-Forwarded-For $proxy_add_x_forwarded_for;",
-                "        proxy_set_header X-Forwarded-Proto $scheme;",
-                "    }",
-                "",
-                "    location /admin/ {",
-                "        proxy_pass http://api:8000;",
-                "        proxy_set_header Host $host;",
-                "        proxy_set_header X-Real-IP $remote_addr;",
-                "    }",
-                "",
-                "    location / {",
-                "        proxy_pass http://frontend:3000;",
-                "        proxy_set_header Host $host;",
-                "        proxy_set_header X-Real-IP $remote_addr;",
-                "    }",
-            ]
+        w(
+            "    location /api/ {\n"
+            "        proxy_pass http://api:8000;\n"
+            "        proxy_set_header Host $host;\n"
+            "        proxy_set_header X-Real-IP $remote_addr;\n"
+            "        proxy_set_header X-Forwarded-For $proxy_add_x_forwarded_for;\n"
+            "        proxy_set_header X-Forwarded-Proto $scheme;\n"
+            "    }\n"
+            "\n"
+            "    location /admin/ {\n"
+            "        proxy_pass http://api:8000;\n"
+            "        proxy_set_header Host $host;\n"
+            "        proxy_set_header X-Real-IP $remote_addr;\n"
+            "    }\n"
+            "\n"
+            "    location / {\n"
+            "        proxy_pass http://frontend:3000;\n"
+            "        proxy_set_header Host $host;\n"
+            "        proxy_set_header X-Real-IP $remote_addr;\n"
+            "    }\n"
         )
     elif config.has_backend:
-        lines.extend(
-            [
-                "    location / {",
-                "        proxy_pass http://api:8000;",
-                "        proxy_set_header Host $host;",
-                "        proxy_set_header X-Real-IP $remote_addr;",
-                "        proxy_set_header X-Forwarded-For $proxy_add_x_forwarded_for;",
-                "        proxy_set_header X-Forwarded-Proto $scheme;",
-                "    }",
-            ]
+        w(
+            "    location / {\n"
+            "        proxy_pass http://api:8000;\n"
+            "        proxy_set_header Host $host;\n"
+            "        proxy_set_header X-Real-IP $remote_addr;\n"
+            "        proxy_set_header X-Forwarded-For $proxy_add_x_forwarded_for;\n"
+            "        proxy_set_header X-Forwarded-Proto $scheme;\n"
+            "    }\n"
         )
     elif config.has_frontend:
-        lines.extend(
-            [
-                "    location / {",
-                "        proxy_pass http://frontend:3000;",
-                "        proxy_set_header Host $host;",
-                "        proxy_set_header X-Real-IP $remote_addr;",
-                "    }",
-            ]
+        w(
+            "    location / {\n"
+            "        proxy_pass http://frontend:3000;\n"
+            "        proxy_set_header Host $host;\n"
+            "        proxy_set_header X-Real-IP $remote_addr;\n"
+            "    }\n"
         )
 
-    lines.append("}")
-    return "\n".join(lines) + "\n"
+    w("}\n")
+    return buf.getvalue()
 
 
+@cached_render
 def generate_systemd_service(config: ProjectConfig) -> str:
     """Generate systemd unit file for docker-compose."""
     return f"""\
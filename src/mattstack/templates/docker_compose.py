@@ -3,51 +3,15 @@
 from __future__ import annotations
 
 from mattstack.config import ProjectConfig
+from mattstack.templates import cached_render
+from mattstack.templates.compose_common import DEPENDS_DB, DEPENDS_DB_REDIS
 
-
-def generate_docker_compose(config: ProjectConfig) -> str:
-    """Generate docker-compose.yml for development."""
-    services: list[str] = []
-    volumes: list[str] = []
-
-    if config.has_backend:
-        services.append(_db_service(config))
-        volumes.append("  postgres_data:")
-
-        if config.use_redis:
-            services.append(_redis_service())
-            volumes.append("  redis_data:")
-
-        services.append(_api_dev_service(config))
-
-        if config.use_celery:
-            services.append(_celery_worker_service(config))
-            services.append(_celery_beat_service(config))
-
-    if config.has_frontend:
-        services.append(_frontend_dev_service(config))
-
-    services_block = "\n\n".join(services)
-    volumes_block = "\n".join(volumes)
-
-    result = f"""services:
-{services_block}"""
-
-    if volumes:
-        result += f"""
-
-volumes:
-{volumes_block}"""
-
-    return result
-
-
-def _db_service(config: ProjectConfig) -> str:
-    return f"""\
+# Service blocks; those with placeholders are filled with .format(pkg=..., ...)
+_DB_SERVICE = """\
   db:
     image: postgres:17-alpine
     environment:
-      POSTGRES_DB: ${{POSTGRES_DB:-{config.python_package_name}}}
+      POSTGRES_DB: ${{POSTGRES_DB:-{pkg}}}
       POSTGRES_USER: ${{POSTGRES_USER:-postgres}}
       POSTGRES_PASSWORD: ${{POSTGRES_PASSWORD:-postgres}}
     ports:
@@ -60,9 +24,7 @@ def _db_service(config: ProjectConfig) -> str:
       timeout: 5s
       retries: 5"""
 
-
-def _redis_service() -> str:
-    return """\
+_REDIS_SERVICE = """\
   redis:
     image: redis:7-alpine
     ports:
@@ -75,28 +37,7 @@ def _redis_service() -> str:
       timeout: 5s
       retries: 5"""
 
-
-def _api_dev_service(config: ProjectConfig) -> str:
-    depends = ["db"]
-    if config.use_redis:
-        depends.append("redis")
-
-    depends_block = "\n".join(
-        f"      {dep}:\n        condition: service_healthy" for dep in depends
-    )
-
-    env_lines = [
-        "      DEBUG=true",
-        f"      DATABASE_URL=postgres://postgres:postgres@db:5432/{config.python_package_name}",
-        "      DJANGO_SECRET_KEY=${DJANGO_SECRET_KEY:-change-me-in-production}",
-    ]
-    if config.use_redis:
-        env_lines.append("      REDIS_URL=redis://redis:6379/0")
-    env_lines.append("      CORS_ALLOWED_ORIGINS=http://localhost:3000,http://localhost:5173")
-
-    env_block = "\n".join(env_lines)
-
-    return f"""\
+_API_DEV_SERVICE = """\
   api-dev:
     build:
       context: ./backend
@@ -107,90 +48,117 @@ def _api_dev_service(config: ProjectConfig) -> str:
     volumes:
       - ./backend:/app
     environment:
-{env_block}
+      DEBUG=true
+      DATABASE_URL=postgres://postgres:postgres@db:5432/{pkg}
+      DJANGO_SECRET_KEY=${{DJANGO_SECRET_KEY:-change-me-in-production}}
+{redis_env}      CORS_ALLOWED_ORIGINS=http://localhost:3000,http://localhost:5173
     depends_on:
-{depends_block}"""
-
+{depends}"""
 
-def _celery_worker_service(config: ProjectConfig) -> str:
-    return f"""\
+_CELERY_WORKER_SERVICE = """\
   celery-worker:
     build:
       context: ./backend
       dockerfile: Dockerfile
-    command: uv run celery -A {config.python_package_name} worker -l info
+    command: uv run celery -A {pkg} worker -l info
     volumes:
       - ./backend:/app
     environment:
-      DATABASE_URL: postgres://postgres:postgres@db:5432/{config.python_package_name}
+      DATABASE_URL: postgres://postgres:postgres@db:5432/{pkg}
       REDIS_URL: redis://redis:6379/0
     depends_on:
-      db:
-        condition: service_healthy
-      redis:
-        condition: service_healthy
+{depends}
     profiles:
       - celery"""
 
-
-def _celery_beat_service(config: ProjectConfig) -> str:
-    return f"""\
+_CELERY_BEAT_SERVICE = """\
   celery-beat:
     build:
       context: ./backend
       dockerfile: Dockerfile
-    command: uv run celery -A {config.python_package_name} beat -l info
+    command: uv run celery -A {pkg} beat -l info
     volumes:
       - ./backend:/app
     environment:
-      DATABASE_URL: postgres://postgres:postgres@db:5432/{config.python_package_name}
+      DATABASE_URL: postgres://postgres:postgres@db:5432/{pkg}
       REDIS_URL: redis://redis:6379/0
     depends_on:
-      db:
-        condition: service_healthy
-      redis:
-        condition: service_healthy
+{depends}
     profiles:
       - celery"""
 
 
-def _frontend_dev_service(config: ProjectConfig) -> str:
-    depends = ""
+@cached_render
+def generate_docker_compose(config: ProjectConfig) -> str:
+    """Generate docker-compose.yml for development."""
+    pkg = config.python_package_name
+    services: list[str] = []
+    volumes: list[str] = []
+
     if config.has_backend:
-        depends = """
-    depends_on:
-      - api-dev"""
+        services.append(_DB_SERVICE.format(pkg=pkg))
+        volumes.append("  postgres_data:")
+
+        if config.use_redis:
+            services.append(_REDIS_SERVICE)
+            volumes.append("  redis_data:")
+
+        services.append(
+            _API_DEV_SERVICE.format(
+                pkg=pkg,
+                redis_env="      REDIS_URL=redis://redis:6379/0\n" if config.use_redis else "",
+                depends=DEPENDS_DB_REDIS if config.use_redis else DEPENDS_DB,
+            )
+        )
+
+        if config.use_celery:
+            services.append(_CELERY_WORKER_SERVICE.format(pkg=pkg, depends=DEPENDS_DB_REDIS))
+            services.append(_CELERY_BEAT_SERVICE.format(pkg=pkg, depends=DEPENDS_DB_REDIS))
+
+    if config.has_frontend:
+        services.append(_frontend_dev_service(config))
+
+    parts = ["services:", "\n\n".join(services)]
+    if volumes:
+        parts += ["", "volumes:", "\n".join(volumes)]
+    return "\n".join(parts)
+
+
+def _frontend_dev_service(config: ProjectConfig) -> str:
+    depends = "    depends_on:\n      - api-dev" if config.has_backend else ""
 
     if config.is_nextjs:
         env_block = ""
         if config.has_backend:
-            env_block = """
+            env_block = """\
     environment:
       NEXT_PUBLIC_API_BASE_URL: http://localhost:8000/api/v1"""
-        return f"""\
+        base = """\
   frontend-dev:
     build:
       context: ./frontend
       dockerfile: Dockerfile
     command: bun run dev
     ports:
-      - "${{FRONTEND_PORT:-3000}}:3000"
+      - "${FRONTEND_PORT:-3000}:3000"
     volumes:
       - ./frontend:/app
       - /app/node_modules
-      - /app/.next{env_block}{depends}"""
+      - /app/.next"""
+        return "\n".join(filter(None, [base, env_block, depends]))
 
-    return f"""\
+    base = """\
   frontend-dev:
     build:
       context: ./frontend
       dockerfile: Dockerfile.dev
     command: bun run dev --host
     ports:
-      - "${{FRONTEND_PORT:-3000}}:3000"
+      - "${FRONTEND_PORT:-3000}:3000"
     volumes:
       - ./frontend:/app
       - /app/node_modules
     environment:
       VITE_API_BASE_URL: http://localhost:8000/api/v1
-      VITE_MODE: django-spa{depends}"""
+      VITE_MODE: django-spa"""
+    return "\n".join(filter(None, [base, depends]))
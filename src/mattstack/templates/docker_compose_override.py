@@ -3,10 +3,17 @@
 from __future__ import annotations
 
 from mattstack.config import ProjectConfig
+from mattstack.templates.frontend_flavor import NEXTJS_FLAVOR, VITE_FLAVOR, frontend_flavor
 
 
 def generate_docker_compose_override(config: ProjectConfig) -> str:
     """Generate docker-compose.override.yml.example for per-developer customization."""
+    env_var = frontend_flavor(config).api_env_key if config.has_frontend else None
+    return _OVERRIDES[(config.has_backend, env_var)]
+
+
+def _render_override(has_backend: bool, env_var: str | None) -> str:
+    """Render the example; ``env_var`` is the frontend API URL key, or None without a frontend."""
     lines = [
         "# docker-compose.override.yml",
         "# Copy this file to docker-compose.override.yml for local customization.",
@@ -17,7 +24,7 @@ def generate_docker_compose_override(config: ProjectConfig) -> str:
         "services:",
     ]
 
-    if config.has_backend:
+    if has_backend:
         lines.extend(
             [
                 "  # api-dev:",
@@ -32,8 +39,7 @@ def generate_docker_compose_override(config: ProjectConfig) -> str:
             ]
         )
 
-    if config.has_frontend:
-        env_var = "NEXT_PUBLIC_API_BASE_URL" if config.is_nextjs else "VITE_API_BASE_URL"
+    if env_var is not None:
         lines.extend(
             [
                 "  # frontend-dev:",
@@ -57,3 +63,11 @@ def generate_docker_compose_override(config: ProjectConfig) -> str:
     )
 
     return "\n".join(lines) + "\n"
+
+
+# Every (has_backend, frontend env var) combination, rendered once at import
+_OVERRIDES: dict[tuple[bool, str | None], str] = {
+    (has_backend, env_var): _render_override(has_backend, env_var)
+    for has_backend in (False, True)
+    for env_var in (None, NEXTJS_FLAVOR.api_env_key, VITE_FLAVOR.api_env_key)
+}
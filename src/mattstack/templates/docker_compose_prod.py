@@ -3,51 +3,15 @@
 from __future__ import annotations
 
 from mattstack.config import ProjectConfig
+from mattstack.templates import cached_render
+from mattstack.templates.compose_common import DEPENDS_DB, DEPENDS_DB_REDIS
 
-
-def generate_docker_compose_prod(config: ProjectConfig) -> str:
-    """Generate docker-compose.prod.yml."""
-    services: list[str] = []
-    volumes: list[str] = []
-
-    if config.has_backend:
-        services.append(_db_service(config))
-        volumes.append("  postgres_data:")
-
-        if config.use_redis:
-            services.append(_redis_service())
-            volumes.append("  redis_data:")
-
-        services.append(_api_service(config))
-
-        if config.use_celery:
-            services.append(_celery_worker_service(config))
-            services.append(_celery_beat_service(config))
-
-    if config.has_frontend:
-        services.append(_frontend_service(config))
-
-    services_block = "\n\n".join(services)
-    volumes_block = "\n".join(volumes)
-
-    result = f"""services:
-{services_block}"""
-
-    if volumes:
-        result += f"""
-
-volumes:
-{volumes_block}"""
-
-    return result
-
-
-def _db_service(config: ProjectConfig) -> str:
-    return f"""\
+# Service blocks; those with placeholders are filled with .format(pkg=..., depends=...)
+_DB_SERVICE = """\
   db:
     image: postgres:17-alpine
     environment:
-      POSTGRES_DB: ${{POSTGRES_DB:-{config.python_package_name}}}
+      POSTGRES_DB: ${{POSTGRES_DB:-{pkg}}}
       POSTGRES_USER: ${{POSTGRES_USER:-postgres}}
       POSTGRES_PASSWORD: ${{POSTGRES_PASSWORD}}
     volumes:
@@ -59,9 +23,7 @@ def _db_service(config: ProjectConfig) -> str:
       retries: 5
     restart: unless-stopped"""
 
-
-def _redis_service() -> str:
-    return """\
+_REDIS_SERVICE = """\
   redis:
     image: redis:7-alpine
     volumes:
@@ -73,17 +35,7 @@ def _redis_service() -> str:
       retries: 5
     restart: unless-stopped"""
 
-
-def _api_service(config: ProjectConfig) -> str:
-    depends = ["db"]
-    if config.use_redis:
-        depends.append("redis")
-
-    depends_block = "\n".join(
-        f"      {dep}:\n        condition: service_healthy" for dep in depends
-    )
-
-    return f"""\
+_API_SERVICE = """\
   api:
     build:
       context: ./backend
@@ -92,51 +44,72 @@ def _api_service(config: ProjectConfig) -> str:
       - "${{API_PORT:-8000}}:8000"
     environment:
       DEBUG: "false"
-      DATABASE_URL: postgres://${{POSTGRES_USER:-postgres}}:${{POSTGRES_PASSWORD}}@db:5432/{config.python_package_name}
+      DATABASE_URL: postgres://${{POSTGRES_USER:-postgres}}:${{POSTGRES_PASSWORD}}@db:5432/{pkg}
       DJANGO_SECRET_KEY: ${{DJANGO_SECRET_KEY}}
       REDIS_URL: redis://redis:6379/0
       ALLOWED_HOSTS: ${{ALLOWED_HOSTS:-*}}
     depends_on:
-{depends_block}
+{depends}
     restart: unless-stopped"""
 
-
-def _celery_worker_service(config: ProjectConfig) -> str:
-    return f"""\
+_CELERY_WORKER_SERVICE = """\
   celery-worker:
     build:
       context: ./backend
       dockerfile: Dockerfile
-    command: uv run celery -A {config.python_package_name} worker -l warning --concurrency=4
+    command: uv run celery -A {pkg} worker -l warning --concurrency=4
     environment:
-      DATABASE_URL: postgres://${{POSTGRES_USER:-postgres}}:${{POSTGRES_PASSWORD}}@db:5432/{config.python_package_name}
+      DATABASE_URL: postgres://${{POSTGRES_USER:-postgres}}:${{POSTGRES_PASSWORD}}@db:5432/{pkg}
       REDIS_URL: redis://redis:6379/0
     depends_on:
-      db:
-        condition: service_healthy
-      redis:
-        condition: service_healthy
+{depends}
     restart: unless-stopped"""
 
-
-def _celery_beat_service(config: ProjectConfig) -> str:
-    return f"""\
+_CELERY_BEAT_SERVICE = """\
   celery-beat:
     build:
       context: ./backend
       dockerfile: Dockerfile
-    command: uv run celery -A {config.python_package_name} beat -l warning
+    command: uv run celery -A {pkg} beat -l warning
     environment:
-      DATABASE_URL: postgres://${{POSTGRES_USER:-postgres}}:${{POSTGRES_PASSWORD}}@db:5432/{config.python_package_name}
+      DATABASE_URL: postgres://${{POSTGRES_USER:-postgres}}:${{POSTGRES_PASSWORD}}@db:5432/{pkg}
       REDIS_URL: redis://redis:6379/0
     depends_on:
-      db:
-        condition: service_healthy
-      redis:
-        condition: service_healthy
+{depends}
     restart: unless-stopped"""
 
 
+@cached_render
+def generate_docker_compose_prod(config: ProjectConfig) -> str:
+    """Generate docker-compose.prod.yml."""
+    pkg = config.python_package_name
+    services: list[str] = []
+    volumes: list[str] = []
+
+    if config.has_backend:
+        services.append(_DB_SERVICE.format(pkg=pkg))
+        volumes.append("  postgres_data:")
+
+        if config.use_redis:
+            services.append(_REDIS_SERVICE)
+            volumes.append("  redis_data:")
+
+        depends = DEPENDS_DB_REDIS if config.use_redis else DEPENDS_DB
+        services.append(_API_SERVICE.format(pkg=pkg, depends=depends))
+
+        if config.use_celery:
+            services.append(_CELERY_WORKER_SERVICE.format(pkg=pkg, depends=DEPENDS_DB_REDIS))
+            services.append(_CELERY_BEAT_SERVICE.format(pkg=pkg, depends=DEPENDS_DB_REDIS))
+
+    if config.has_frontend:
+        services.append(_frontend_service(config))
+
+    parts = ["services:", "\n\n".join(services)]
+    if volumes:
+        parts += ["", "volumes:", "\n".join(volumes)]
+    return "\n".join(parts)
+
+
 def _frontend_service(config: ProjectConfig) -> str:
     lines = [
         "  frontend:",
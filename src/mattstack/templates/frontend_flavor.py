@@ -0,0 +1,35 @@
+"""Per-framework frontend values (Next.js vs Vite) shared by the deploy templates."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+
+from mattstack.config import ProjectConfig
+
+
+@dataclass(frozen=True, slots=True)
+class FrontendFlavor:
+    api_env_key: str  # env var holding the backend API base URL
+    build_output: str  # build output dir, relative to frontend/
+    pages_output: str  # Cloudflare Pages build output dir, relative to the repo root
+    pages_deploy_dir: str  # dir passed to `wrangler pages deploy`
+
+
+NEXTJS_FLAVOR = FrontendFlavor(
+    api_env_key="NEXT_PUBLIC_API_BASE_URL",
+    build_output=".next",
+    pages_output="frontend/.next/static",
+    pages_deploy_dir="out",
+)
+
+VITE_FLAVOR = FrontendFlavor(
+    api_env_key="VITE_API_BASE_URL",
+    build_output="dist",
+    pages_output="frontend/dist",
+    pages_deploy_dir="dist",
+)
+
+
+def frontend_flavor(config: ProjectConfig) -> FrontendFlavor:
+    """Return the frontend values for the project's framework."""
+    return NEXTJS_FLAVOR if config.is_nextjs else VITE_FLAVOR
@@ -6,17 +6,49 @@ import json
 
 from mattstack.config import ProjectConfig
 from mattstack.detected import DetectedProject
+from mattstack.templates import cached_render
+
+# .planning/config.json is fully static, so it is serialized once at import
+_GSD_CONFIG_JSON = (
+    json.dumps(
+        {
+            "mode": "interactive",
+            "depth": "standard",
+            "profile": "balanced",
+            "parallelization": {"enabled": True},
+            "planning": {"commit_docs": True},
+            "workflow": {
+                "research": True,
+                "plan_check": True,
+                "verifier": True,
+                "auto_advance": False,
+            },
+            "git": {
+                "branching_strategy": "none",
+            },
+        },
+        indent=2,
+    )
+    + "\n"
+)
 
 
+@cached_render
 def generate_gsd_project_md(config: ProjectConfig) -> str:
     """Generate PROJECT.md for GSD workflow."""
     sections = [
         _gsd_header(config),
         _gsd_vision(config),
         _gsd_stack(config),
-        _gsd_conventions(config),
-        _gsd_structure(config),
-        _gsd_commands(config),
+        _gsd_conventions("uv", "bun", has_backend=config.has_backend),
+        # Scaffolded backends always ship docker-compose.yml
+        _gsd_structure(
+            config.has_backend,
+            config.has_frontend,
+            config.is_nextjs,
+            has_compose=config.has_backend,
+        ),
+        _gsd_commands(has_backend=config.has_backend),
     ]
     return "\n\n".join(sections) + "\n"
 
@@ -31,78 +63,113 @@ def _gsd_vision(config: ProjectConfig) -> str:
 
 
 def _gsd_stack(config: ProjectConfig) -> str:
-    lines = ["## Stack"]
-    if config.has_backend:
-        lines.append("- Backend: Django + django-ninja (Python 3.12+, uv)")
-        lines.append("- Database: PostgreSQL 17 (Docker)")
-        if config.use_redis:
-            lines.append("- Cache: Redis 7 (Docker)")
-    if config.has_frontend:
-        if config.is_nextjs:
-            lines.append("- Frontend: Next.js + TypeScript (bun)")
-        else:
-            lines.append("- Frontend: React + Vite + TypeScript (bun)")
-    return "\n".join(lines)
-
-
-def _gsd_conventions(config: ProjectConfig) -> str:
-    lines = [
-        "## Conventions",
-        "- Package managers: uv (Python), bun (JavaScript)",
-        "- Linting: ruff (Python), eslint (JavaScript)",
-        "- Testing: pytest (Python), vitest (JavaScript)",
-    ]
-    if config.has_backend:
-        lines.append("- API style: django-ninja (Pydantic schemas, NOT DRF)")
-    lines.append("- Type safety: Python type hints, strict TypeScript")
-    return "\n".join(lines)
+    backend, redis = config.has_backend, config.has_backend and config.use_redis
+    frontend = "Next.js" if config.is_nextjs else "React + Vite"
+    return "\n".join(
+        filter(
+            None,
+            (
+                "## Stack",
+                "- Backend: Django + django-ninja (Python 3.12+, uv)" if backend else None,
+                "- Database: PostgreSQL 17 (Docker)" if backend else None,
+                "- Cache: Redis 7 (Docker)" if redis else None,
+                f"- Frontend: {frontend} + TypeScript (bun)" if config.has_frontend else None,
+            ),
+        )
+    )
 
 
-def _gsd_structure(config: ProjectConfig) -> str:
-    lines = ["## Project Structure"]
-    if config.has_backend:
-        lines.append("- `backend/` — Django API")
-    if config.has_frontend:
-        desc = "React SPA" if not config.is_nextjs else "Next.js app"
-        lines.append(f"- `frontend/` — {desc}")
-    if config.has_backend:
-        lines.append("- `docker-compose.yml` — Infrastructure")
-    lines.append("- `Makefile` — All commands")
-    lines.append("- `CLAUDE.md` — AI agent context")
-    return "\n".join(lines)
-
-
-def _gsd_commands(config: ProjectConfig) -> str:
-    lines = ["## Key Commands", "", "```bash"]
-    if config.has_backend:
-        lines.append("make setup && make up && make backend-migrate")
-    else:
-        lines.append("make setup")
-    lines.append("mattstack dev    # Start everything")
-    lines.append("mattstack test   # Run all tests")
-    lines.append("mattstack audit  # Static analysis")
-    lines.append("```")
-    return "\n".join(lines)
+# Sections shared by the scaffold (ProjectConfig) and rules (DetectedProject) paths
 
 
-def generate_gsd_state_md(config: ProjectConfig) -> str:
-    """Generate initial STATE.md for GSD workflow."""
+def _gsd_conventions(python_pm: str, js_pm: str, *, has_backend: bool) -> str:
+    return "\n".join(
+        filter(
+            None,
+            (
+                "## Conventions",
+                f"- Package managers: {python_pm} (Python), {js_pm} (JavaScript)",
+                "- Linting: ruff (Python), eslint (JavaScript)",
+                "- Testing: pytest (Python), vitest (JavaScript)",
+                "- API style: django-ninja (Pydantic schemas, NOT DRF)" if has_backend else None,
+                "- Type safety: Python type hints, strict TypeScript",
+            ),
+        )
+    )
+
+
+def _gsd_structure(
+    has_backend: bool, has_frontend: bool, is_nextjs: bool, *, has_compose: bool
+) -> str:
+    frontend = "Next.js app" if is_nextjs else "React SPA"
+    return "\n".join(
+        filter(
+            None,
+            (
+                "## Project Structure",
+                "- `backend/` — Django API" if has_backend else None,
+                f"- `frontend/` — {frontend}" if has_frontend else None,
+                "- `docker-compose.yml` — Infrastructure" if has_compose else None,
+                "- `Makefile` — All commands",
+                "- `CLAUDE.md` — AI agent context",
+            ),
+        )
+    )
+
+
+def _gsd_commands(*, has_backend: bool) -> str:
+    return "\n".join(
+        [
+            "## Key Commands",
+            "",
+            "```bash",
+            "make setup && make up && make backend-migrate" if has_backend else "make setup",
+            "mattstack dev    # Start everything",
+            "mattstack test   # Run all tests",
+            "mattstack audit  # Static analysis",
+            "```",
+        ]
+    )
+
+
+def _gsd_state_md(
+    origin: str,
+    python_pm: str,
+    js_pm: str,
+    api_framework: str | None,
+    frontend_framework: str | None,
+) -> str:
+    """Build STATE.md; ``origin`` finishes "Project ..." and ``None`` frameworks are omitted."""
     sections = [
         "# Project State",
         "",
         "## Current Phase",
-        "Initial setup complete. Project scaffolded with mattstack.",
+        f"Initial setup complete. Project {origin}.",
         "",
         "## Decisions",
-        "- Package managers: uv (Python), bun (JavaScript)",
+        f"- Package managers: {python_pm} (Python), {js_pm} (JavaScript)",
     ]
-    if config.has_backend:
-        sections.append("- API framework: django-ninja")
+    if api_framework is not None:
+        sections.append(f"- API framework: {api_framework}")
+    if frontend_framework is not None:
+        sections.append(f"- Frontend framework: {frontend_framework}")
+    sections.extend(["", "## Blockers", "None.", ""])  # trailing "" ends the file with \n
+    return "\n".join(sections)
+
+
+@cached_render
+def generate_gsd_state_md(config: ProjectConfig) -> str:
+    """Generate initial STATE.md for GSD workflow."""
+    frontend = None
     if config.has_frontend:
-        fw = "Next.js" if config.is_nextjs else "React Vite"
-        sections.append(f"- Frontend framework: {fw}")
-    sections.extend(["", "## Blockers", "None."])
-    return "\n".join(sections) + "\n"
+        frontend = "Next.js" if config.is_nextjs else "React Vite"
+    return _gsd_state_md(
+        "scaffolded with mattstack",
+        "uv",
+        "bun",
+        "django-ninja" if config.has_backend else None,
+        frontend,
+    )
 
 
 def generate_gsd_project_md_from_detected(project: DetectedProject) -> str:
@@ -111,9 +178,14 @@ def generate_gsd_project_md_from_detected(project: DetectedProject) -> str:
         f"# {project.display_name}",
         _gsd_vision_from_detected(project),
         _gsd_stack_from_detected(project),
-        _gsd_conventions_from_detected(project),
-        _gsd_structure_from_detected(project),
-        _gsd_commands_from_detected(project),
+        _gsd_conventions(project.python_pm, project.js_pm, has_backend=project.has_backend),
+        _gsd_structure(
+            project.has_backend,
+            project.has_frontend,
+            project.is_nextjs,
+            has_compose=project.has_docker,
+        ),
+        _gsd_commands(has_backend=project.has_backend),
     ]
     return "\n\n".join(sections) + "\n"
 
@@ -131,119 +203,46 @@ def _gsd_vision_from_detected(project: DetectedProject) -> str:
 
 
 def _gsd_stack_from_detected(project: DetectedProject) -> str:
-    lines = ["## Stack"]
-    if project.has_backend:
-        lines.append(f"- Backend: {project.backend_framework} (Python, {project.python_pm})")
-        lines.append("- Database: PostgreSQL (Docker)")
-        if project.use_redis:
-            lines.append("- Cache: Redis (Docker)")
-    if project.has_frontend:
-        fw = "Next.js" if project.is_nextjs else project.frontend_framework
-        lines.append(f"- Frontend: {fw} + TypeScript ({project.js_pm})")
-    return "\n".join(lines)
-
-
-def _gsd_conventions_from_detected(project: DetectedProject) -> str:
-    lines = [
-        "## Conventions",
-        f"- Package managers: {project.python_pm} (Python), {project.js_pm} (JavaScript)",
-        "- Linting: ruff (Python), eslint (JavaScript)",
-        "- Testing: pytest (Python), vitest (JavaScript)",
-    ]
-    if project.has_backend:
-        lines.append("- API style: django-ninja (Pydantic schemas, NOT DRF)")
-    lines.append("- Type safety: Python type hints, strict TypeScript")
-    return "\n".join(lines)
-
-
-def _gsd_structure_from_detected(project: DetectedProject) -> str:
-    lines = ["## Project Structure"]
-    if project.has_backend:
-        lines.append("- `backend/` — Django API")
-    if project.has_frontend:
-        desc = "React SPA" if not project.is_nextjs else "Next.js app"
-        lines.append(f"- `frontend/` — {desc}")
-    if project.has_docker:
-        lines.append("- `docker-compose.yml` — Infrastructure")
-    lines.extend(["- `Makefile` — All commands", "- `CLAUDE.md` — AI agent context"])
-    return "\n".join(lines)
-
-
-def _gsd_commands_from_detected(project: DetectedProject) -> str:
-    lines = ["## Key Commands", "", "```bash"]
-    if project.has_backend:
-        lines.append("make setup && make up && make backend-migrate")
-    else:
-        lines.append("make setup")
-    lines.extend(
-        [
-            "mattstack dev    # Start everything",
-            "mattstack test   # Run all tests",
-            "mattstack audit  # Static analysis",
-            "```",
-        ]
+    backend, redis = project.has_backend, project.has_backend and project.use_redis
+    frontend = "Next.js" if project.is_nextjs else project.frontend_framework
+    return "\n".join(
+        filter(
+            None,
+            (
+                "## Stack",
+                f"- Backend: {project.backend_framework} (Python, {project.python_pm})"
+                if backend
+                else None,
+                "- Database: PostgreSQL (Docker)" if backend else None,
+                "- Cache: Redis (Docker)" if redis else None,
+                f"- Frontend: {frontend} + TypeScript ({project.js_pm})"
+                if project.has_frontend
+                else None,
+            ),
+        )
     )
-    return "\n".join(lines)
 
 
 def generate_gsd_state_md_from_detected(project: DetectedProject) -> str:
     """Generate initial STATE.md from detected project state (for rules command)."""
-    sections = [
-        "# Project State",
-        "",
-        "## Current Phase",
-        "Initial setup complete. Project detected by mattstack rules.",
-        "",
-        "## Decisions",
-        f"- Package managers: {project.python_pm} (Python), {project.js_pm} (JavaScript)",
-    ]
-    if project.has_backend:
-        sections.append(f"- API framework: {project.backend_framework}")
+    frontend = None
     if project.has_frontend:
-        fw = "Next.js" if project.is_nextjs else project.frontend_framework
-        sections.append(f"- Frontend framework: {fw}")
-    sections.extend(["", "## Blockers", "None."])
-    return "\n".join(sections) + "\n"
+        frontend = "Next.js" if project.is_nextjs else project.frontend_framework
+    return _gsd_state_md(
+        "detected by mattstack rules",
+        project.python_pm,
+        project.js_pm,
+        project.backend_framework if project.has_backend else None,
+        frontend,
+    )
 
 
 def generate_gsd_config_json_static() -> str:
     """Generate .planning/config.json for GSD settings (no project config needed)."""
-    data = {
-        "mode": "interactive",
-        "depth": "standard",
-        "profile": "balanced",
-        "parallelization": {"enabled": True},
-        "planning": {"commit_docs": True},
-        "workflow": {
-            "research": True,
-            "plan_check": True,
-            "verifier": True,
-            "auto_advance": False,
-        },
-        "git": {
-            "branching_strategy": "none",
-        },
-    }
-    return json.dumps(data, indent=2) + "\n"
+    return _GSD_CONFIG_JSON
 
 
 def generate_gsd_config_json(config: ProjectConfig) -> str:
     """Generate .planning/config.json for GSD settings."""
     _ = config  # Reserved for future config-specific overrides
-    data = {
-        "mode": "interactive",
-        "depth": "standard",
-        "profile": "balanced",
-        "parallelization": {"enabled": True},
-        "planning": {"commit_docs": True},
-        "workflow": {
-            "research": True,
-            "plan_check": True,
-            "verifier": True,
-            "auto_advance": False,
-        },
-        "git": {
-            "branching_strategy": "none",
-        },
-    }
-    return json.dumps(data, indent=2) + "\n"
+    return _GSD_CONFIG_JSON
@@ -4,32 +4,24 @@ from __future__ import annotations
 
 from mattstack.config import ProjectConfig
 
-
-def generate_pre_commit_config(config: ProjectConfig) -> str:
-    """Generate .pre-commit-config.yaml content."""
-    repos: list[str] = []
-
-    # Common hooks
-    repos.append("""\
+_COMMON_HOOKS = """\
   - repo: https://github.com/pre-commit/pre-commit-hooks
     rev: v5.0.0
     hooks:
       - id: trailing-whitespace
       - id: end-of-file-fixer
       - id: check-yaml
-      - id: check-added-large-files""")
+      - id: check-added-large-files"""
 
-    if config.has_backend:
-        repos.append("""\
+_RUFF_HOOKS = """\
   - repo: https://github.com/astral-sh/ruff-pre-commit
     rev: v0.8.6
     hooks:
       - id: ruff
         args: [--fix]
-      - id: ruff-format""")
+      - id: ruff-format"""
 
-    if config.has_frontend:
-        repos.append("""\
+_PRETTIER_HOOKS = """\
   - repo: local
     hooks:
       - id: prettier
@@ -37,7 +29,27 @@ def generate_pre_commit_config(config: ProjectConfig) -> str:
         entry: bash -c 'cd frontend && bun run prettier --check .'
         language: system
         types_or: [javascript, jsx, ts, tsx, css, json, markdown]
-        pass_filenames: false""")
+        pass_filenames: false"""
+
 
+def _render_pre_commit_config(has_backend: bool, has_frontend: bool) -> str:
+    repos = [_COMMON_HOOKS]
+    if has_backend:
+        repos.append(_RUFF_HOOKS)
+    if has_frontend:
+        repos.append(_PRETTIER_HOOKS)
     repos_block = "\n".join(repos)
     return f"repos:\n{repos_block}\n"
+
+
+# Every (has_backend, has_frontend) combination, rendered once at import
+_PRE_COMMIT_CONFIGS: dict[tuple[bool, bool], str] = {
+    (has_backend, has_frontend): _render_pre_commit_config(has_backend, has_frontend)
+    for has_backend in (False, True)
+    for has_frontend in (False, True)
+}
+
+
+def generate_pre_commit_config(config: ProjectConfig) -> str:
+    """Generate .pre-commit-config.yaml content."""
+    return _PRE_COMMIT_CONFIGS[(config.has_backend, config.has_frontend)]
@@ -0,0 +1,52 @@
+"""Resolved per-render view of a ProjectConfig shared by the root templates."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+
+from mattstack.config import FrontendFramework, ProjectConfig
+from mattstack.templates.frontend_flavor import frontend_flavor
+
+
+@dataclass(frozen=True, slots=True)
+class RenderCtx:
+    """ProjectConfig values read by the markdown/Makefile section helpers.
+
+    Built once per render so the helpers read plain slots instead of
+    re-evaluating ProjectConfig properties and enum comparisons.
+    """
+
+    name: str
+    display_name: str
+    has_backend: bool
+    has_frontend: bool
+    is_fullstack: bool
+    is_nextjs: bool
+    is_b2b: bool
+    use_redis: bool
+    use_celery: bool
+    include_ios: bool
+    fw_label: str  # "Next.js" / "Vite"
+    router_label: str  # Vite router: "TanStack Router" / "React Router"
+    api_env_key: str
+
+    @classmethod
+    def from_config(cls, config: ProjectConfig) -> RenderCtx:
+        fw = config.frontend_framework
+        is_nextjs = fw == FrontendFramework.NEXTJS
+        router = "TanStack Router" if fw == FrontendFramework.REACT_VITE else "React Router"
+        return cls(
+            name=config.name,
+            display_name=config.display_name,
+            has_backend=config.has_backend,
+            has_frontend=config.has_frontend,
+            is_fullstack=config.is_fullstack,
+            is_nextjs=is_nextjs,
+            is_b2b=config.is_b2b,
+            use_redis=config.use_redis,
+            use_celery=config.use_celery,
+            include_ios=config.include_ios,
+            fw_label="Next.js" if is_nextjs else "Vite",
+            router_label=router,
+            api_env_key=frontend_flavor(config).api_env_key,
+        )
@@ -2,82 +2,110 @@
 
 from __future__ import annotations
 
-from mattstack.config import FrontendFramework, ProjectConfig
+from mattstack.config import ProjectConfig
+from mattstack.templates import cached_render
+from mattstack.templates.render_ctx import RenderCtx
 
+# Static sections
+_FRONTEND_NEXTJS = """## Frontend
 
-def generate_claude_md(config: ProjectConfig) -> str:
-    """Generate CLAUDE.md for AI assistant context."""
-    sections = [
-        _header(config),
-        _structure(config),
-        _tech(config),
-        _rules(config),
-        _commands(config),
-        _ports(config),
-        _env_vars(config),
-    ]
-
-    if config.has_backend:
-        sections.append(_backend(config))
-
-    if config.has_frontend:
-        sections.append(_frontend(config))
+- Language: TypeScript (strict mode)
+- Framework: Next.js (App Router)
+- Routing: App Router (file-based)
+- Package manager: bun (NEVER npm/yarn)
+- Styling: Tailwind CSS
+- API base: `NEXT_PUBLIC_API_BASE_URL` env var
+- API routes: `app/api/` directory
+- Dev server: `cd frontend && bun run dev` (Next.js dev server on port 3000)"""
 
-    if config.include_ios:
-        sections.append(_ios(config))
+_FRONTEND_VITE = """## Frontend
 
-    if config.has_backend:
-        sections.append(_docker_services(config))
+- Language: TypeScript (strict mode)
+- Framework: React 18 + Vite
+- Routing: TanStack Router
+- Package manager: bun (NEVER npm/yarn)
+- Styling: Tailwind CSS
+- API base: `VITE_API_BASE_URL` env var
+- State management: TanStack Query (server state)"""
 
-    sections.append(_mattstack_integration(config))
+_IOS = """## iOS
 
-    return "\n\n".join(sections) + "\n"
+- SwiftUI with MVVM pattern
+- Async/await networking
+- iOS 17+ minimum deployment target"""
 
+_MATTSTACK_INTEGRATION = """## mattstack Integration
 
-def _header(config: ProjectConfig) -> str:
-    variant = " (B2B)" if config.is_b2b else ""
-    return f"# {config.display_name}{variant}"
+This project was scaffolded with `mattstack`. The CLI provides unified commands:
+- `mattstack dev` — Start all services (Docker + backend + frontend)
+- `mattstack test` — Run all tests
+- `mattstack lint` — Lint all code
+- `mattstack env check` — Compare .env files
+- `mattstack audit` — Static analysis (quality, types, endpoints, tests, dependencies)"""
 
 
-def _structure(config: ProjectConfig) -> str:
-    parts: list[str] = []
-    if config.has_backend:
-        parts.append("- `backend/` — Django API (django-ninja, Python 3.12+)")
-    if config.has_frontend:
-        if config.is_nextjs:
-            parts.append("- `frontend/` — Next.js (App Router, TypeScript, Tailwind)")
+@cached_render
+def generate_claude_md(config: ProjectConfig) -> str:
+    """Generate CLAUDE.md for AI assistant context."""
+    ctx = RenderCtx.from_config(config)
+    sections = [_header, _structure, _tech, _rules, _commands, _ports, _env_vars]
+    if ctx.has_backend:
+        sections.append(_backend)
+    if ctx.has_frontend:
+        sections.append(_frontend)
+    if ctx.include_ios:
+        sections.append(_ios)
+    if ctx.has_backend:
+        sections.append(_docker_services)
+    sections.append(_mattstack_integration)
+
+    # Every section appends its lines to one list; the "" after each becomes the
+    # blank line between sections, and the last one ends the file with a newline.
+    out: list[str] = []
+    for section in sections:
+        section(ctx, out)
+        out.append("")
+    return "\n".join(out)
+
+
+def _header(ctx: RenderCtx, out: list[str]) -> None:
+    variant = " (B2B)" if ctx.is_b2b else ""
+    out.append(f"# {ctx.display_name}{variant}")
+
+
+def _structure(ctx: RenderCtx, out: list[str]) -> None:
+    out += ["## Structure", ""]
+    if ctx.has_backend:
+        out.append("- `backend/` — Django API (django-ninja, Python 3.12+)")
+    if ctx.has_frontend:
+        if ctx.is_nextjs:
+            out.append("- `frontend/` — Next.js (App Router, TypeScript, Tailwind)")
         else:
-            fw = config.frontend_framework
-            router = "TanStack Router" if fw == FrontendFramework.REACT_VITE else "React Router"
-            parts.append(f"- `frontend/` — React + Vite + TypeScript ({router})")
-    if config.has_backend:
-        services = ["PostgreSQL 17"]
-        if config.use_redis:
-            services.append("Redis 7")
-        parts.append(f"- `docker-compose.yml` — {', '.join(services)}")
-    if config.include_ios:
-        parts.append("- `ios/` — SwiftUI iOS client (iOS 17+)")
-    return "## Structure\n\n" + "\n".join(parts)
-
-
-def _tech(config: ProjectConfig) -> str:
-    parts: list[str] = []
-    if config.has_backend:
-        parts.append("- Backend: Python 3.12+, Django, django-ninja, PostgreSQL 17")
-        if config.use_celery:
-            parts.append("- Background: Celery + Redis")
-    if config.has_frontend:
-        if config.is_nextjs:
-            parts.append("- Frontend: Next.js (App Router), TypeScript (strict)")
+            out.append(f"- `frontend/` — React + Vite + TypeScript ({ctx.router_label})")
+    if ctx.has_backend:
+        services = "PostgreSQL 17, Redis 7" if ctx.use_redis else "PostgreSQL 17"
+        out.append(f"- `docker-compose.yml` — {services}")
+    if ctx.include_ios:
+        out.append("- `ios/` — SwiftUI iOS client (iOS 17+)")
+
+
+def _tech(ctx: RenderCtx, out: list[str]) -> None:
+    out += ["## Tech Stack", ""]
+    if ctx.has_backend:
+        out.append("- Backend: Python 3.12+, Django, django-ninja, PostgreSQL 17")
+        if ctx.use_celery:
+            out.append("- Background: Celery + Redis")
+    if ctx.has_frontend:
+        if ctx.is_nextjs:
+            out.append("- Frontend: Next.js (App Router), TypeScript (strict)")
         else:
-            parts.append("- Frontend: React 18, Vite, TypeScript (strict)")
-    if config.include_ios:
-        parts.append("- iOS: SwiftUI, MVVM, async/await, iOS 17+")
-    return "## Tech Stack\n\n" + "\n".join(parts)
+            out.append("- Frontend: React 18, Vite, TypeScript (strict)")
+    if ctx.include_ios:
+        out.append("- iOS: SwiftUI, MVVM, async/await, iOS 17+")
 
 
-def _rules(config: ProjectConfig) -> str:
-    lines: list[str] = [
+def _rules(ctx: RenderCtx, out: list[str]) -> None:
+    out += [
         "## Rules",
         "",
         "**CRITICAL — AI agents MUST follow these rules:**",
@@ -86,122 +114,122 @@ def _rules(config: ProjectConfig) -> str:
         "- **JavaScript packages**: ALWAYS use `bun`. NEVER use `npm`, `yarn`, or `pnpm`.",
     ]
 
-    if config.has_backend:
-        docker_rule = (
+    if ctx.has_backend:
+        out += [
             "- **Docker**: Run `docker compose up -d` before dev servers. "
-            "NEVER install PostgreSQL or Redis locally."
-        )
-        lines.append(docker_rule)
-        lines.append(
+            "NEVER install PostgreSQL or Redis locally.",
             "- **API framework**: Backend uses django-ninja (Pydantic models, type-safe). "
-            "NEVER use Django REST Framework serializers."
-        )
-        lines.append(
+            "NEVER use Django REST Framework serializers.",
             "- **Migrations**: ALWAYS run `cd backend && uv run python manage.py makemigrations "
-            "&& uv run python manage.py migrate` after model changes."
-        )
-
-    lines.append("- **Type safety**: ALWAYS use type hints (Python). ALWAYS use strict TypeScript.")
-
-    if config.is_fullstack:
-        lines.append("- **Testing**: `uv run pytest -v` in backend, `bun run test` in frontend.")
-        lines.append("- **Linting**: `uv run ruff check .` in backend, `bun run lint` in frontend.")
-        fmt = "`uv run ruff format .` in backend, `bun run format` in frontend."
-        lines.append(f"- **Formatting**: {fmt}")
-    elif config.has_backend:
-        lines.append("- **Testing**: Run `uv run pytest -v` in `backend/`.")
-        lines.append("- **Linting**: Run `uv run ruff check .` in `backend/`.")
-        lines.append("- **Formatting**: Run `uv run ruff format .` in `backend/`.")
+            "&& uv run python manage.py migrate` after model changes.",
+        ]
+
+    out.append("- **Type safety**: ALWAYS use type hints (Python). ALWAYS use strict TypeScript.")
+
+    if ctx.is_fullstack:
+        out += [
+            "- **Testing**: `uv run pytest -v` in backend, `bun run test` in frontend.",
+            "- **Linting**: `uv run ruff check .` in backend, `bun run lint` in frontend.",
+            "- **Formatting**: `uv run ruff format .` in backend, `bun run format` in frontend.",
+        ]
+    elif ctx.has_backend:
+        out += [
+            "- **Testing**: Run `uv run pytest -v` in `backend/`.",
+            "- **Linting**: Run `uv run ruff check .` in `backend/`.",
+            "- **Formatting**: Run `uv run ruff format .` in `backend/`.",
+        ]
     else:
-        lines.append("- **Testing**: Run `bun run test` in `frontend/`.")
-        lines.append("- **Linting**: Run `bun run lint` in `frontend/`.")
-        lines.append("- **Formatting**: Run `bun run format` in `frontend/`.")
-
-    env_desc = _env_files_description(config)
-    if env_desc:
-        lines.append(f"- **Env files**: {env_desc}")
+        out += [
+            "- **Testing**: Run `bun run test` in `frontend/`.",
+            "- **Linting**: Run `bun run lint` in `frontend/`.",
+            "- **Formatting**: Run `bun run format` in `frontend/`.",
+        ]
+
+    if ctx.has_backend and ctx.has_frontend:
+        out.append(
+            "- **Env files**: Root `.env` for Docker services. "
+            "`frontend/.env.local` for frontend-specific vars."
+        )
+    elif ctx.has_backend:
+        out.append("- **Env files**: Root `.env` for Django and Docker services.")
+    elif ctx.has_frontend:
+        out.append("- **Env files**: `frontend/.env.local` for frontend-specific vars.")
 
-    lines.append(
+    out.append(
         "- **mattstack**: `mattstack dev` (start all), `mattstack test`, "
         "`mattstack lint`, `mattstack audit`."
     )
 
-    return "\n".join(lines)
-
-
-def _env_files_description(config: ProjectConfig) -> str:
-    if config.has_backend and config.has_frontend:
-        return "Root `.env` for Docker services. `frontend/.env.local` for frontend-specific vars."
-    if config.has_backend:
-        return "Root `.env` for Django and Docker services."
-    if config.has_frontend:
-        return "`frontend/.env.local` for frontend-specific vars."
-    return ""
-
 
-def _commands(config: ProjectConfig) -> str:
-    lines = [
+def _commands(ctx: RenderCtx, out: list[str]) -> None:
+    out += [
         "## Commands",
         "",
         "```bash",
         "make setup              # Install all dependencies",
     ]
-    if config.has_backend:
-        lines.append("make up                 # Start Docker services (PostgreSQL, Redis)")
-        lines.append("make down               # Stop Docker services")
-    if config.has_backend:
-        lines.append("make backend-dev        # Django dev server (port 8000)")
-    if config.has_frontend:
-        label = "Next.js" if config.is_nextjs else "Vite"
-        lines.append(f"make frontend-dev       # {label} dev server (port 3000)")
-    if config.is_fullstack:
+    if ctx.has_backend:
+        out += [
+            "make up                 # Start Docker services (PostgreSQL, Redis)",
+            "make down               # Stop Docker services",
+            "make backend-dev        # Django dev server (port 8000)",
+        ]
+    if ctx.has_frontend:
+        out.append(f"make frontend-dev       # {ctx.fw_label} dev server (port 3000)")
+    if ctx.is_fullstack:
         dev_desc = "Start all dev servers (docker + backend + frontend)"
-    elif config.has_backend:
+    elif ctx.has_backend:
         dev_desc = "Start dev servers (docker + backend)"
     else:
         dev_desc = "Start frontend dev server"
-    test_desc = "Run all tests (backend + frontend)" if config.is_fullstack else "Run tests"
-    lines.append(f"mattstack dev          # {dev_desc}")
-    lines.append(f"mattstack test         # {test_desc}")
-    lines.append("mattstack lint         # Lint all code")
-    lines.append("mattstack lint --fix   # Auto-fix lint issues")
-    lines.append("mattstack env check    # Verify .env files are in sync")
-    lines.append("mattstack audit        # Run static analysis")
-    lines.append("```")
-    return "\n".join(lines)
-
-
-def _ports(config: ProjectConfig) -> str:
-    rows: list[tuple[str, str, str]] = []
-    if config.has_backend:
-        rows.append(("Django API", "8000", "http://localhost:8000"))
-        rows.append(("PostgreSQL", "5432", "—"))
-        if config.use_redis:
-            rows.append(("Redis", "6379", "—"))
-        rows.append(("API Docs", "8000", "http://localhost:8000/api/docs"))
-    if config.has_frontend:
-        rows.append(("Frontend", "3000", "http://localhost:3000"))
-    if not rows:
-        return ""
-    table = "| Service | Port | URL |\n|---------|------|-----|\n"
-    table += "\n".join(f"| {svc} | {port} | {url} |" for svc, port, url in rows)
-    return "## Ports\n\n" + table
-
-
-def _env_vars(config: ProjectConfig) -> str:
-    parts: list[str] = ["## Environment Variables", ""]
-    if config.has_backend:
-        parts.append("- Root `.env`: `DATABASE_URL`, `DJANGO_SECRET_KEY`, `REDIS_URL` (if Redis)")
-    if config.has_frontend:
-        api_var = "NEXT_PUBLIC_API_BASE_URL" if config.is_nextjs else "VITE_API_BASE_URL"
-        parts.append(f"- Frontend: `{api_var}` for API base URL")
-    if not config.has_backend and not config.has_frontend:
-        return ""
-    return "\n".join(parts)
-
-
-def _backend(config: ProjectConfig) -> str:
-    lines = [
+    test_desc = "Run all tests (backend + frontend)" if ctx.is_fullstack else "Run tests"
+    out += [
+        f"mattstack dev          # {dev_desc}",
+        f"mattstack test         # {test_desc}",
+        "mattstack lint         # Lint all code",
+        "mattstack lint --fix   # Auto-fix lint issues",
+        "mattstack env check    # Verify .env files are in sync",
+        "mattstack audit        # Run static analysis",
+        "```",
+    ]
+
+
+def _ports(ctx: RenderCtx, out: list[str]) -> None:
+    out.append(_PORT_TABLES[(ctx.has_backend, ctx.use_redis, ctx.has_frontend)])
+
+
+def _render_ports(has_backend: bool, use_redis: bool, has_frontend: bool) -> str:
+    rows = ["## Ports", "", "| Service | Port | URL |", "|---------|------|-----|"]
+    if has_backend:
+        rows.append("| Django API | 8000 | http://localhost:8000 |")
+        rows.append("| PostgreSQL | 5432 | — |")
+        if use_redis:
+            rows.append("| Redis | 6379 | — |")
+        rows.append("| API Docs | 8000 | http://localhost:8000/api/docs |")
+    if has_frontend:
+        rows.append("| Frontend | 3000 | http://localhost:3000 |")
+    return "\n".join(rows)
+
+
+# Every Ports table, keyed by (has_backend, use_redis, has_frontend)
+_PORT_TABLES: dict[tuple[bool, bool, bool], str] = {
+    (has_backend, use_redis, has_frontend): _render_ports(has_backend, use_redis, has_frontend)
+    for has_backend in (False, True)
+    for use_redis in (False, True)
+    for has_frontend in (False, True)
+}
+
+
+def _env_vars(ctx: RenderCtx, out: list[str]) -> None:
+    out += ["## Environment Variables", ""]
+    if ctx.has_backend:
+        out.append("- Root `.env`: `DATABASE_URL`, `DJANGO_SECRET_KEY`, `REDIS_URL` (if Redis)")
+    if ctx.has_frontend:
+        out.append(f"- Frontend: `{ctx.api_env_key}` for API base URL")
+
+
+def _backend(ctx: RenderCtx, out: list[str]) -> None:
+    out += [
         "## Backend",
         "",
         "- Language: Python 3.12+",
@@ -212,60 +240,28 @@ def _backend(config: ProjectConfig) -> str:
         "- Database: PostgreSQL 17 (via Docker)",
         "- API docs: http://localhost:8000/api/docs (Swagger UI)",
     ]
-    if config.use_celery:
-        lines.append("- Background jobs: Celery (run with `docker compose --profile celery up`)")
-    if config.is_b2b:
-        lines.append("- B2B: Organizations, teams, RBAC (role-based access control)")
-    return "\n".join(lines)
+    if ctx.use_celery:
+        out.append("- Background jobs: Celery (run with `docker compose --profile celery up`)")
+    if ctx.is_b2b:
+        out.append("- B2B: Organizations, teams, RBAC (role-based access control)")
 
 
-def _frontend(config: ProjectConfig) -> str:
-    if config.is_nextjs:
-        return """## Frontend
+def _frontend(ctx: RenderCtx, out: list[str]) -> None:
+    out.append(_FRONTEND_NEXTJS if ctx.is_nextjs else _FRONTEND_VITE)
 
-- Language: TypeScript (strict mode)
-- Framework: Next.js (App Router)
-- Routing: App Router (file-based)
-- Package manager: bun (NEVER npm/yarn)
-- Styling: Tailwind CSS
-- API base: `NEXT_PUBLIC_API_BASE_URL` env var
-- API routes: `app/api/` directory
-- Dev server: `cd frontend && bun run dev` (Next.js dev server on port 3000)"""
-    return """## Frontend
-
-- Language: TypeScript (strict mode)
-- Framework: React 18 + Vite
-- Routing: TanStack Router
-- Package manager: bun (NEVER npm/yarn)
-- Styling: Tailwind CSS
-- API base: `VITE_API_BASE_URL` env var
-- State management: TanStack Query (server state)"""
 
+def _ios(ctx: RenderCtx, out: list[str]) -> None:
+    out.append(_IOS)
 
-def _ios(config: ProjectConfig) -> str:
-    return """## iOS
 
-- SwiftUI with MVVM pattern
-- Async/await networking
-- iOS 17+ minimum deployment target"""
+def _docker_services(ctx: RenderCtx, out: list[str]) -> None:
+    out += ["## Docker Services", "", "- `db`: PostgreSQL 17"]
+    if ctx.use_redis:
+        out.append("- `redis`: Redis 7")
+    out.append("- `api-dev`: Django dev server (when using Docker)")
+    if ctx.use_celery:
+        out.append("- `celery-worker`, `celery-beat`: Celery (profile: celery)")
 
 
-def _docker_services(config: ProjectConfig) -> str:
-    parts = ["## Docker Services", "", "- `db`: PostgreSQL 17"]
-    if config.use_redis:
-        parts.append("- `redis`: Redis 7")
-    parts.append("- `api-dev`: Django dev server (when using Docker)")
-    if config.use_celery:
-        parts.append("- `celery-worker`, `celery-beat`: Celery (profile: celery)")
-    return "\n".join(parts)
-
-
-def _mattstack_integration(config: ProjectConfig) -> str:
-    return """## mattstack Integration
-
-This project was scaffolded with `mattstack`. The CLI provides unified commands:
-- `mattstack dev` — Start all services (Docker + backend + frontend)
-- `mattstack test` — Run all tests
-- `mattstack lint` — Lint all code
-- `mattstack env check` — Compare .env files
-- `mattstack audit` — Static analysis (quality, types, endpoints, tests, dependencies)"""
+def _mattstack_integration(ctx: RenderCtx, out: list[str]) -> None:
+    out.append(_MATTSTACK_INTEGRATION)
@@ -3,8 +3,10 @@
 from __future__ import annotations
 
 from mattstack.config import ProjectConfig
+from mattstack.templates import cached_render
 
 
+@cached_render
 def generate_gitignore(config: ProjectConfig) -> str:
     """Generate combined .gitignore for the monorepo."""
     sections: list[str] = [_general()]
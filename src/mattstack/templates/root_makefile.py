@@ -2,56 +2,31 @@
 
 from __future__ import annotations
 
-from mattstack.config import ProjectConfig
-
-
-def generate_makefile(config: ProjectConfig) -> str:
-    """Generate root Makefile content."""
-    sections = [_header(), _help_target()]
+import io
 
-    if config.is_fullstack:
-        sections.append(_setup_fullstack(config))
-        sections.append(_docker_targets(config))
-        sections.append(_backend_targets())
-        sections.append(_frontend_targets(config))
-        if config.include_ios:
-            sections.append(_ios_targets(config))
-        sections.append(_combined_targets(config))
-        sections.append(_prod_targets())
-    elif config.has_backend:
-        sections.append(_setup_backend())
-        sections.append(_docker_targets(config))
-        sections.append(_backend_targets())
-        sections.append(_prod_targets())
-    elif config.has_frontend:
-        sections.append(_setup_frontend(config))
-        sections.append(_frontend_targets(config))
-
-    return "\n".join(sections)
+from mattstack.config import ProjectConfig
+from mattstack.templates import cached_render
 
+# Makefile sections; each after the header starts with a newline so joining
+# with "\n" leaves a blank line between them. {placeholders} are filled per config.
 
-def _header() -> str:
-    return """\
+_HEADER = """\
 .DEFAULT_GOAL := help
 SHELL := /bin/bash"""
 
+# Long awk line is required for Makefile help target
+_HELP_GREP = (
+    "@grep -E '^[a-zA-Z_-]+:.*?## .*$$' $(MAKEFILE_LIST) | sort"
+    ' | awk \'BEGIN {FS = ":.*?## "}; '
+    '{printf "\\033[36m%-20s\\033[0m %s\\n", $$1, $$2}\''
+)
 
-def _help_target() -> str:
-    # Long awk line is required for Makefile help target
-    grep_cmd = (
-        "@grep -E '^[a-zA-Z_-]+:.*?## .*$$' $(MAKEFILE_LIST) | sort"
-        ' | awk \'BEGIN {FS = ":.*?## "}; '
-        '{printf "\\033[36m%-20s\\033[0m %s\\n", $$1, $$2}\''
-    )
-    return f"""
+_HELP_TARGET = f"""
 .PHONY: help
 help: ## Show this help
-\t{grep_cmd}"""
+\t{_HELP_GREP}"""
 
-
-def _setup_fullstack(config: ProjectConfig) -> str:
-    ios_setup = "\n\t@echo 'iOS setup: open ios/ in Xcode'" if config.include_ios else ""
-    return f"""
+_SETUP_FULLSTACK = """
 .PHONY: setup
 setup: ## Install all dependencies
 \t@echo 'Setting up backend...'
@@ -62,9 +37,7 @@ setup: ## Install all dependencies
 \t@test -f .env || cp .env.example .env
 \t@echo 'Setup complete!'"""
 
-
-def _setup_backend() -> str:
-    return """
+_SETUP_BACKEND = """
 .PHONY: setup
 setup: ## Install backend dependencies
 \t@echo 'Setting up backend...'
@@ -72,19 +45,14 @@ setup: ## Install backend dependencies
 \t@test -f .env || cp .env.example .env
 \t@echo 'Setup complete!'"""
 
-
-def _setup_frontend(config: ProjectConfig) -> str:
-    install_cmd = "bun install"
-    return f"""
+_SETUP_FRONTEND = """
 .PHONY: setup
 setup: ## Install frontend dependencies
 \t@echo 'Setting up frontend...'
-\tcd frontend && {install_cmd}
+\tcd frontend && bun install
 \t@echo 'Setup complete!'"""
 
-
-def _docker_targets(config: ProjectConfig) -> str:
-    return """
+_DOCKER_TARGETS = """
 .PHONY: up down logs restart
 up: ## Start all services (Docker)
 \tdocker compose up -d
@@ -98,9 +66,7 @@ logs: ## Tail service logs
 restart: ## Restart all services
 \tdocker compose restart"""
 
-
-def _backend_targets() -> str:
-    return """
+_BACKEND_TARGETS = """
 .PHONY: backend-setup backend-dev backend-test backend-lint
 .PHONY: backend-migrate backend-shell backend-makemigrations backend-superuser
 backend-setup: ## Install backend deps
@@ -127,9 +93,7 @@ backend-shell: ## Django shell
 backend-superuser: ## Create Django superuser
 \tcd backend && uv run python manage.py createsuperuser"""
 
-
-def _frontend_targets(config: ProjectConfig) -> str:
-    return f"""
+_FRONTEND_TARGETS = """
 .PHONY: frontend-setup frontend-dev frontend-build frontend-test frontend-lint
 frontend-setup: ## Install frontend deps
 \tcd frontend && bun install
@@ -140,16 +104,13 @@ frontend-dev: ## Run frontend dev server
 frontend-build: ## Build frontend
 \tcd frontend && bun run build
 
-frontend-test: ## Run frontend {"typecheck" if not config.is_nextjs else "lint"}
-\tcd frontend && bun run {"typecheck" if not config.is_nextjs else "lint"}
+frontend-test: ## Run frontend {check}
+\tcd frontend && bun run {check}
 
 frontend-lint: ## Lint frontend
 \tcd frontend && bun run lint"""
 
-
-def _ios_targets(config: ProjectConfig) -> str:
-    scheme = config.display_name.replace(" ", "")
-    return f"""
+_IOS_TARGETS = """
 .PHONY: ios-build ios-test
 ios-build: ## Build iOS project
 \tcd ios && xcodebuild -scheme {scheme} -sdk iphonesimulator build
@@ -157,9 +118,7 @@ ios-build: ## Build iOS project
 ios-test: ## Run iOS tests
 \tcd ios && xcodebuild -scheme {scheme} -sdk iphonesimulator test"""
 
-
-def _combined_targets(config: ProjectConfig) -> str:
-    return """
+_COMBINED_TARGETS = """
 .PHONY: test lint format sync-types clean
 test: ## Run all tests
 \t@echo 'Running backend tests...'
@@ -184,9 +143,7 @@ clean: ## Clean all build artifacts
 \trm -rf backend/.pytest_cache backend/__pycache__
 \trm -rf frontend/node_modules frontend/dist"""
 
-
-def _prod_targets() -> str:
-    return """
+_PROD_TARGETS = """
 .PHONY: prod-build prod-up prod-down
 prod-build: ## Build production images
 \tdocker compose -f docker-compose.prod.yml build
@@ -196,3 +153,46 @@ prod-up: ## Start production
 
 prod-down: ## Stop production
 \tdocker compose -f docker-compose.prod.yml down"""
+
+# Variants indexed by a config flag: (False, True)
+_SETUP_FULLSTACK_BY_IOS = (
+    _SETUP_FULLSTACK.format(ios_setup=""),
+    _SETUP_FULLSTACK.format(ios_setup="\n\t@echo 'iOS setup: open ios/ in Xcode'"),
+)
+_FRONTEND_TARGETS_BY_NEXTJS = (
+    _FRONTEND_TARGETS.format(check="typecheck"),
+    _FRONTEND_TARGETS.format(check="lint"),
+)
+
+
+@cached_render
+def generate_makefile(config: ProjectConfig) -> str:
+    """Generate root Makefile content."""
+    buf = io.StringIO()
+    w = buf.write
+    w(_HEADER)
+
+    def section(text: str) -> None:
+        w("\n")
+        w(text)
+
+    section(_HELP_TARGET)
+    if config.is_fullstack:
+        section(_SETUP_FULLSTACK_BY_IOS[config.include_ios])
+        section(_DOCKER_TARGETS)
+        section(_BACKEND_TARGETS)
+        section(_FRONTEND_TARGETS_BY_NEXTJS[config.is_nextjs])
+        if config.include_ios:
+            section(_IOS_TARGETS.format(scheme=config.display_name.replace(" ", "")))
+        section(_COMBINED_TARGETS)
+        section(_PROD_TARGETS)
+    elif config.has_backend:
+        section(_SETUP_BACKEND)
+        section(_DOCKER_TARGETS)
+        section(_BACKEND_TARGETS)
+        section(_PROD_TARGETS)
+    elif config.has_frontend:
+        section(_SETUP_FRONTEND)
+        section(_FRONTEND_TARGETS_BY_NEXTJS[config.is_nextjs])
+
+    return buf.getvalue()
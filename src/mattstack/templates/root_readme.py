@@ -3,59 +3,82 @@
 from __future__ import annotations
 
 from mattstack.config import ProjectConfig
+from mattstack.templates import cached_render
+from mattstack.templates.render_ctx import RenderCtx
 
+# Static sections
+_API_DOCS = """\
+## API Documentation
+
+- Swagger UI: http://localhost:8000/api/docs
+- OpenAPI JSON: http://localhost:8000/api/openapi.json"""
+
+_B2B_FEATURES = """\
+## B2B Features
+
+After running `make setup` and `make backend-migrate`, generate B2B features:
 
+```bash
+cd backend
+uv run python manage.py generate_feature organizations
+uv run python manage.py generate_feature teams
+uv run python manage.py generate_feature rbac
+uv run python manage.py makemigrations
+uv run python manage.py migrate
+```"""
+
+
+@cached_render
 def generate_readme(config: ProjectConfig) -> str:
     """Generate project README.md."""
-    sections = [_header(config), _tech_stack(config), _quickstart(config)]
+    ctx = RenderCtx.from_config(config)
+    sections = [_header(ctx), _tech_stack(ctx), _quickstart(ctx)]
 
-    if config.is_fullstack:
-        sections.append(_project_structure_fullstack(config))
-    elif config.has_backend:
-        sections.append(_project_structure_backend(config))
-    elif config.has_frontend:
-        sections.append(_project_structure_frontend(config))
+    if ctx.is_fullstack:
+        sections.append(_project_structure_fullstack(ctx))
+    elif ctx.has_backend:
+        sections.append(_project_structure_backend(ctx))
+    elif ctx.has_frontend:
+        sections.append(_project_structure_frontend(ctx))
 
-    sections.append(_commands(config))
+    sections.append(_commands(ctx))
 
-    if config.has_backend:
-        sections.append(_api_docs(config))
+    if ctx.has_backend:
+        sections.append(_API_DOCS)
 
-    if config.is_b2b:
-        sections.append(_b2b_features())
+    if ctx.is_b2b:
+        sections.append(_B2B_FEATURES)
 
     return "\n\n".join(sections) + "\n"
 
 
-def _header(config: ProjectConfig) -> str:
-    variant = " (B2B)" if config.is_b2b else ""
-    return f"# {config.display_name}{variant}"
+def _header(ctx: RenderCtx) -> str:
+    variant = " (B2B)" if ctx.is_b2b else ""
+    return f"# {ctx.display_name}{variant}"
 
 
-def _tech_stack(config: ProjectConfig) -> str:
+def _tech_stack(ctx: RenderCtx) -> str:
     stack: list[str] = []
-    if config.has_backend:
+    if ctx.has_backend:
         stack.append("- **Backend**: Django + Django Ninja (Python)")
         stack.append("- **Database**: PostgreSQL 17")
-        if config.use_redis:
+        if ctx.use_redis:
             stack.append("- **Cache/Queue**: Redis 7")
-        if config.use_celery:
+        if ctx.use_celery:
             stack.append("- **Background Tasks**: Celery")
-    if config.has_frontend:
-        if config.is_nextjs:
+    if ctx.has_frontend:
+        if ctx.is_nextjs:
             stack.append("- **Frontend**: Next.js (App Router, TypeScript, Tailwind)")
         else:
-            is_tanstack = config.frontend_framework.value == "react-vite"
-            fw = "TanStack Router" if is_tanstack else "React Router"
-            stack.append(f"- **Frontend**: React + Vite + TypeScript ({fw})")
-    if config.include_ios:
+            stack.append(f"- **Frontend**: React + Vite + TypeScript ({ctx.router_label})")
+    if ctx.include_ios:
         stack.append("- **iOS**: SwiftUI (iOS 17+)")
 
     stack_list = "\n".join(stack)
     return f"## Tech Stack\n\n{stack_list}"
 
 
-def _quickstart(config: ProjectConfig) -> str:
+def _quickstart(ctx: RenderCtx) -> str:
     lines = [
         "## Quick Start",
         "",
@@ -64,7 +87,7 @@ def _quickstart(config: ProjectConfig) -> str:
         "make setup",
     ]
 
-    if config.has_backend:
+    if ctx.has_backend:
         lines.extend(
             [
                 "",
@@ -82,24 +105,24 @@ def _quickstart(config: ProjectConfig) -> str:
     lines.append("")
     lines.append("# Start dev servers")
 
-    if config.has_backend:
+    if ctx.has_backend:
         lines.append("make backend-dev   # http://localhost:8000")
 
-    if config.has_frontend:
+    if ctx.has_frontend:
         lines.append("make frontend-dev  # http://localhost:3000")
 
     lines.append("```")
     return "\n".join(lines)
 
 
-def _project_structure_fullstack(config: ProjectConfig) -> str:
-    ios_line = "\n├── ios/                  # iOS client (SwiftUI)" if config.include_ios else ""
-    fe_label = "Next.js App" if config.is_nextjs else "React SPA"
+def _project_structure_fullstack(ctx: RenderCtx) -> str:
+    ios_line = "\n├── ios/                  # iOS client (SwiftUI)" if ctx.include_ios else ""
+    fe_label = "Next.js App" if ctx.is_nextjs else "React SPA"
     return f"""\
 ## Project Structure
 
 ```
-{config.name}/
+{ctx.name}/
 ├── backend/              # Django API
 ├── frontend/             # {fe_label}{ios_line}
 ├── docker-compose.yml    # Dev services
@@ -110,12 +133,12 @@ def _project_structure_fullstack(config: ProjectConfig) -> str:
 ```"""
 
 
-def _project_structure_backend(config: ProjectConfig) -> str:
+def _project_structure_backend(ctx: RenderCtx) -> str:
     return f"""\
 ## Project Structure
 
 ```
-{config.name}/
+{ctx.name}/
 ├── backend/              # Django API
 ├── docker-compose.yml    # Dev services
 ├── Makefile
@@ -124,26 +147,30 @@ def _project_structure_backend(config: ProjectConfig) -> str:
 ```"""
 
 
-def _project_structure_frontend(config: ProjectConfig) -> str:
-    label = "Next.js App" if config.is_nextjs else "React SPA"
+def _project_structure_frontend(ctx: RenderCtx) -> str:
+    label = "Next.js App" if ctx.is_nextjs else "React SPA"
     return f"""\
 ## Project Structure
 
 ```
-{config.name}/
+{ctx.name}/
 ├── frontend/             # {label}
 ├── Makefile
 └── .env.example
 ```"""
 
 
-def _commands(config: ProjectConfig) -> str:
+def _commands(ctx: RenderCtx) -> str:
+    return _COMMANDS_BY_BACKEND[ctx.has_backend]
+
+
+def _render_commands(has_backend: bool) -> str:
     rows = [
         ("| Command | Description |", True),
         ("|---------|-------------|", True),
         ("| `make setup` | Install all dependencies |", True),
-        ("| `make up` | Start Docker services |", config.has_backend),
-        ("| `make down` | Stop Docker services |", config.has_backend),
+        ("| `make up` | Start Docker services |", has_backend),
+        ("| `make down` | Stop Docker services |", has_backend),
         ("| `make test` | Run all tests |", True),
         ("| `make lint` | Lint all code |", True),
         ("| `make format` | Format all code |", True),
@@ -159,25 +186,5 @@ Run `make help` to see all available commands.
 {table}"""
 
 
-def _api_docs(config: ProjectConfig) -> str:
-    return """\
-## API Documentation
-
-- Swagger UI: http://localhost:8000/api/docs
-- OpenAPI JSON: http://localhost:8000/api/openapi.json"""
-
-
-def _b2b_features() -> str:
-    return """\
-## B2B Features
-
-After running `make setup` and `make backend-migrate`, generate B2B features:
-
-```bash
-cd backend
-uv run python manage.py generate_feature organizations
-uv run python manage.py generate_feature teams
-uv run python manage.py generate_feature rbac
-uv run python manage.py makemigrations
-uv run python manage.py migrate
-```"""
+# The Commands section only varies with the backend: (without, with)
+_COMMANDS_BY_BACKEND = (_render_commands(False), _render_commands(True))
@@ -0,0 +1,85 @@
+"""Compose file assembly shared by the Hetzner and self-hosted deploy templates."""
+
+from __future__ import annotations
+
+import io
+
+from mattstack.config import ProjectConfig
+
+# Each block starts with the blank line that separates it from the previous service
+DB_SERVICE = """
+  db:
+    image: postgres:16-alpine
+    restart: unless-stopped
+    volumes:
+      - postgres_data:/var/lib/postgresql/data
+    environment:
+      POSTGRES_DB: ${POSTGRES_DB:-app}
+      POSTGRES_USER: ${POSTGRES_USER:-postgres}
+      POSTGRES_PASSWORD: ${POSTGRES_PASSWORD:-postgres}
+"""
+
+REDIS_SERVICE = """
+  redis:
+    image: redis:7-alpine
+    restart: unless-stopped
+"""
+
+FRONTEND_SERVICE = """
+  frontend:
+    build: ./frontend
+    restart: unless-stopped
+    expose:
+      - "3000"
+"""
+
+
+def depends_on_entries(config: ProjectConfig) -> str:
+    """Return the reverse proxy's depends_on list items."""
+    return ("      - api\n" if config.has_backend else "") + (
+        "      - frontend\n" if config.has_frontend else ""
+    )
+
+
+def api_service(config: ProjectConfig) -> str:
+    """Return the gunicorn api service block."""
+    return (
+        "\n"
+        "  api:\n"
+        "    build: ./backend\n"
+        f"    command: gunicorn {config.python_package_name}.wsgi:application --bind 0.0.0.0:8000\n"
+        "    restart: unless-stopped\n"
+        "    env_file: .env\n"
+        "    expose:\n"
+        '      - "8000"\n'
+        "    depends_on:\n"
+        "      - db\n"
+    ) + ("      - redis\n" if config.use_redis else "")
+
+
+def build_compose(
+    config: ProjectConfig, proxy_service: str, volumes: str, sidecars: str = ""
+) -> str:
+    """Assemble a VPS docker-compose.prod.yml around a target's reverse proxy.
+
+    ``proxy_service`` is the file header through the proxy's ``depends_on:`` key,
+    ``sidecars`` holds extra services placed right after the proxy, and
+    ``volumes`` is the trailing top-level volumes block.
+    """
+    buf = io.StringIO()
+    w = buf.write
+    w(proxy_service)
+    w(depends_on_entries(config))
+    w(sidecars)
+
+    if config.has_backend:
+        w(api_service(config))
+
+    w(DB_SERVICE)
+    if config.use_redis:
+        w(REDIS_SERVICE)
+    if config.has_frontend:
+        w(FRONTEND_SERVICE)
+    w(volumes)
+
+    return buf.getvalue()
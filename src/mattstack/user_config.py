@@ -6,6 +6,8 @@ from pathlib import Path
 
 import yaml
 
+from mattstack.utils.yaml_loader import safe_load
+
 USER_CONFIG_DIR = Path.home() / ".mattstack"
 USER_CONFIG_PATH = USER_CONFIG_DIR / "config.yaml"
 
@@ -36,15 +38,41 @@ TEMPLATE_CONFIG = """\
 """
 
 
+# (path, st_mtime_ns, st_size) of the last parsed config file, and its parsed data
+_CONFIG_CACHE: tuple[tuple[Path, int, int], dict] | None = None
+
+
 def load_user_config() -> dict:
-    """Load user config from ~/.mattstack/config.yaml. Returns empty dict if missing."""
-    if not USER_CONFIG_PATH.is_file():
+    """Load user config from ~/.mattstack/config.yaml. Returns empty dict if missing.
+
+    The parsed file is cached until its mtime or size changes, so repeated
+    lookups in one process cost a stat instead of a read + YAML parse.
+    Callers must treat the returned dict as read-only.
+    """
+    global _CONFIG_CACHE
+    path = USER_CONFIG_PATH
+    try:
+        st = path.stat()
+    except OSError:
         return {}
+    key = (path, st.st_mtime_ns, st.st_size)
+    if _CONFIG_CACHE is not None and _CONFIG_CACHE[0] == key:
+        return _CONFIG_CACHE[1]
     try:
-        data = yaml.safe_load(USER_CONFIG_PATH.read_text(encoding="utf-8"))
-        return data if isinstance(data, dict) else {}
-    except (yaml.YAMLError, OSError):
+        data = safe_load(path.read_text(encoding="utf-8"))
+    except OSError:
         return {}
+    except yaml.YAMLError:
+        data = None
+    config = data if isinstance(data, dict) else {}
+    _CONFIG_CACHE = (key, config)
+    return config
+
+
+def _invalidate() -> None:
+    """Drop the cached config so the next load re-reads the file."""
+    global _CONFIG_CACHE
+    _CONFIG_CACHE = None
 
 
 def get_user_repos() -> dict[str, str]:
@@ -72,4 +100,5 @@ def init_user_config() -> Path:
     """Create template config at ~/.mattstack/config.yaml."""
     USER_CONFIG_DIR.mkdir(parents=True, exist_ok=True)
     USER_CONFIG_PATH.write_text(TEMPLATE_CONFIG, encoding="utf-8")
+    _invalidate()
     return USER_CONFIG_PATH
@@ -2,10 +2,13 @@
 
 from __future__ import annotations
 
+from typing import TYPE_CHECKING
+
 from rich.console import Console
-from rich.panel import Panel
-from rich.progress import Progress, SpinnerColumn, TextColumn
-from rich.table import Table
+
+if TYPE_CHECKING:
+    from rich.progress import Progress
+    from rich.table import Table
 
 console = Console()
 
@@ -23,6 +26,10 @@ def set_quiet(enabled: bool) -> None:
     _quiet = enabled
 
 
+def is_verbose() -> bool:
+    return _verbose
+
+
 def print_verbose(message: str) -> None:
     if _verbose:
         console.print(f"[dim][VERBOSE][/dim] {message}")
@@ -57,10 +64,14 @@ def print_step(step: int, total: int, message: str) -> None:
 
 
 def print_header(title: str) -> None:
+    from rich.panel import Panel
+
     console.print(Panel(title, border_style="cyan", expand=False))
 
 
 def create_progress() -> Progress:
+    from rich.progress import Progress, SpinnerColumn, TextColumn
+
     return Progress(
         SpinnerColumn(),
         TextColumn("[progress.description]{task.description}"),
@@ -69,6 +80,8 @@ def create_progress() -> Progress:
 
 
 def create_table(title: str, columns: list[str]) -> Table:
+    from rich.table import Table
+
     table = Table(title=title, show_header=True, header_style="bold cyan")
     for col in columns:
         table.add_column(col)
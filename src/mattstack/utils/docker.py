@@ -2,37 +2,79 @@
 
 from __future__ import annotations
 
-import shutil
+import json
 import subprocess
+from dataclasses import dataclass
+from functools import cache
+
+from mattstack.utils.process import command_available
+
+# Seconds to wait for `docker info`; a stalled daemon would otherwise hang the CLI
+_PROBE_TIMEOUT = 5
+
+
+@dataclass(frozen=True, slots=True)
+class _DockerStatus:
+    running: bool  # daemon reachable
+    compose: bool  # `docker compose` (v2 plugin) installed
 
 
 def docker_available() -> bool:
-    return shutil.which("docker") is not None
+    return command_available("docker")
 
 
 def docker_compose_available() -> bool:
     """Check if docker compose (v2 plugin) is available."""
+    return _docker_status().compose
+
+
+def docker_running() -> bool:
+    """Check if Docker daemon is running."""
+    return _docker_status().running
+
+
+@cache
+def _docker_status() -> _DockerStatus:
+    """Probe the daemon and the compose plugin with one `docker info` call."""
     try:
-        subprocess.run(
-            ["docker", "compose", "version"],
-            check=True,
+        result = subprocess.run(
+            ["docker", "info", "--format", "{{json .}}"],
             capture_output=True,
             text=True,
+            timeout=_PROBE_TIMEOUT,
         )
-        return True
-    except (subprocess.CalledProcessError, FileNotFoundError):
-        return False
+    except (FileNotFoundError, subprocess.TimeoutExpired):
+        return _DockerStatus(running=False, compose=False)
+
+    try:
+        info = json.loads(result.stdout)
+    except json.JSONDecodeError:
+        info = None
+    if not isinstance(info, dict):
+        info = {}
 
+    # Newer clients still print client info (with ServerErrors) when the daemon is down
+    running = (
+        result.returncode == 0 and not info.get("ServerErrors") and bool(info.get("ServerVersion"))
+    )
+    plugins = (info.get("ClientInfo") or {}).get("Plugins")
+    if isinstance(plugins, list):
+        compose = any(isinstance(p, dict) and p.get("Name") == "compose" for p in plugins)
+    else:
+        # Older clients don't report plugins; ask compose directly
+        compose = _compose_version_ok()
+    return _DockerStatus(running=running, compose=compose)
 
-def docker_running() -> bool:
-    """Check if Docker daemon is running."""
+
+def _compose_version_ok() -> bool:
     try:
         subprocess.run(
-            ["docker", "info"],
+            ["docker", "compose", "version"],
             check=True,
             capture_output=True,
             text=True,
+            timeout=_PROBE_TIMEOUT,
         )
         return True
-    except (subprocess.CalledProcessError, FileNotFoundError):
+    except (subprocess.CalledProcessError, FileNotFoundError, subprocess.TimeoutExpired):
         return False
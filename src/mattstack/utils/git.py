@@ -6,22 +6,34 @@ import shutil
 import subprocess
 from pathlib import Path
 
-from mattstack.utils.console import print_error
+from mattstack.utils.console import is_verbose, print_error
+from mattstack.utils.process import command_available
 
 
 def git_available() -> bool:
-    return shutil.which("git") is not None
+    return command_available("git")
+
+
+def _run_git(args: list[str], cwd: Path | None = None) -> None:
+    """Run a git command, keeping only stderr for error reporting.
+
+    stdout is discarded (or passed through to the terminal in verbose mode)
+    rather than buffered, since callers never read it.
+    """
+    subprocess.run(
+        ["git", *args],
+        cwd=cwd,
+        check=True,
+        stdout=None if is_verbose() else subprocess.DEVNULL,
+        stderr=subprocess.PIPE,
+        text=True,
+    )
 
 
 def clone_repo(url: str, destination: Path, branch: str = "main", depth: int = 1) -> bool:
     """Shallow clone a repo to destination."""
     try:
-        subprocess.run(
-            ["git", "clone", "--branch", branch, "--depth", str(depth), url, str(destination)],
-            check=True,
-            capture_output=True,
-            text=True,
-        )
+        _run_git(["clone", "--branch", branch, "--depth", str(depth), url, str(destination)])
         return True
     except subprocess.CalledProcessError as e:
         print_error(f"Failed to clone {url}: {e.stderr.strip()}")
@@ -39,13 +51,7 @@ def remove_git_history(path: Path) -> bool:
 def init_repo(path: Path) -> bool:
     """Initialize a new git repo."""
     try:
-        subprocess.run(
-            ["git", "init"],
-            cwd=path,
-            check=True,
-            capture_output=True,
-            text=True,
-        )
+        _run_git(["init"], cwd=path)
         return True
     except subprocess.CalledProcessError as e:
         print_error(f"Failed to init git repo: {e.stderr.strip()}")
@@ -55,20 +61,8 @@ def init_repo(path: Path) -> bool:
 def create_initial_commit(path: Path, message: str = "Initial commit") -> bool:
     """Stage all files and create initial commit."""
     try:
-        subprocess.run(
-            ["git", "add", "."],
-            cwd=path,
-            check=True,
-            capture_output=True,
-            text=True,
-        )
-        subprocess.run(
-            ["git", "commit", "-m", message],
-            cwd=path,
-            check=True,
-            capture_output=True,
-            text=True,
-        )
+        _run_git(["add", "."], cwd=path)
+        _run_git(["commit", "-m", message], cwd=path)
         return True
     except subprocess.CalledProcessError as e:
         print_error(f"Failed to create initial commit: {e.stderr.strip()}")
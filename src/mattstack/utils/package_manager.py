@@ -25,6 +25,22 @@ LOCKFILE_MAP: dict[str, PackageManager] = {
 
 DEFAULT_PM = PackageManager.BUN
 
+# pm -> (add verb, dev flag, dev flag goes before the packages)
+_ADD_SPECS: dict[PackageManager, tuple[str, str, bool]] = {
+    PackageManager.BUN: ("add", "-d", True),
+    PackageManager.NPM: ("install", "--save-dev", False),
+    PackageManager.YARN: ("add", "--dev", False),
+    PackageManager.PNPM: ("add", "-D", False),
+}
+
+# pm -> (exec program, args before the binary)
+_EXEC_SPECS: dict[PackageManager, tuple[str, tuple[str, ...]]] = {
+    PackageManager.BUN: ("bunx", ()),
+    PackageManager.NPM: ("npx", ()),
+    PackageManager.YARN: ("yarn", ("dlx",)),
+    PackageManager.PNPM: ("pnpm", ("dlx",)),
+}
+
 
 @dataclass
 class PMCommand:
@@ -90,23 +106,13 @@ def resolve_package_manager(
 
 def build_add_cmd(pm: PackageManager, packages: list[str], *, dev: bool = False) -> PMCommand:
     """Build an 'add package' command."""
-    match pm:
-        case PackageManager.BUN:
-            args = ["add", *packages]
-            if dev:
-                args.insert(1, "-d")
-        case PackageManager.NPM:
-            args = ["install", *packages]
-            if dev:
-                args.append("--save-dev")
-        case PackageManager.YARN:
-            args = ["add", *packages]
-            if dev:
-                args.append("--dev")
-        case PackageManager.PNPM:
-            args = ["add", *packages]
-            if dev:
-                args.append("-D")
+    verb, dev_flag, flag_first = _ADD_SPECS[pm]
+    if not dev:
+        args = [verb, *packages]
+    elif flag_first:
+        args = [verb, dev_flag, *packages]
+    else:
+        args = [verb, *packages, dev_flag]
     return PMCommand(program=pm.value, args=args)
 
 
@@ -135,15 +141,8 @@ def build_exec_cmd(
     pm: PackageManager, binary: str, extra_args: list[str] | None = None
 ) -> PMCommand:
     """Build an 'exec binary' command (npx/bunx/pnpm exec/yarn dlx)."""
-    match pm:
-        case PackageManager.BUN:
-            prog, args = "bunx", [binary]
-        case PackageManager.NPM:
-            prog, args = "npx", [binary]
-        case PackageManager.YARN:
-            prog, args = "yarn", ["dlx", binary]
-        case PackageManager.PNPM:
-            prog, args = "pnpm", ["dlx", binary]
+    prog, prefix = _EXEC_SPECS[pm]
+    args = [*prefix, binary]
     if extra_args:
         args.extend(extra_args)
     return PMCommand(program=prog, args=args)
@@ -5,27 +5,50 @@ from __future__ import annotations
 import shutil
 import socket
 import subprocess
+from functools import cache
 
+# Seconds to wait for a connection when probing a local port
+_PORT_PROBE_TIMEOUT = 0.5
 
+# Loopback addresses a local dev server may listen on
+_LOOPBACKS = ((socket.AF_INET, "127.0.0.1"), (socket.AF_INET6, "::1"))
+
+
+@cache
 def command_available(name: str) -> bool:
-    """Check if a command is available on PATH."""
+    """Check if a command is available on PATH (cached for the process lifetime)."""
     return shutil.which(name) is not None
 
 
 def check_port_available(port: int) -> bool:
-    """Check if a TCP port is available."""
-    with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as s:
-        try:
-            s.bind(("127.0.0.1", port))
-            return True
-        except OSError:
-            return False
+    """Check if a TCP port is available (nothing is listening on it).
+
+    Only the loopback addresses are probed, IPv4 and IPv6; a server bound solely
+    to a specific LAN address is not detected.
+    """
+    # Probe for a listener rather than binding: bind semantics differ across
+    # platforms, and TIME_WAIT leftovers from a just-stopped server would
+    # otherwise make the port look busy
+    return not any(_port_listening(family, host, port) for family, host in _LOOPBACKS)
+
+
+def _port_listening(family: socket.AddressFamily, host: str, port: int) -> bool:
+    try:
+        s = socket.socket(family, socket.SOCK_STREAM)
+    except OSError:  # address family unsupported on this host
+        return False
+    with s:
+        s.settimeout(_PORT_PROBE_TIMEOUT)
+        return s.connect_ex((host, port)) == 0
 
 
 def get_command_version(name: str, args: list[str] | None = None) -> str | None:
     """Get version string from a command."""
-    if args is None:
-        args = [name, "--version"]
+    return _command_version(tuple(args) if args is not None else (name, "--version"))
+
+
+@cache
+def _command_version(args: tuple[str, ...]) -> str | None:
     try:
         result = subprocess.run(args, capture_output=True, text=True, check=True)
         return result.stdout.strip()
@@ -14,16 +14,19 @@ from mattstack.config import (
     Variant,
 )
 from mattstack.utils.console import print_error
+from mattstack.utils.yaml_loader import safe_load
 
 
 def load_config_file(config_path: Path, output_path: Path) -> ProjectConfig | None:
     """Parse a YAML config file into a ProjectConfig."""
-    if not config_path.exists():
+    try:
+        raw = config_path.read_bytes()
+    except FileNotFoundError:
         print_error(f"Config file not found: {config_path}")
         return None
 
     try:
-        data = yaml.safe_load(config_path.read_text())
+        data = safe_load(raw)
     except yaml.YAMLError as e:
         print_error(f"Invalid YAML: {e}")
         return None
@@ -0,0 +1,17 @@
+"""Shared YAML loading, using libyaml's C parser when PyYAML was built with it."""
+
+from __future__ import annotations
+
+from typing import Any
+
+import yaml
+
+try:
+    from yaml import CSafeLoader as _SafeLoader
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeLoader as _SafeLoader  # type: ignore[assignment]
+
+
+def safe_load(stream: str | bytes) -> Any:
+    """Drop-in for ``yaml.safe_load``; raises ``yaml.YAMLError`` on bad input."""
+    return yaml.load(stream, Loader=_SafeLoader)
@@ -94,3 +94,11 @@ def test_skips_venv_and_node_modules(tmp_path: Path) -> None:
     auditor = CodeQualityAuditor(_make_config(tmp_path))
     findings = auditor.run()
     assert len(findings) == 0
+
+
+def test_scans_project_nested_under_skipped_dir_name(tmp_path: Path) -> None:
+    project = tmp_path / "build" / "app"
+    project.mkdir(parents=True)
+    (project / "main.py").write_text("# TODO: still reported\n")
+    findings = CodeQualityAuditor(_make_config(project)).run()
+    assert len(findings) == 1
@@ -38,6 +38,24 @@ def test_write_file(tmp_path: Path) -> None:
     assert len(gen.created_files) == 1
 
 
+def test_write_file_creates_each_parent_once(tmp_path: Path, monkeypatch) -> None:
+    config = _make_config(tmp_path)
+    gen = _ConcreteGenerator(config)
+    made: list[Path] = []
+    real_mkdir = Path.mkdir
+
+    def counting_mkdir(self: Path, *args, **kwargs) -> None:
+        if kwargs.get("parents"):  # skip pathlib's own retry of the leaf dir
+            made.append(self)
+        real_mkdir(self, *args, **kwargs)
+
+    monkeypatch.setattr(Path, "mkdir", counting_mkdir)
+    gen.write_file("copilot/api/manifest.yml", "a")
+    gen.write_file("copilot/api/other.yml", "b")
+    assert made.count(config.path / "copilot" / "api") == 1
+    assert (config.path / "copilot/api/other.yml").read_text() == "b"
+
+
 def test_write_file_dry_run(tmp_path: Path) -> None:
     config = _make_config(tmp_path, dry_run=True)
     gen = _ConcreteGenerator(config)
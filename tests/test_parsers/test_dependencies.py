@@ -50,6 +50,22 @@ dependencies = [
         assert dep.version_constraint == ""
 
 
+def test_parse_pyproject_extras_keep_list_open(tmp_path: Path) -> None:
+    f = tmp_path / "pyproject.toml"
+    f.write_text(
+        """[project]
+name = "myapp"
+dependencies = [
+    "uvicorn[standard]>=0.30",
+    "django>=5.0",
+]
+"""
+    )
+    manifest = parse_pyproject_toml(f)
+    names = [d.name for d in manifest.dependencies]
+    assert names == ["uvicorn", "django"]
+
+
 def test_parse_pyproject_dev_deps(tmp_path: Path) -> None:
     f = tmp_path / "pyproject.toml"
     f.write_text(
@@ -91,3 +91,20 @@ def test_empty_file(tmp_path: Path) -> None:
     f.write_text("# no routes\n")
     routes = parse_routes_file(f)
     assert len(routes) == 0
+
+
+def test_auth_does_not_leak_from_later_decorator(tmp_path: Path) -> None:
+    f = tmp_path / "api.py"
+    f.write_text(
+        '@router.get("/open")\n'
+        "def open_view(request):\n"
+        "    return 1\n\n"
+        '@router.post(\n    "/secure",\n    auth=JWTAuth(),\n)\n'
+        "def secure_view(request):\n"
+        "    return 2\n"
+    )
+    routes = {r.path: r for r in parse_routes_file(f)}
+    assert set(routes) == {"/open", "/secure"}
+    assert routes["/open"].has_auth is False
+    assert routes["/open"].function_name == "open_view"
+    assert routes["/secure"].has_auth is True
@@ -4,7 +4,19 @@ from __future__ import annotations
 
 from pathlib import Path
 
-from mattstack.parsers.utils import SKIP_DIRS, extract_block, find_files
+from mattstack.parsers.python_schemas import parse_pydantic_file
+from mattstack.parsers.utils import (
+    SKIP_DIRS,
+    block_span,
+    clear_parse_cache,
+    extract_block,
+    file_discovery_cache,
+    find_files,
+    iter_files,
+    line_number,
+    line_offsets,
+    read_source,
+)
 
 
 def test_skip_dirs_is_frozenset() -> None:
@@ -93,3 +105,98 @@ def test_extract_block_escaped_quotes_dont_end_string() -> None:
     assert r'name: "escaped \" { brace }"' in result
     # The block should close at the final }, not at the brace inside the string
     assert result.strip().endswith(r'"escaped \" { brace }"')
+
+
+def test_line_number_matches_newline_count() -> None:
+    text = "a\nbb\n\nccc\n"
+    offsets = line_offsets(text)
+    for offset in range(len(text) + 1):
+        assert line_number(offsets, offset) == text[:offset].count("\n") + 1
+
+
+def test_cached_parse_reuses_unchanged_file(tmp_path: Path) -> None:
+    clear_parse_cache()
+    f = tmp_path / "schemas.py"
+    f.write_text("class User(Schema):\n    name: str\n")
+    first = parse_pydantic_file(f)
+    assert parse_pydantic_file(f) is first
+
+
+def test_cached_parse_invalidates_on_change(tmp_path: Path) -> None:
+    clear_parse_cache()
+    f = tmp_path / "schemas.py"
+    f.write_text("class User(Schema):\n    name: str\n")
+    assert len(parse_pydantic_file(f)[0].fields) == 1
+    f.write_text("class User(Schema):\n    name: str\n    email: str\n")
+    assert len(parse_pydantic_file(f)[0].fields) == 2
+
+
+def test_find_files_double_star_in_middle(tmp_path: Path) -> None:
+    deep = tmp_path / "src" / "forms" / "auth" / "login"
+    deep.mkdir(parents=True)
+    (deep / "LoginForm.tsx").write_text("")
+    (tmp_path / "src" / "Other.tsx").write_text("")
+    result = find_files(tmp_path, ["**/forms/**/*.tsx"])
+    assert [p.name for p in result] == ["LoginForm.tsx"]
+
+
+def test_find_files_respects_pattern_depth(tmp_path: Path) -> None:
+    (tmp_path / "a" / "b" / "c").mkdir(parents=True)
+    (tmp_path / "a" / "package.json").write_text("{}")
+    (tmp_path / "a" / "b" / "c" / "package.json").write_text("{}")
+    result = find_files(tmp_path, ["*/package.json", "*/*/package.json"])
+    assert result == [tmp_path / "a" / "package.json"]
+
+
+def test_read_source_skips_files_without_needle(tmp_path: Path) -> None:
+    f = tmp_path / "plain.ts"
+    f.write_text("export const x = 1;\n")
+    assert read_source(f, b"interface") is None
+    assert read_source(f, b"interface", b"const") == "export const x = 1;\n"
+
+
+def test_read_source_normalizes_newlines(tmp_path: Path) -> None:
+    f = tmp_path / "crlf.py"
+    f.write_bytes(b"class A(Schema):\r\n    x: int\r\n")
+    assert read_source(f, b"Schema") == f.read_text(encoding="utf-8")
+
+
+def test_read_source_probes_large_files(tmp_path: Path) -> None:
+    f = tmp_path / "bundle.d.ts"
+    f.write_text("// x\n" * 300_000)
+    assert read_source(f, b"interface") is None
+    f.write_text("// x\n" * 300_000 + "interface A {}\n")
+    text = read_source(f, b"interface")
+    assert text is not None
+    assert text.endswith("interface A {}\n")
+
+
+def test_block_span_matches_extract_block() -> None:
+    text = 'x { a: "}" { b } }  y'
+    start, end = block_span(text, 2)
+    assert text[start:end] == extract_block(text, 2)
+    assert text[end] == "}"
+
+
+def test_block_span_escaped_and_unclosed_strings() -> None:
+    text = r'{ a: "\"}", b: `}\`` } tail'
+    assert text[block_span(text, 0)[1] :] == "} tail"
+    assert block_span('{ a: "}', 0) == (1, 7)
+
+
+def test_iter_files_is_lazy_and_matches_find_files(tmp_path: Path) -> None:
+    (tmp_path / "pkg").mkdir()
+    (tmp_path / "a.py").write_text("")
+    (tmp_path / "pkg" / "b.py").write_text("")
+    it = iter_files(tmp_path, ["*.py", "**/*.py"])
+    assert not isinstance(it, list)
+    assert sorted(it) == find_files(tmp_path, ["*.py", "**/*.py"])
+
+
+def test_file_discovery_cache_reuses_walk_within_block(tmp_path: Path) -> None:
+    (tmp_path / "a.py").write_text("")
+    with file_discovery_cache():
+        first = find_files(tmp_path, ["*.py"])
+        (tmp_path / "b.py").write_text("")
+        assert find_files(tmp_path, ["*.py"]) == first
+    assert len(find_files(tmp_path, ["*.py"])) == 2
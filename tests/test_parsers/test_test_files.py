@@ -32,6 +32,19 @@ def test_pytest_class(tmp_path: Path) -> None:
     assert all(tc.class_name == "TestUser" for tc in suite.test_cases)
 
 
+def test_pytest_line_numbers(tmp_path: Path) -> None:
+    f = tmp_path / "test_lines.py"
+    f.write_text(
+        "import pytest\n\n"
+        "def test_top():\n    pass\n\n"
+        "class TestThing:\n"
+        "    def test_method(self):\n        pass\n"
+    )
+    suite = parse_pytest_file(f)
+    lines = {tc.name: tc.line for tc in suite.test_cases}
+    assert lines == {"test_top": 3, "test_method": 7}
+
+
 def test_pytest_keywords(tmp_path: Path) -> None:
     f = tmp_path / "test_auth.py"
     f.write_text("def test_user_login():\n    assert True\n")
@@ -40,6 +53,13 @@ def test_pytest_keywords(tmp_path: Path) -> None:
     assert "login" in suite.test_cases[0].keywords
 
 
+def test_pytest_keywords_overlapping(tmp_path: Path) -> None:
+    f = tmp_path / "test_org.py"
+    f.write_text("def test_organization_update():\n    assert True\n")
+    suite = parse_pytest_file(f)
+    assert suite.test_cases[0].keywords == ["org", "organization", "update"]
+
+
 def test_pytest_async(tmp_path: Path) -> None:
     f = tmp_path / "test_async.py"
     f.write_text("async def test_async_handler():\n    assert True\n")
@@ -74,3 +94,19 @@ def test_empty_test_file(tmp_path: Path) -> None:
     f.write_text("# empty test file\n")
     suite = parse_pytest_file(f)
     assert len(suite.test_cases) == 0
+
+
+def test_vitest_parent_describe_scoping(tmp_path: Path) -> None:
+    f = tmp_path / "scope.test.ts"
+    f.write_text(
+        "describe('Outer', () => {\n"
+        "  describe('Inner', () => {\n"
+        "    it('inner case', () => {})\n"
+        "  })\n"
+        "  it('outer case', () => {})\n"
+        "})\n"
+        "test('top level', () => {})\n"
+    )
+    suite = parse_vitest_file(f)
+    parents = {tc.name: tc.class_name for tc in suite.test_cases}
+    assert parents == {"inner case": "Inner", "outer case": "Outer", "top level": None}
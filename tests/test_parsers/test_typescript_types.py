@@ -83,3 +83,23 @@ def test_parse_empty_file(tmp_path: Path) -> None:
     f.write_text("// no interfaces here\n")
     interfaces = parse_typescript_file(f)
     assert interfaces == []
+
+
+def test_parse_non_ascii_field_names(tmp_path: Path) -> None:
+    f = tmp_path / "types.ts"
+    f.write_text(
+        "export interface Persona {\n  año: number;\n  nombre: string;\n}\n",
+        encoding="utf-8",
+    )
+    interfaces = parse_typescript_file(f)
+    assert [field.name for field in interfaces[0].fields] == ["año", "nombre"]
+
+
+def test_parse_unindented_fields(tmp_path: Path) -> None:
+    f = tmp_path / "types.ts"
+    f.write_text("interface Flat {\nid: number;\n  name: string;\n\nemail?: string;\n}\n")
+    interfaces = parse_typescript_file(f)
+    fields = {field.name: field for field in interfaces[0].fields}
+    assert list(fields) == ["id", "name", "email"]
+    assert fields["id"].type_str == "number"
+    assert fields["email"].optional
@@ -4,7 +4,7 @@ from __future__ import annotations
 
 from pathlib import Path
 
-from mattstack.parsers.zod_schemas import parse_zod_file
+from mattstack.parsers.zod_schemas import find_zod_files, parse_zod_file
 
 
 def test_simple_schema(tmp_path: Path) -> None:
@@ -95,3 +95,21 @@ def test_empty_file(tmp_path: Path) -> None:
     f.write_text("// no schemas here\n")
     schemas = parse_zod_file(f)
     assert len(schemas) == 0
+
+
+def test_find_zod_files_skips_shared_skip_dirs(tmp_path: Path) -> None:
+    for skip in (".venv", ".next", "node_modules"):
+        (tmp_path / skip).mkdir()
+        (tmp_path / skip / "schemas.ts").write_text("")
+    (tmp_path / "schemas.ts").write_text("")
+    assert find_zod_files(tmp_path) == [tmp_path / "schemas.ts"]
+
+
+def test_non_ascii_field_names(tmp_path: Path) -> None:
+    f = tmp_path / "schema.ts"
+    f.write_text(
+        "export const personaSchema = z.object({\n  año: z.number(),\n  nombre: z.string(),\n});\n",
+        encoding="utf-8",
+    )
+    schemas = parse_zod_file(f)
+    assert [field.name for field in schemas[0].fields] == ["año", "nombre"]
@@ -126,6 +126,19 @@ def test_customize_backend_updates_python_package_name(tmp_path: Path) -> None:
     assert 'name = "test_proj_backend"' in content
 
 
+def test_customize_backend_renamed_pyproject_is_not_rewritten(tmp_path: Path) -> None:
+    config = _make_config(tmp_path)
+    config.backend_dir.mkdir(parents=True)
+
+    pyproject = config.backend_dir / "pyproject.toml"
+    pyproject.write_text('[project]\nname = "test-proj-backend"\n')
+    mtime = pyproject.stat().st_mtime_ns
+
+    customize_backend(config)
+
+    assert pyproject.stat().st_mtime_ns == mtime
+
+
 def test_customize_backend_no_pyproject_is_noop(tmp_path: Path) -> None:
     config = _make_config(tmp_path)
     config.backend_dir.mkdir(parents=True)
@@ -168,3 +181,16 @@ def test_customize_frontend_no_package_json_is_noop(tmp_path: Path) -> None:
     config.frontend_dir.mkdir(parents=True)
     # Should not raise when package.json doesn't exist
     customize_frontend(config)
+
+
+def test_customize_frontend_already_named_is_not_rewritten(tmp_path: Path) -> None:
+    config = _make_config(tmp_path)
+    config.frontend_dir.mkdir(parents=True)
+
+    package_json = config.frontend_dir / "package.json"
+    original = '{"name": "test-proj-frontend", "version": "0.1.0"}'
+    package_json.write_text(original)
+
+    customize_frontend(config)
+
+    assert package_json.read_text() == original
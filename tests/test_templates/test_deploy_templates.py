@@ -105,6 +105,13 @@ def test_railway_json_is_valid_json(railway_fullstack_config: ProjectConfig) ->
     assert "$schema" in data
 
 
+def test_railway_json_frontend_only(tmp_path: Path) -> None:
+    config = ProjectConfig(name="my-web", path=tmp_path, project_type=ProjectType.FRONTEND_ONLY)
+    data = json.loads(generate_railway_json(config))
+    assert data["build"]["buildCommand"] == "bun install && bun run build"
+    assert data["deploy"] == {"startCommand": "bun run preview --host --port $PORT"}
+
+
 # --- Railway TOML tests ---
 
 
@@ -314,3 +321,25 @@ class TestDigitalOcean:
         content = generate_do_app_spec(config)
         assert "my-fe-frontend" in content
         assert "databases:" not in content
+
+
+# --- Render cache ---
+
+
+def test_cached_render_reuses_equal_configs(railway_fullstack_config: ProjectConfig) -> None:
+    first = generate_do_app_spec(railway_fullstack_config)
+    again = ProjectConfig(
+        name="my-app",
+        path=railway_fullstack_config.path,
+        project_type=ProjectType.FULLSTACK,
+        variant=Variant.STARTER,
+        deployment=DeploymentTarget.RAILWAY,
+    )
+    assert generate_do_app_spec(again) is first
+
+
+def test_cached_render_sees_config_changes(railway_fullstack_config: ProjectConfig) -> None:
+    assert "REDIS_URL" in generate_do_app_spec(railway_fullstack_config)
+    railway_fullstack_config.use_celery = False
+    railway_fullstack_config.use_redis = False
+    assert "REDIS_URL" not in generate_do_app_spec(railway_fullstack_config)
@@ -136,6 +136,25 @@ def test_ecs_task_definition_backend_only(aws_backend_config: ProjectConfig) ->
     assert data["containerDefinitions"][0]["name"] == "my-api-api"
 
 
+def test_ecs_task_definition_frontend_only(fly_frontend_config: ProjectConfig) -> None:
+    from mattstack.templates.deploy_aws import generate_ecs_task_definition
+
+    data = json.loads(generate_ecs_task_definition(fly_frontend_config))
+    assert data["executionRoleArn"] == "arn:aws:iam::role/my-frontend-execution-role"
+    (container,) = data["containerDefinitions"]
+    assert container["name"] == "my-frontend-frontend"
+    assert "healthCheck" not in container
+
+
+def test_ecs_task_definition_uses_python_package_name(tmp_path: Path) -> None:
+    from mattstack.templates.deploy_aws import generate_ecs_task_definition
+
+    config = ProjectConfig(name="my-app", path=tmp_path, project_type=ProjectType.BACKEND_ONLY)
+    container = json.loads(generate_ecs_task_definition(config))["containerDefinitions"][0]
+    env = {e["name"]: e["value"] for e in container["environment"]}
+    assert env["DJANGO_SETTINGS_MODULE"] == "my_app.settings"
+
+
 def test_copilot_manifest(aws_config: ProjectConfig) -> None:
     from mattstack.templates.deploy_aws import generate_copilot_manifest
 
@@ -243,3 +262,51 @@ def test_deployment_target_new_values() -> None:
     assert DeploymentTarget.SELF_HOSTED == "self-hosted"
     assert DeploymentTarget.CLOUDFLARE == "cloudflare"
     assert DeploymentTarget.DIGITAL_OCEAN == "digital-ocean"
+
+
+# --- generate_deploy_files ---
+
+
+def test_deploy_files_self_hosted(self_hosted_config: ProjectConfig) -> None:
+    from mattstack.templates.deploy import generate_deploy_files
+    from mattstack.templates.deploy_self_hosted import generate_systemd_service
+
+    files = dict(generate_deploy_files(self_hosted_config))
+    assert list(files) == ["docker-compose.prod.yml", "nginx.conf", "my-app.service"]
+    assert files["my-app.service"] == generate_systemd_service(self_hosted_config)
+
+
+def test_deploy_files_unsupported_target(self_hosted_config: ProjectConfig) -> None:
+    from mattstack.templates.deploy import generate_deploy_files
+
+    assert generate_deploy_files(self_hosted_config, {DeploymentTarget.FLY_IO}) == []
+
+
+def test_deploy_files_docker_has_none(tmp_path: Path) -> None:
+    from mattstack.templates.deploy import generate_deploy_files
+
+    config = ProjectConfig(
+        name="my-app",
+        path=tmp_path / "my-app",
+        project_type=ProjectType.FULLSTACK,
+        variant=Variant.STARTER,
+        deployment=DeploymentTarget.DOCKER,
+    )
+    assert generate_deploy_files(config) == []
+
+
+def test_deploy_files_cover_every_target() -> None:
+    from mattstack.templates.deploy import DEPLOY_FILES
+
+    assert set(DEPLOY_FILES) == set(DeploymentTarget) - {DeploymentTarget.DOCKER}
+
+
+def test_deploy_files_generators_resolve() -> None:
+    import importlib
+
+    from mattstack.templates.deploy import DEPLOY_FILES
+
+    for module_name, files in DEPLOY_FILES.values():
+        module = importlib.import_module(f"mattstack.templates.{module_name}")
+        for _, generate in files:
+            assert callable(getattr(module, generate))
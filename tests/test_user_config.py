@@ -42,6 +42,38 @@ def test_load_non_dict_yaml(tmp_path: Path) -> None:
         assert load_user_config() == {}
 
 
+def test_load_reuses_parse_until_file_changes(tmp_path: Path) -> None:
+    from mattstack.utils import yaml_loader
+
+    config_file = tmp_path / "config.yaml"
+    config_file.write_text("defaults:\n  deployment: railway\n")
+    with (
+        patch("mattstack.user_config.USER_CONFIG_PATH", config_file),
+        patch("mattstack.user_config.safe_load", wraps=yaml_loader.safe_load) as safe_load,
+    ):
+        assert load_user_config()["defaults"]["deployment"] == "railway"
+        assert get_user_defaults()["deployment"] == "railway"
+        assert safe_load.call_count == 1
+
+        config_file.write_text("defaults:\n  deployment: fly-io\n")
+        assert load_user_config()["defaults"]["deployment"] == "fly-io"
+        assert safe_load.call_count == 2
+
+
+def test_init_user_config_invalidates_cache(tmp_path: Path) -> None:
+    config_dir = tmp_path / ".mattstack"
+    config_file = config_dir / "config.yaml"
+    config_dir.mkdir()
+    config_file.write_text("repos:\n  my-repo: https://example.com/repo.git\n")
+    with (
+        patch("mattstack.user_config.USER_CONFIG_DIR", config_dir),
+        patch("mattstack.user_config.USER_CONFIG_PATH", config_file),
+    ):
+        assert load_user_config() != {}
+        init_user_config()
+        assert load_user_config() == {}
+
+
 def test_get_user_repos(tmp_path: Path) -> None:
     config_file = tmp_path / "config.yaml"
     config_file.write_text(
@@ -2,71 +2,104 @@
 
 from __future__ import annotations
 
+import json
 import subprocess
 from unittest.mock import patch
 
-from mattstack.utils.docker import docker_available, docker_compose_available, docker_running
+import pytest
+
+from mattstack.utils.docker import (
+    _docker_status,
+    docker_available,
+    docker_compose_available,
+    docker_running,
+)
+from mattstack.utils.process import command_available
+
+
+@pytest.fixture(autouse=True)
+def _clear_caches() -> None:
+    command_available.cache_clear()
+    _docker_status.cache_clear()
+
+
+def _info(returncode: int = 0, **info: object) -> subprocess.CompletedProcess[str]:
+    return subprocess.CompletedProcess(args=[], returncode=returncode, stdout=json.dumps(info))
+
+
+_COMPOSE_PLUGINS = {"Plugins": [{"Name": "buildx"}, {"Name": "compose"}]}
+
 
 # --- docker_available ---
 
 
-@patch("mattstack.utils.docker.shutil.which", return_value="/usr/local/bin/docker")
+@patch("mattstack.utils.process.shutil.which", return_value="/usr/local/bin/docker")
 def test_docker_available_found(mock_which) -> None:
     assert docker_available() is True
     mock_which.assert_called_once_with("docker")
 
 
-@patch("mattstack.utils.docker.shutil.which", return_value=None)
+@patch("mattstack.utils.process.shutil.which", return_value=None)
 def test_docker_available_not_found(mock_which) -> None:
     assert docker_available() is False
     mock_which.assert_called_once_with("docker")
 
 
-# --- docker_compose_available ---
+# --- docker_compose_available / docker_running ---
 
 
 @patch("mattstack.utils.docker.subprocess.run")
-def test_docker_compose_available_success(mock_run) -> None:
-    mock_run.return_value = subprocess.CompletedProcess(args=[], returncode=0)
+def test_docker_status_single_probe(mock_run) -> None:
+    mock_run.return_value = _info(ServerVersion="27.0.1", ClientInfo=_COMPOSE_PLUGINS)
     assert docker_compose_available() is True
+    assert docker_running() is True
     mock_run.assert_called_once_with(
-        ["docker", "compose", "version"],
-        check=True,
+        ["docker", "info", "--format", "{{json .}}"],
         capture_output=True,
         text=True,
+        timeout=5,
     )
 
 
-@patch("mattstack.utils.docker.subprocess.run", side_effect=subprocess.CalledProcessError(1, ""))
-def test_docker_compose_available_called_process_error(mock_run) -> None:
-    assert docker_compose_available() is False
+@patch("mattstack.utils.docker.subprocess.run")
+def test_docker_daemon_down_compose_installed(mock_run) -> None:
+    mock_run.return_value = _info(
+        returncode=1,
+        ServerErrors=["Cannot connect to the Docker daemon"],
+        ClientInfo=_COMPOSE_PLUGINS,
+    )
+    assert docker_running() is False
+    assert docker_compose_available() is True
 
 
-@patch("mattstack.utils.docker.subprocess.run", side_effect=FileNotFoundError)
-def test_docker_compose_available_file_not_found(mock_run) -> None:
+@patch("mattstack.utils.docker.subprocess.run")
+def test_docker_compose_plugin_missing(mock_run) -> None:
+    mock_run.return_value = _info(ServerVersion="27.0.1", ClientInfo={"Plugins": []})
     assert docker_compose_available() is False
-
-
-# --- docker_running ---
+    assert docker_running() is True
 
 
 @patch("mattstack.utils.docker.subprocess.run")
-def test_docker_running_success(mock_run) -> None:
-    mock_run.return_value = subprocess.CompletedProcess(args=[], returncode=0)
-    assert docker_running() is True
-    mock_run.assert_called_once_with(
-        ["docker", "info"],
-        check=True,
-        capture_output=True,
-        text=True,
-    )
+def test_docker_old_client_falls_back_to_compose_version(mock_run) -> None:
+    mock_run.side_effect = [
+        subprocess.CompletedProcess(args=[], returncode=1, stdout=""),
+        subprocess.CompletedProcess(args=[], returncode=0),
+    ]
+    assert docker_compose_available() is True
+    assert docker_running() is False
+    assert mock_run.call_args_list[1].args[0] == ["docker", "compose", "version"]
 
 
-@patch("mattstack.utils.docker.subprocess.run", side_effect=subprocess.CalledProcessError(1, ""))
-def test_docker_running_called_process_error(mock_run) -> None:
+@patch("mattstack.utils.docker.subprocess.run", side_effect=FileNotFoundError)
+def test_docker_status_file_not_found(mock_run) -> None:
+    assert docker_compose_available() is False
     assert docker_running() is False
 
 
-@patch("mattstack.utils.docker.subprocess.run", side_effect=FileNotFoundError)
-def test_docker_running_file_not_found(mock_run) -> None:
+@patch(
+    "mattstack.utils.docker.subprocess.run",
+    side_effect=subprocess.TimeoutExpired(["docker", "info"], 5),
+)
+def test_docker_status_timeout(mock_run) -> None:
     assert docker_running() is False
+    assert docker_compose_available() is False
@@ -0,0 +1,48 @@
+"""Tests for git utility functions."""
+
+from __future__ import annotations
+
+import subprocess
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from mattstack.utils.git import clone_repo, create_initial_commit, init_repo
+
+
+@pytest.fixture(autouse=True)
+def _git_identity(monkeypatch: pytest.MonkeyPatch) -> None:
+    for var in ("GIT_AUTHOR", "GIT_COMMITTER"):
+        monkeypatch.setenv(f"{var}_NAME", "Test")
+        monkeypatch.setenv(f"{var}_EMAIL", "test@example.com")
+
+
+def test_init_and_initial_commit(tmp_path: Path) -> None:
+    (tmp_path / "README.md").write_text("# test\n")
+    assert init_repo(tmp_path) is True
+    assert create_initial_commit(tmp_path, "first") is True
+    log = subprocess.run(
+        ["git", "log", "--format=%s"], cwd=tmp_path, capture_output=True, text=True, check=True
+    )
+    assert log.stdout.strip() == "first"
+
+
+def test_clone_failure_reports_stderr(tmp_path: Path) -> None:
+    with patch("mattstack.utils.git.print_error") as mock_error:
+        assert clone_repo(str(tmp_path / "missing"), tmp_path / "dest") is False
+    message = mock_error.call_args.args[0]
+    assert message.startswith("Failed to clone")
+    assert "missing" in message
+
+
+@pytest.mark.parametrize(("verbose", "stdout"), [(False, subprocess.DEVNULL), (True, None)])
+def test_git_stdout_is_not_captured(verbose: bool, stdout: int | None, tmp_path: Path) -> None:
+    with (
+        patch("mattstack.utils.git.is_verbose", return_value=verbose),
+        patch("mattstack.utils.git.subprocess.run") as mock_run,
+    ):
+        assert init_repo(tmp_path) is True
+    kwargs = mock_run.call_args.kwargs
+    assert kwargs["stdout"] is stdout
+    assert kwargs["stderr"] is subprocess.PIPE
@@ -0,0 +1,69 @@
+"""Tests for subprocess execution utilities."""
+
+from __future__ import annotations
+
+import socket
+import subprocess
+from unittest.mock import patch
+
+import pytest
+
+from mattstack.utils.process import (
+    _command_version,
+    check_port_available,
+    command_available,
+    get_command_version,
+)
+
+
+@pytest.fixture(autouse=True)
+def _clear_caches() -> None:
+    command_available.cache_clear()
+    _command_version.cache_clear()
+
+
+@patch("mattstack.utils.process.shutil.which", return_value="/usr/bin/git")
+def test_command_available_is_cached(mock_which) -> None:
+    assert command_available("git") is True
+    assert command_available("git") is True
+    mock_which.assert_called_once_with("git")
+
+
+@patch("mattstack.utils.process.subprocess.run")
+def test_get_command_version_is_cached(mock_run) -> None:
+    mock_run.return_value = subprocess.CompletedProcess(args=[], returncode=0, stdout="git 2.0\n")
+    assert get_command_version("git") == "git 2.0"
+    assert get_command_version("git", ["git", "--version"]) == "git 2.0"
+    mock_run.assert_called_once()
+
+
+@patch("mattstack.utils.process.subprocess.run", side_effect=FileNotFoundError)
+def test_get_command_version_missing(mock_run) -> None:
+    assert get_command_version("nope") is None
+
+
+def test_check_port_available_listening() -> None:
+    with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as server:
+        server.bind(("127.0.0.1", 0))
+        server.listen()
+        assert check_port_available(server.getsockname()[1]) is False
+
+
+def test_check_port_available_after_server_closes() -> None:
+    with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as server:
+        server.bind(("127.0.0.1", 0))
+        server.listen()
+        port = server.getsockname()[1]
+    assert check_port_available(port) is True
+
+
+@pytest.mark.skipif(not socket.has_ipv6, reason="IPv6 not supported")
+def test_check_port_available_ipv6_listener() -> None:
+    try:
+        server = socket.socket(socket.AF_INET6, socket.SOCK_STREAM)
+        server.bind(("::1", 0))
+    except OSError:
+        pytest.skip("IPv6 loopback unavailable")
+    with server:
+        server.listen()
+        assert check_port_available(server.getsockname()[1]) is False
@@ -0,0 +1,27 @@
+"""Tests for the shared YAML loader."""
+
+from __future__ import annotations
+
+import pytest
+import yaml
+
+from mattstack.utils.yaml_loader import safe_load
+
+
+def test_safe_load_matches_pyyaml() -> None:
+    text = "name: app\nbackend:\n  celery: false\nports: [8000, 3000]\n"
+    assert safe_load(text) == yaml.safe_load(text)
+
+
+def test_safe_load_accepts_bytes() -> None:
+    assert safe_load(b"name: app\n") == {"name": "app"}
+
+
+def test_safe_load_rejects_python_tags() -> None:
+    with pytest.raises(yaml.YAMLError):
+        safe_load("!!python/object/apply:os.system ['true']\n")
+
+
+def test_safe_load_invalid_yaml() -> None:
+    with pytest.raises(yaml.YAMLError):
+        safe_load(":\n  invalid: [yaml\n")